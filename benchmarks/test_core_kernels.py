@@ -0,0 +1,71 @@
+#  test_core_kernels.py (c) 2016 Mattias Fredriksson
+#
+# ##### BEGIN GPL LICENSE BLOCK #####
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+# ##### END GPL LICENSE BLOCK #####
+
+#Headless benchmarks of the numpy kernels in projection_ops/core, only numpy and pytest-benchmark are required:
+#python -m pytest benchmarks/test_core_kernels.py --benchmark-group-by=group
+
+import numpy as np
+import pytest
+
+pytest.importorskip('pytest_benchmark')
+from mesh_data import plane_grid
+from projection_ops.core.uv_grid import UVGrid, TiledUVGrid
+from projection_ops.core.seams import SeamTable
+
+#Target plane with 2 * GRID^2 triangles and the number of traced points
+GRID = 128
+POINTS = 200000
+
+@pytest.fixture(scope = 'module')
+def target() :
+	(vert_co, vert_no, tri_vert, tri_uv, face_no) = plane_grid(GRID)
+	return (tri_vert, tri_uv, UVGrid.from_tri_uv(tri_uv, 2))
+
+@pytest.fixture(scope = 'module')
+def points() :
+	#Points covering the uv square and a margin outside it
+	return np.random.RandomState(0).random_sample((POINTS, 2)) * 1.1 - 0.05
+
+@pytest.mark.benchmark(group = 'build')
+@pytest.mark.parametrize('occupancy', [None, 2])
+def test_grid_from_tri_uv(benchmark, target, occupancy) :
+	(tri_vert, tri_uv, grid) = target
+	benchmark(UVGrid.from_tri_uv, tri_uv, 2, 0.00001, occupancy)
+
+@pytest.mark.benchmark(group = 'build')
+def test_tile_faces(benchmark, target) :
+	(tri_vert, tri_uv, grid) = target
+	benchmark(TiledUVGrid.tile_faces, tri_uv)
+
+@pytest.mark.benchmark(group = 'build')
+def test_seam_table(benchmark, target) :
+	(tri_vert, tri_uv, grid) = target
+	benchmark(SeamTable.from_triangles, tri_vert, tri_uv)
+
+@pytest.mark.benchmark(group = 'trace')
+def test_trace_points_uv(benchmark, target, points) :
+	(tri_vert, tri_uv, grid) = target
+	benchmark(grid.trace_points_uv, points)
+
+@pytest.mark.benchmark(group = 'trace')
+def test_trace_close_points_uv(benchmark, target, points) :
+	(tri_vert, tri_uv, grid) = target
+	#Only the points missing the uv map are traced to the closest face during projection
+	miss = points[~grid.trace_points_uv(points)[0]]
+	benchmark(grid.trace_close_points_uv, miss)
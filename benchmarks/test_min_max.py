@@ -0,0 +1,79 @@
+#  test_min_max.py (c) 2016 Mattias Fredriksson
+#
+# ##### BEGIN GPL LICENSE BLOCK #####
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+# ##### END GPL LICENSE BLOCK #####
+
+#Timing of the bounds kernels: findMinMaxArray and triMinMaxArray against the per-vertex mathutils loops they replaced,
+#run with: python -m pytest benchmarks/test_min_max.py --benchmark-group-by=group
+
+import numpy as np
+import pytest
+
+pytest.importorskip('pytest_benchmark')
+pytest.importorskip('mathutils')
+from mathutils import Vector
+from projection_ops.core.tri import minMaxArray, triMinMaxArray
+from projection_ops.funcs_math import findMinMaxArray
+
+#Number of vertices and uv triangles, the scalar loops run on a tenth of the input
+VERTS = 1000000
+TRIS = 1000000
+SCALAR_FRACTION = 10
+
+@pytest.fixture(scope = 'module')
+def co() :
+	return np.random.RandomState(0).random_sample((VERTS, 3)).astype(np.float32)
+
+@pytest.fixture(scope = 'module')
+def tri_uv() :
+	return np.random.RandomState(1).random_sample((TRIS, 3, 2))
+
+def min_max_scalar(vectors) :
+	#Per-vertex loop of the earlier findMinMax, allocating a vector for each minVec/maxVec call
+	vMin = Vector(vectors[0])
+	vMax = Vector(vectors[0])
+	for v in vectors :
+		vMin = Vector(map(min, vMin, v))
+		vMax = Vector(map(max, vMax, v))
+	return (vMin, vMax)
+
+@pytest.mark.benchmark(group = 'findMinMax')
+def test_find_min_max_array(benchmark, co) :
+	(vMin, vMax) = benchmark(findMinMaxArray, co)
+	assert np.allclose(vMin, co.min(axis = 0)) and np.allclose(vMax, co.max(axis = 0))
+
+@pytest.mark.benchmark(group = 'findMinMax')
+def test_find_min_max_scalar(benchmark, co) :
+	vectors = [Vector(v) for v in co[:VERTS // SCALAR_FRACTION]]
+	(vMin, vMax) = benchmark(min_max_scalar, vectors)
+	assert np.allclose(vMin, minMaxArray(co[:VERTS // SCALAR_FRACTION])[0])
+
+@pytest.mark.benchmark(group = 'triMinMax')
+def test_tri_min_max_array(benchmark, tri_uv) :
+	(vMin, vMax) = benchmark(triMinMaxArray, tri_uv)
+	assert np.array_equal(vMin, tri_uv.min(axis = 1)) and np.array_equal(vMax, tri_uv.max(axis = 1))
+
+@pytest.mark.benchmark(group = 'triMinMax')
+def test_tri_min_max_reduce(benchmark, tri_uv) :
+	#Reduction over the short corner axis, replaced by the element wise corner comparison
+	benchmark(lambda : (tri_uv.min(axis = 1), tri_uv.max(axis = 1)))
+
+@pytest.mark.benchmark(group = 'triMinMax')
+def test_tri_min_max_scalar(benchmark, tri_uv) :
+	tris = [[Vector(p) for p in t] for t in tri_uv[:TRIS // SCALAR_FRACTION]]
+	#Earlier minVec_x3/maxVec_x3 for each triangle
+	benchmark(lambda : [(Vector(map(min, *t)), Vector(map(max, *t))) for t in tris])
@@ -0,0 +1,39 @@
+#  test_projection_threads.py (c) 2016 Mattias Fredriksson
+#
+# ##### BEGIN GPL LICENSE BLOCK #####
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+# ##### END GPL LICENSE BLOCK #####
+
+#Thread-count scaling of the source projection, run with: python -m pytest benchmarks/test_projection_threads.py
+#Sources are projected in parallel by ProjectionData.projectSources(), compare the mean time for each worker count.
+
+import pytest
+
+from headless_projection import projection_data, setting
+
+pytest.importorskip('pytest_benchmark')
+
+#Number of source meshes and vertices in each source
+SOURCES = 8
+SOURCE_VERTS = 200000
+
+@pytest.mark.parametrize('workers', [1, 2, 4, 8])
+def test_project_sources(benchmark, blender, workers) :
+	proj_data = blender.module('proj_data')
+	data = projection_data(proj_data, SOURCES, SOURCE_VERTS, 128)
+	results = benchmark(data.projectSources, setting(proj_data), workers)
+	assert len(results) == SOURCES
+	assert all([count_partial == SOURCE_VERTS for (co, select, count_partial) in results])
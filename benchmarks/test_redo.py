@@ -0,0 +1,67 @@
+#  test_redo.py (c) 2016 Mattias Fredriksson
+#
+# ##### BEGIN GPL LICENSE BLOCK #####
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+# ##### END GPL LICENSE BLOCK #####
+
+#Timing of the uv projection redo (Move/Rotate/Scale changed in the redo panel) on a 100k vertex decal, the target budget is 50 ms.
+#The uv lookup applies Bounds.uv_matrix() to the precomputed source coordinates, compared with the per vertex calcUVPoint it replaced.
+#Run with: python -m pytest benchmarks/test_redo.py --benchmark-group-by=group
+
+import numpy as np
+import pytest
+
+from mathutils import Vector
+from headless_projection import projection_data, setting
+
+pytest.importorskip('pytest_benchmark')
+
+#Decal vertex count and target plane partitions (2 * TARGET^2 triangles), the scalar loop runs on a tenth of the vertices
+DECAL_VERTS = 100000
+TARGET = 128
+SCALAR_FRACTION = 10
+
+def redo_setting(proj_data) :
+	return setting(proj_data, moveXY = (0.01, -0.02), rotation = 5, scalar = (0.9, 0.9, 1))
+
+@pytest.mark.benchmark(group = 'redo uv')
+def test_uv_matrix(benchmark, blender) :
+	proj_data = blender.module('proj_data')
+	data = projection_data(proj_data, 1, DECAL_VERTS, TARGET)
+	meshData = data.meshList[0]
+	def uv_lookup() :
+		bounds = data.transformBounds(meshData.bounds, redo_setting(proj_data))
+		mat = np.array(bounds.uv_matrix())
+		return meshData.co @ mat[:3,:3].T + mat[:3,3]
+	assert benchmark(uv_lookup).shape == (DECAL_VERTS, 3)
+
+@pytest.mark.benchmark(group = 'redo uv')
+def test_calc_uv_point_scalar(benchmark, blender) :
+	proj_data = blender.module('proj_data')
+	data = projection_data(proj_data, 1, DECAL_VERTS // SCALAR_FRACTION, TARGET)
+	meshData = data.meshList[0]
+	def uv_lookup() :
+		bounds = data.transformBounds(meshData.bounds, redo_setting(proj_data))
+		return [bounds.calcUVPoint(Vector(co)) for co in meshData.co]
+	assert len(benchmark(uv_lookup)) == DECAL_VERTS // SCALAR_FRACTION
+
+@pytest.mark.benchmark(group = 'redo')
+def test_redo_project(benchmark, blender) :
+	#Full projection stage of a redo, excluding the write into the blender mesh
+	proj_data = blender.module('proj_data')
+	data = projection_data(proj_data, 1, DECAL_VERTS, TARGET)
+	results = benchmark(data.projectSources, redo_setting(proj_data))
+	assert len(results[0][0]) == DECAL_VERTS
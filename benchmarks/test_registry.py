@@ -0,0 +1,108 @@
+#  test_registry.py (c) 2016 Mattias Fredriksson
+#
+# ##### BEGIN GPL LICENSE BLOCK #####
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+# ##### END GPL LICENSE BLOCK #####
+
+#Timing of the add-on enable/disable (register() followed by unregister()) in a build with many registered types,
+#the registry of registered classes against the dir(bpy.types) scan of the earlier op_exist/get_op lookup.
+#Run with: python -m pytest benchmarks/test_registry.py --benchmark-group-by=group
+
+import types, importlib
+import pytest
+
+from blender_stand_ins import Utils
+
+pytest.importorskip('pytest_benchmark')
+
+class StudioUtils(Utils) :
+	"""
+	Stand-in of bpy.utils exposing the registered classes in bpy.types and the operators in bpy.ops, like blender.
+	"""
+	def __init__(self, bpy) :
+		Utils.__init__(self)
+		self.bpy = bpy
+	def register_class(self, cls) :
+		Utils.register_class(self, cls)
+		setattr(self.bpy.types, cls.__name__, cls)
+		(op_type, delim, op_name) = cls.bl_idname.rpartition('.')
+		if not hasattr(self.bpy.ops, op_type) :
+			setattr(self.bpy.ops, op_type, types.SimpleNamespace())
+		setattr(getattr(self.bpy.ops, op_type), op_name, cls)
+	def unregister_class(self, cls) :
+		Utils.unregister_class(self, cls)
+		delattr(self.bpy.types, cls.__name__)
+		(op_type, delim, op_name) = cls.bl_idname.rpartition('.')
+		delattr(getattr(self.bpy.ops, op_type), op_name)
+
+def studio_build(blender, type_count) :
+	"""
+	Populate the stand-in bpy.types with the types registered by blender and other add-ons.
+	"""
+	bpy = blender.bpy()
+	bpy.ops = types.SimpleNamespace()
+	bpy.utils = StudioUtils(bpy)
+	for i in range(type_count) :
+		#Types registered by other add-ons, operators have a bl_idname
+		attributes = {'bl_idname' : 'addon.operator_%d' % i} if i % 2 else {}
+		setattr(bpy.types, 'ADDON_OT_type_%d' % i, type('ADDON_OT_type_%d' % i, (), attributes))
+	return (bpy, importlib.import_module('projection_ops'))
+
+def op_exist(bpy, op_id) :
+	#Earlier lookup: dir() of the bpy.ops submodule for each operator
+	(op_type, delim, op_name) = op_id.rpartition('.')
+	if op_type == '' :
+		return op_name in dir(bpy.ops)
+	return op_name in dir(getattr(bpy.ops, op_type))
+
+def get_op(bpy, op_id) :
+	#Earlier lookup: getattr and bl_idname probe of every type in bpy.types
+	for type_str in dir(bpy.types) :
+		try :
+			RNAMeta = getattr(bpy.types, type_str)
+			if RNAMeta.bl_idname == op_id :
+				return RNAMeta
+		except :
+			pass
+	return None
+
+def unregister_scan(bpy, package) :
+	#Earlier unregister(), finding the registered classes by scanning the types
+	for op in package.operators :
+		if op_exist(bpy, op.bl_idname) :
+			bpy.utils.unregister_class(get_op(bpy, op.bl_idname))
+
+#Types in a plain blender build (about 2500) and a studio build with many add-ons enabled
+@pytest.mark.parametrize('type_count', [2500, 10000])
+@pytest.mark.benchmark(group = 'enable/disable')
+def test_enable_disable_registry(benchmark, blender, type_count) :
+	(bpy, package) = studio_build(blender, type_count)
+	def enable_disable() :
+		package.register()
+		package.unregister()
+	benchmark(enable_disable)
+	assert bpy.utils.registered == []
+
+@pytest.mark.parametrize('type_count', [2500, 10000])
+@pytest.mark.benchmark(group = 'enable/disable')
+def test_enable_disable_scan(benchmark, blender, type_count) :
+	(bpy, package) = studio_build(blender, type_count)
+	def enable_disable() :
+		for op in package.operators :
+			bpy.utils.register_class(op)
+		unregister_scan(bpy, package)
+	benchmark(enable_disable)
+	assert bpy.utils.registered == []
@@ -0,0 +1,90 @@
+#  test_startup.py (c) 2016 Mattias Fredriksson
+#
+# ##### BEGIN GPL LICENSE BLOCK #####
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+# ##### END GPL LICENSE BLOCK #####
+
+#Timing of the add-on enable: importing the package and register(), with the operator stubs of lazy_ops against importing
+#every package module up front like the earlier load_modules(). Each round imports a fresh copy of the package.
+#Run with: python -m pytest benchmarks/test_startup.py --benchmark-group-by=group
+
+import os, sys, subprocess, importlib
+import pytest
+
+from blender_stand_ins import unload_package
+
+pytest.importorskip('pytest_benchmark')
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+ROUNDS = 20
+
+def enable(eager) :
+	package = importlib.import_module('projection_ops')
+	if eager :
+		#Earlier load_modules(): every module of the package directory
+		for name in package.__all__ :
+			importlib.import_module('projection_ops.' + name)
+	package.register()
+	return package
+
+def run_enable(benchmark, eager) :
+	#Packages of the rounds are unregistered after the timing, each round imports new operator classes
+	packages = []
+	benchmark.pedantic(lambda : packages.append(enable(eager)), setup = unload_package, rounds = ROUNDS)
+	for package in packages :
+		package.unregister()
+
+#Modules already imported by the test process (numpy, mathutils) are shared between the rounds
+@pytest.mark.benchmark(group = 'enable')
+def test_enable_stubs(benchmark, blender) :
+	run_enable(benchmark, False)
+	assert 'projection_ops.proj_data' not in sys.modules
+	assert blender.bpy().utils.registered == []
+
+@pytest.mark.benchmark(group = 'enable')
+def test_enable_eager(benchmark, blender) :
+	run_enable(benchmark, True)
+	assert 'projection_ops.proj_data' in sys.modules
+
+#Blender starting with the add-on enabled: a new interpreter importing the package against the stand-ins
+ENABLE_SCRIPT = """
+import sys, importlib
+sys.path[:0] = [%r, %r]
+from blender_stand_ins import StandIns
+StandIns().install()
+package = importlib.import_module('projection_ops')
+if %r :
+	for name in package.__all__ :
+		importlib.import_module('projection_ops.' + name)
+package.register()
+"""
+
+def start_process(eager) :
+	subprocess.check_call([sys.executable, '-c', ENABLE_SCRIPT % (ROOT, os.path.join(ROOT, 'tests'), eager)])
+
+@pytest.mark.benchmark(group = 'enable (new process)')
+def test_start_stubs(benchmark) :
+	benchmark.pedantic(start_process, (False,), rounds = ROUNDS // 2)
+
+@pytest.mark.benchmark(group = 'enable (new process)')
+def test_start_eager(benchmark) :
+	benchmark.pedantic(start_process, (True,), rounds = ROUNDS // 2)
+
+#Interpreter start and the stand-in setup, subtracted from the new process timings
+@pytest.mark.benchmark(group = 'enable (new process)')
+def test_start_baseline(benchmark) :
+	script = "import sys\nsys.path[:0] = [%r, %r]\nfrom blender_stand_ins import StandIns\nStandIns().install()\n" % (ROOT, os.path.join(ROOT, 'tests'))
+	benchmark.pedantic(subprocess.check_call, ([sys.executable, '-c', script],), rounds = ROUNDS // 2)
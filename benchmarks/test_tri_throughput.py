@@ -0,0 +1,96 @@
+#  test_tri_throughput.py (c) 2016 Mattias Fredriksson
+#
+# ##### BEGIN GPL LICENSE BLOCK #####
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+# ##### END GPL LICENSE BLOCK #####
+
+#Throughput of the triangle array kernels (core/tri.py) against the scalar mathutils versions (funcs_tri.py) on the same input,
+#run with: python -m pytest benchmarks/test_tri_throughput.py --benchmark-group-by=group
+
+import types
+import numpy as np
+import pytest
+
+pytest.importorskip('pytest_benchmark')
+pytest.importorskip('mathutils')
+from mathutils import Vector
+from mesh_data import random_triangles
+from projection_ops.core.tri import *
+from projection_ops.funcs_tri import pointInTriangle, rayTriIntersection
+
+#Number of (ray/point, triangle) pairs tested in each round
+PAIRS = 20000
+
+@pytest.fixture(scope = 'module')
+def rays() :
+	rng = np.random.RandomState(0)
+	tri = random_triangles(PAIRS)
+	origin = rng.random_sample((PAIRS, 3))
+	origin[:,2] += 1
+	dir = np.tile([0, 0, -1.0], (PAIRS, 1))
+	return (origin, dir, tri)
+
+def scalar_faces(tri) :
+	return [types.SimpleNamespace(verts = [types.SimpleNamespace(co = Vector(co)) for co in t]) for t in tri]
+
+@pytest.mark.benchmark(group = 'rayTriIntersection')
+def test_ray_tri_array(benchmark, rays) :
+	(origin, dir, tri) = rays
+	benchmark(rayTriIntersectionArray, origin, dir, tri)
+
+@pytest.mark.benchmark(group = 'rayTriIntersection')
+def test_ray_tri_scalar(benchmark, rays) :
+	(origin, dir, tri) = rays
+	args = list(zip([Vector(o) for o in origin], [Vector(d) for d in dir], scalar_faces(tri)))
+	benchmark(lambda : [rayTriIntersection(o, d, f) for (o, d, f) in args])
+
+@pytest.mark.benchmark(group = 'closestRayTri')
+def test_closest_ray_tri_array(benchmark, rays) :
+	(origin, dir, tri) = rays
+	#Every ray against every triangle: 200 rays x 100 triangles
+	benchmark(closestRayTriArray, origin[:200], dir[:200], tri[:100])
+
+@pytest.mark.benchmark(group = 'closestRayTri')
+def test_closest_ray_tri_scalar(benchmark, rays) :
+	(origin, dir, tri) = rays
+	faces = scalar_faces(tri[:100])
+	args = list(zip([Vector(o) for o in origin[:200]], [Vector(d) for d in dir[:200]]))
+	def closest() :
+		for (o, d) in args :
+			hits = [r for r in [rayTriIntersection(o, d, f) for f in faces] if r is not None]
+			min(hits, key = lambda r : r[0]) if len(hits) > 0 else None
+	benchmark(closest)
+
+@pytest.mark.benchmark(group = 'pointInTriangle')
+def test_point_in_triangle_array(benchmark, rays) :
+	(origin, dir, tri) = rays
+	point = tri.mean(axis = 1)
+	benchmark(pointInTriangleArray, point, tri)
+
+@pytest.mark.benchmark(group = 'pointInTriangle')
+def test_point_in_triangle_scalar(benchmark, rays) :
+	(origin, dir, tri) = rays
+	args = [(Vector(p), Vector(t[0]), Vector(t[1]), Vector(t[2])) for (p, t) in zip(tri.mean(axis = 1), tri)]
+	benchmark(lambda : [pointInTriangle(*a) for a in args])
+
+@pytest.mark.benchmark(group = 'projectOnTriangles')
+def test_project_on_triangles(benchmark, rays) :
+	(origin, dir, tri) = rays
+	tri_co = tri.astype(np.float32)
+	tri_no = np.tile(np.array([0, 0, 1], dtype=np.float32), (PAIRS, 3, 1))
+	face_no = tri_no[:,0]
+	uvw = np.random.RandomState(1).dirichlet((1, 1, 1), PAIRS)
+	benchmark(projectOnTriangles, tri_co, tri_no, face_no, np.arange(PAIRS), uvw, np.zeros(PAIRS), True)
@@ -0,0 +1,23 @@
+#Fixtures shared by the tests and the benchmarks, the stand-ins are defined in tests/blender_stand_ins.py (on the pytest pythonpath).
+
+import pytest
+
+from blender_stand_ins import StandIns
+
+@pytest.fixture
+def blender() :
+	"""
+	Blender 2.8 api stand-ins, the package is imported fresh against them.
+	"""
+	stand_ins = StandIns((2, 80, 0)).install()
+	yield stand_ins
+	stand_ins.uninstall()
+
+@pytest.fixture(params = [(2, 79, 0), (2, 80, 0), (2, 93, 0)], ids = ['2.79', '2.80', '2.93'])
+def blender_version(request) :
+	"""
+	Stand-ins for each api flavour supported by compat.py.
+	"""
+	stand_ins = StandIns(request.param).install()
+	yield stand_ins
+	stand_ins.uninstall()
@@ -22,7 +22,7 @@ bl_info = {
 	'name': "Projection Operators",
 	'author': "Mattias Fredriksson ",
 	'version': (0, 9, 4),
-	'blender': (2, 80, 0),
+	'blender': (2, 80, 0), # Also runs in 2.79 (see compat.py), 2.8 refuses add-ons declaring an older version
 	'location': "3DView > Objectmode: Project Mesh onto UV Surface, Mirror Mesh over Defined Surface, Project Mesh(es) onto Active, Align Selection to View",
 	'warning': "In the case of experiencing issues report it at: https://github.com/MattiasFredriksson/Blender-Projection_Ops/issues",
 	'description': "4 Operators containing functionality for mirroring and projecting mesh objects relative to a surface mesh.",
@@ -30,8 +30,16 @@ bl_info = {
 	'tracker_url': "https://github.com/MattiasFredriksson/Blender-Projection_Ops/issues",
 	'category': 'Mesh'}
 
-import sys, bpy, traceback, glob, importlib
+# Modules are reloaded if the package was loaded before (bpy was imported)
+reload_package = "bpy" in locals()
+
+import sys, traceback, glob, importlib, time
 from os.path import dirname, basename, isfile, join, split
+try:
+	import bpy
+except ImportError:
+	# Imported outside blender, only the bpy free 'core' package can be used
+	bpy = None
 
 # Goble package module files
 directory = dirname(__file__)
@@ -44,88 +52,77 @@ __all__ = [basename(f)[:-3] for f in modules if isfile(f) and not f.endswith('__
 ############
 def force_reload():
 	try:
+		# Only modules imported in the previous session are reloaded, the remaining are imported on first use
+		core = importlib.import_module(package + '.core')
+		# Core modules first, the operator modules import from them
+		for mod_name in core.modules:
+			reload_loaded(package + '.core.' + mod_name)
 		for mod_name in __all__:
-			mod = importlib.import_module(package + '.' + mod_name)
-			importlib.reload(mod)
+			reload_loaded(package + '.' + mod_name)
 	except:
 		print('Reloading all package modules failed with error:')
 		traceback.print_exc()
 #end force_reload()
+def reload_loaded(mod_name):
+	mod = sys.modules.get(mod_name)
+	if mod is not None:
+		importlib.reload(mod)
+#end reload_loaded()
 def load_modules():
-	for mod_name in __all__:
-		mod = importlib.import_module(package + '.' + mod_name)
+	# Only the operator declarations are imported, the implementing modules (numpy kernels, projection engine,
+	# partition grids) are imported when an operator is first invoked. See lazy_ops.load_implementation().
+	importlib.import_module(package + '.lazy_ops')
 #end load_modules()
-def to_op_id(obj):
-	"""
-	Convert a suitable object to an operator id string.
-	"""
-	if not isinstance(obj, str):
-		return obj.bl_idname
-	# elif: string
-	return obj
-#end op_id()
-def op_exist(op_id):
-	"""
-	Verify if an operator has been registered in 'bpy.ops'.
-	----
-	Params:
-	op_id:		Operator to check for or a string used to identify it (relevant
-				string id is defined in the operator's 'bl_idname' attribute).
-	----
-	Return: 	'True' if an operator with the id is registered, 'False' if no operator with the id exist.
-	"""
-	op_id = to_op_id(op_id)
-	op_type, delim, op_name = op_id.rpartition('.')
-	# There is no operator 'type' specified
-	if op_type is '':
-		return op_name in dir(bpy.ops)
-	return op_name in dir(getattr(bpy.ops, op_type))
-#end op_exist()
-def get_op(op_id):
+def report_time(task, start):
 	"""
-	Find the registered operator class with the bl_idname.
-	There must! exist some better way of doing this directly converting the bl_idname....
+	Print the time spent on a package task when Blender runs in debug mode (--debug).
 	"""
-	op_id = to_op_id(op_id)
-	# Search through all bpy.types and math the bl_idname
-	for type_str in dir(bpy.types):
-		try:
-			# May or may not be RNAMeta type
-			RNAMeta = getattr(bpy.types, type_str)
-			if RNAMeta.bl_idname == op_id:
-				return RNAMeta
-		except:
-			pass
-	return None
-#end get_op()
+	if bpy.app.debug:
+		print('%s: %s in %.2f ms' % (package, task, (time.perf_counter() - start) * 1000))
+#end report_time()
 
 #######################
 # Import Package
 #######################
-if "bpy" in locals():
-	force_reload() # Reload modules if necessary
-load_modules()
+if bpy is not None:
+	start = time.perf_counter()
+	if reload_package:
+		force_reload() # Reload modules if necessary
+	load_modules()
+	report_time('load modules', start)
 
 #######################
 # Register Package
 #######################
 
 # List of operator classes in the package
-operators = [uv_project.MESH_OT_UVProjectMesh, project.MESH_OT_ProjectMesh, mesh_mirror_script.MESH_OT_MirrorMesh, align_to_view.MESH_OT_AlignSelection]
+if bpy is not None:
+	operators = lazy_ops.operators
+
+# Classes registered by the package, unregistered directly from the list
+registered = []
 
 # Register the operator
 def register():
+	start = time.perf_counter()
 	for op in operators:
 		bpy.utils.register_class(op)
+		registered.append(op)
+	lazy_ops.register_handlers()
+	report_time('register', start)
 #end register()
 def unregister():
-	# Try to unregister all operators
-	for op in operators:
-		# Only thing left to test
-		if op_exist(op.bl_idname):
-			reg_op = get_op(op.bl_idname)
-			bpy.utils.unregister_class(reg_op)
+	start = time.perf_counter()
+	lazy_ops.unregister_handlers()
+	# Unregister in reverse order of registration
+	while len(registered) > 0:
+		op = registered.pop()
+		try:
+			bpy.utils.unregister_class(op)
+		except RuntimeError:
+			pass # Already unregistered
 	#efor
+	report_time('unregister', start)
 #end unregister()
 if __name__ == "__main__":
 	register()
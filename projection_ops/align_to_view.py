@@ -19,6 +19,7 @@
 
 
 import bpy, sys
+import numpy as np
 
 
 
@@ -26,38 +27,12 @@ from math import *
 from mathutils import *
 from .funcs_math import *
 from .funcs_blender import *
+from .compat import *
 from .axis_align import *
-from bpy.props import * #Property objects
-class MESH_OT_AlignSelection(bpy.types.Operator):
-	bl_idname = "mesh.align_selection_view"
-	bl_label = "Align Selection to View"
-	bl_info = "Aligns the mesh rotation to the current view"
-	bl_options = {'REGISTER', 'UNDO'}
-
-
-	rot_type_enum = [
-		("Z", "Z", "Selection will be rotated so the Z axis is facing the camera", 0),
-		("Y", "Y", "Selection will be rotated so the Y axis is facing the camera", 1),
-		("X", "X", "Selection will be rotated so the X axis is facing the camera", 2),
-		("AXISALIGNED", "Axis Aligned", "Selection's XYZ axis will be aligned with the closest camera axis", 3),
-		("CLOSEST", "Closest", "Selection will be rotated so that the closest axis to the camera will face it", 4),
-		]
-	parent_obj_enum = [
-		("VERTCOUNT", "Vertex Count", "Use the object with the most vertices", 0),
-		("VOLUME", "Volume", "Use the object with largest bounding box", 1),
-		("ACTIVE", "Active", "Use the active object as the parent", 2),
-		]
-	rot_type : EnumProperty(items=rot_type_enum,
-			name = "Alignment",
-            description="Determines the axis of the parent object that will be aligned to the camera view",
-			default = 'CLOSEST',)
-	parent_obj : EnumProperty(items=parent_obj_enum,
-			name = "Selection Parent",
-            description="Method for determining the selected object that will be treated as the parent object",
-			default = 'ACTIVE',)
-	exclude_active : BoolProperty(name = "Exclude active object",
-            description="Exclude the active object from selection, and disallows it from parenting the selection (useful if it's a projection target selection)",
-			default=False)
+class MESH_OT_AlignSelection :
+	"""
+	Implementation of the lazy_ops.MESH_OT_AlignSelection operator, copied onto the registered class on first use.
+	"""
 
 	def __init__(self):
 		return
@@ -87,8 +62,8 @@ class MESH_OT_AlignSelection(bpy.types.Operator):
 		parent_world_inv = parent.matrix_world.inverted()
 		#Find parent orientation
 		parent_mat = self.parent_orientation(parent)
-		for ob in child_list :
-			ob.matrix_world = self.orientation(ob, parent_world_inv, parent_mat)
+		#Apply the parent relative transform to all children in a single batched multiply
+		setMatrixWorldArray(child_list, self.orientation(getMatrixWorldArray(child_list), parent_world_inv, parent_mat))
 		parent.matrix_world = parent_mat
 
 		return {'FINISHED'}
@@ -102,35 +77,37 @@ class MESH_OT_AlignSelection(bpy.types.Operator):
 		meshRot = meshRot.to_matrix()
 		#Calc rotation
 		if self.rot_type == 'AXISALIGNED' :
-			rot = self.cameraRot @ axisAlignRotationMatrix(self.cameraRotInv @ meshRot)
+			rot = matmul(self.cameraRot, axisAlignRotationMatrix(matmul(self.cameraRotInv, meshRot)))
 		#Axis alignements: Axis Rot is rotated with the objects rotation difference on the plane parallell to cameras XY plane,
 		#This generates the rotation in the cameras rotation space (camera rotation is applied last).
 		elif self.rot_type == 'Z' :
 			rot = Matrix.Identity(3) #Mesh face inverse camera
-			rot = calculateRotXYPlane_baseX(meshRot,self.cameraRot) @ rot #Find rotation difference on XY plane
-			rot = self.cameraRot @ rot #Rotate to camera space
+			rot = matmul(calculateRotXYPlane_baseX(meshRot,self.cameraRot), rot) #Find rotation difference on XY plane
+			rot = matmul(self.cameraRot, rot) #Rotate to camera space
 		elif self.rot_type == 'Y' :
 			#Find rotation difference to camera, could use quats and rotation_difference(quat)
 			rot = Matrix.Rotation(half_pi, 3, Vector((1,0,0))) #Rotate Y facing upward
-			rot = calculateRotXYPlane_baseX(meshRot, self.cameraRot) @ rot #Find rotation difference on ZX plane
-			rot = self.cameraRot @ rot #Move rotation to camera space
+			rot = matmul(calculateRotXYPlane_baseX(meshRot, self.cameraRot), rot) #Find rotation difference on ZX plane
+			rot = matmul(self.cameraRot, rot) #Move rotation to camera space
 		elif self.rot_type == 'X' :
 			rot =  Matrix.Rotation(-half_pi, 3, Vector((0,1,0))) #Rotate X facing up
-			rot = calculateRotXYPlane_baseY(meshRot, self.cameraRot) @ rot #Find rotation difference on YZ plane
-			rot = self.cameraRot @ rot #Move rotation to camera space
+			rot = matmul(calculateRotXYPlane_baseY(meshRot, self.cameraRot), rot) #Find rotation difference on YZ plane
+			rot = matmul(self.cameraRot, rot) #Move rotation to camera space
 		else : # self.rot_type == 'CLOSEST' :
-			rot = self.cameraRot @ alignRotationMatrix(self.cameraRotInv @ meshRot)
+			rot = matmul(self.cameraRot, alignRotationMatrix(matmul(self.cameraRotInv, meshRot)))
 		#Assemble orientation matrix:
-		return Matrix.Translation(loc) @ (rot @ scaleMatrix(sca, 3)).to_4x4()
+		return matmul(Matrix.Translation(loc), matmul(rot, scaleMatrix(sca, 3)).to_4x4())
 
-	def orientation(self, object, parent_world_inv, parent_mat) :
+	def orientation(self, matrices, parent_world_inv, parent_mat) :
 		"""
-		Func finding the orientation in relation to the parent object.
-		object:				Object to calculate matrix for
+		Func finding the orientations in relation to the parent object.
+		matrices:			Array (N x 4 x 4) of the world matrices of the objects to calculate matrices for
 		parent_world_inv:	Parent objects world matrix inverse
 		parent_mat:			Calculated final transform for parent object
+		Returns: Array (N x 4 x 4) of the world matrices
 		"""
-		return parent_mat @ parent_world_inv @ object.matrix_world
+		relative = np.array(matmul(parent_mat, parent_world_inv), dtype=np.float64)
+		return np.matmul(relative, matrices)
 
 
 	def findParent(self, context, ob_list) :
@@ -151,11 +128,9 @@ class MESH_OT_AlignSelection(bpy.types.Operator):
 			parent_ob = context.active_object
 		#Parent: Obj with largest OBB Volume
 		else : #self.parent_obj == 'VOLUME' :
-			for ob in ob_list :
-				volume = getBoundBoxVolume(ob)
-				if volume > value :
-					value = volume
-					parent_ob = ob
+			volume = getBoundBoxVolumes(ob_list)
+			if len(volume) > 0 and volume.max() > value :
+				parent_ob = ob_list[int(np.argmax(volume))]
 		#Generate a list with only child objects:
 		child_list = []
 		for ob in ob_list :
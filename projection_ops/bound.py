@@ -3,6 +3,7 @@ import copy
 from math import *
 from mathutils import *
 from .funcs_math import *
+from .core.uv_grid import udimOffset
 class Bounds :
 	"""
 	Bounds holds the bounding box of the source mesh (in aligned local space).
@@ -37,6 +38,21 @@ class Bounds :
 		uv += self.texOrigo
 		return Vector((uv.x, uv.y, vOffset.z))
 	
+	def uv_matrix(self) :
+		"""
+		Affine matrix equal to calcUVPoint, transforms a point (x,y,z,1) inside the bounds to (u,v,depth,1).
+		"""
+		sx = self.uvSize.x / self.vSize.x
+		sy = self.uvSize.y / self.vSize.y
+		#Offset in the mapping basis before rotation:
+		ox = self.texMin.x - sx * self.vMin.x
+		oy = self.texMin.y - sy * self.vMin.y
+		return Matrix((
+			(self.xAxis.x * sx, self.yAxis.x * sy, 0, self.xAxis.x * ox + self.yAxis.x * oy + self.texOrigo.x),
+			(self.xAxis.y * sx, self.yAxis.y * sy, 0, self.xAxis.y * ox + self.yAxis.y * oy + self.texOrigo.y),
+			(0, 0, 1, -self.vMin.z),
+			(0, 0, 0, 1)))
+
 	def scale(self, scalar) :
 		"""
 		Scale uv mapping
@@ -75,6 +91,13 @@ class Bounds :
 		Move the uv mapping
 		"""
 		self.texOrigo += vec2
+
+	def moveToTile(self, tile) :
+		"""
+		Move the uv mapping into the UDIM tile (1001, 1002...), keeping the placement relative to the tile
+		"""
+		(u, v) = udimOffset(tile)
+		self.texOrigo += Vector((u - floor(self.texOrigo.x), v - floor(self.texOrigo.y)))
 	
 	#Rotate the uv mapping:
 	def rotate(self, angle) :
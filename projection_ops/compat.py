@@ -0,0 +1,164 @@
+#  compat.py (c) 2016 Mattias Fredriksson
+#
+# ##### BEGIN GPL LICENSE BLOCK #####
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+# ##### END GPL LICENSE BLOCK #####
+
+#Version compatibility layer between the Blender 2.79 and 2.8+ python api. The package is written against a single api and
+#every call that differs between the versions goes through the functions below:
+#- Matrix multiplication, '*' in 2.79 and '@' in 2.8.
+#- Operator properties, assigned in the class body in 2.79 and declared as annotations in 2.8.
+#- Object selection, active object and scene linking (view layers and collections in 2.8).
+#- Evaluated (modifier applied) meshes, from the depsgraph in 2.8 and the scene in 2.79.
+#- Vertex normal updates after writing vertex positions (calculated on demand from 4.0).
+#- Update handlers, depsgraph_update_post in 2.8 and scene_update_post in 2.79.
+#The module only imports bpy so it can be used by the operator declarations loaded at startup.
+
+import bpy
+from operator import mul as _mul, matmul as _matmul
+from functools import reduce as _reduce
+
+#True if running the Blender 2.8+ api
+API_28 = bpy.app.version >= (2, 80, 0)
+
+_matrix_mul = _matmul if API_28 else _mul
+
+def matmul(*args) :
+	"""
+	Multiply mathutils matrices and vectors from left to right ('@' in 2.8 and '*' in 2.79).
+	"""
+	return _reduce(_matrix_mul, args)
+
+def is_property(value) :
+	"""
+	Check if a class attribute is a property declared with a bpy.props function.
+	The functions return a (function, keywords) tuple before 2.93 and a deferred property object in later versions.
+	"""
+	if isinstance(value, tuple) :
+		return len(value) == 2 and callable(value[0]) and isinstance(value[1], dict)
+	return type(value).__name__ == '_PropertyDeferred'
+
+def make_annotations(cls) :
+	"""
+	Move the properties assigned in the class body to the class annotations as required by the 2.8 api.
+	Properties are assigned so the class body is valid in the python version of 2.79 (3.5, no variable annotations).
+	cls:	Class to convert, the class is unchanged in 2.79
+	"""
+	if not API_28 :
+		return cls
+	props = [(name, value) for (name, value) in cls.__dict__.items() if is_property(value)]
+	if len(props) == 0 :
+		return cls
+	if '__annotations__' not in cls.__dict__ :
+		setattr(cls, '__annotations__', {})
+	annotations = cls.__dict__['__annotations__']
+	for (name, value) in props :
+		annotations[name] = value
+		delattr(cls, name)
+	return cls
+
+def evaluated_depsgraph(context) :
+	"""
+	Get the depsgraph objects are evaluated in, in 2.79 modifiers are evaluated for the scene which is returned instead.
+	"""
+	if API_28 :
+		return context.evaluated_depsgraph_get()
+	return context.scene
+
+def evaluated_mesh(object, depsgraph) :
+	"""
+	Create a temporary mesh of the object with modifiers applied, release it with clear_evaluated_mesh().
+	object:		Mesh object
+	depsgraph:	Depsgraph (scene in 2.79) returned from evaluated_depsgraph()
+	"""
+	if API_28 :
+		return object.evaluated_get(depsgraph).to_mesh()
+	return object.to_mesh(depsgraph, True, 'PREVIEW')
+
+def clear_evaluated_mesh(object, depsgraph, mesh) :
+	"""
+	Release the temporary mesh created with evaluated_mesh().
+	"""
+	if API_28 :
+		object.evaluated_get(depsgraph).to_mesh_clear()
+	else :
+		bpy.data.meshes.remove(mesh)
+
+def calc_normals(mesh) :
+	"""
+	Recalculate the vertex normals after the vertex positions were written with foreach_set.
+	Meshes calculate normals on demand from 4.0 where the function is removed, nothing is done in these versions.
+	"""
+	if hasattr(mesh, 'calc_normals') :
+		mesh.calc_normals()
+
+def select_set(object, state) :
+	"""
+	Select or deselect the object.
+	"""
+	if API_28 :
+		object.select_set(state)
+	else :
+		object.select = state
+
+def set_active(context, object) :
+	"""
+	Make the object active in the view layer (scene in 2.79).
+	"""
+	if API_28 :
+		context.view_layer.objects.active = object
+	else :
+		context.scene.objects.active = object
+
+def link_object(scene, object) :
+	"""
+	Link the object to the scene (scene master collection in 2.8).
+	"""
+	if API_28 :
+		scene.collection.objects.link(object)
+	else :
+		scene.objects.link(object)
+
+def header_text_clear(area) :
+	"""
+	Restore the default header of the area after calling header_text_set().
+	"""
+	if API_28 :
+		area.header_text_set(None)
+	else :
+		area.header_text_set()
+
+def update_handlers() :
+	"""
+	Get the handler list called after objects in the scene are updated.
+	Handlers are called with the arguments (scene, depsgraph) in 2.8 and (scene) in 2.79, see updated_objects().
+	"""
+	if API_28 :
+		return bpy.app.handlers.depsgraph_update_post
+	return bpy.app.handlers.scene_update_post
+
+def updated_objects(scene, depsgraph = None) :
+	"""
+	Get the names of the objects with an updated transform or geometry, called from an update_handlers() handler.
+	scene:		Scene passed to the handler
+	depsgraph:	Depsgraph passed to the handler, not passed in 2.79 and 2.80 (Default: None)
+	"""
+	if not API_28 :
+		return [ob.name for ob in scene.objects if ob.is_updated or ob.is_updated_data]
+	if depsgraph is None :
+		depsgraph = bpy.context.evaluated_depsgraph_get()
+	return [update.id.original.name for update in depsgraph.updates
+		if isinstance(update.id, bpy.types.Object) and (update.is_updated_geometry or update.is_updated_transform)]
@@ -0,0 +1,25 @@
+#  __init__.py (c) 2016 Mattias Fredriksson
+#
+# ##### BEGIN GPL LICENSE BLOCK #####
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+# ##### END GPL LICENSE BLOCK #####
+
+#Geometry core of the projection operators. Kernels operate on numpy arrays (triangles, uv coordinates, normals)
+#and only import numpy, no blender modules (bpy, bmesh, mathutils), so they can be used and tested outside blender.
+#The operator modules read the blender data into arrays and write the results back.
+
+#Core modules in dependency order (reload order)
+modules = ['tri', 'uv_grid', 'seams']
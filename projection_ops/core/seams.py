@@ -0,0 +1,137 @@
+#  seams.py (c) 2016 Mattias Fredriksson
+#
+# ##### BEGIN GPL LICENSE BLOCK #####
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+# ##### END GPL LICENSE BLOCK #####
+
+#Uv seam adjacency operating on numpy arrays, no blender modules are imported.
+
+import numpy as np
+
+from .tri import *
+
+class SeamTable :
+	"""
+	Adjacency table of the uv seams of a triangulated mesh. For each triangle edge (index tri * 3 + edge, edge i is
+	between corner i and i + 1) on a seam, the table stores the triangle sharing the edge in 3D and a 2D similarity
+	transform mapping the uv space of the triangle onto the uv island of the adjacent triangle across the edge.
+	Points falling off an island can then continue on the adjacent island with a single lookup.
+	"""
+	def __init__(self, tri_uv, adj_tri, mul, add, flip) :
+		#Uv triangles (F x 3 x 2), shared with the partition grid
+		self.tri_uv = tri_uv
+		#Adjacent triangle for each edge (F * 3, -1 if the edge is not on a seam)
+		self.adj_tri = adj_tri
+		#Complex coefficients of the uv transform: z' = mul * z + add, z is conjugated first if flip is set (mirrored islands)
+		self.mul = mul
+		self.add = add
+		self.flip = flip
+
+	def from_triangles(tri_vert, tri_uv, bias = 0.00001) :
+		"""
+		Construction function that finds the seam edges of the triangles and generates the table.
+		tri_vert:	Array (F x 3) of the triangle vertex indices
+		tri_uv:		Array (F x 3 x 2) of the triangle uv coordinates
+		bias:		Uv distance where edge corners are considered equal
+		"""
+		num = len(tri_vert) * 3
+		adj_tri = np.full(num, -1, dtype=np.int32)
+		mul = np.zeros(num, dtype=np.complex128)
+		add = np.zeros(num, dtype=np.complex128)
+		flip = np.zeros(num, dtype=bool)
+		if num == 0 :
+			return SeamTable(tri_uv, adj_tri, mul, add, flip)
+		#Edge start/end vertex and the corner index of the edge end point:
+		v0 = tri_vert.reshape(-1).astype(np.int64)
+		v1 = tri_vert[:,[1, 2, 0]].reshape(-1).astype(np.int64)
+		corner_end = (np.arange(len(tri_vert))[:,None] * 3 + [1, 2, 0]).reshape(-1)
+		#Match edges sharing the same vertices, edges shared by more than two faces are treated as boundaries:
+		key = np.minimum(v0, v1) * (int(tri_vert.max()) + 1) + np.maximum(v0, v1)
+		order = np.argsort(key, kind = 'mergesort')
+		same = key[order[1:]] == key[order[:-1]]
+		prev = np.concatenate(([False], same[:-1]))
+		following = np.concatenate((same[1:], [False]))
+		pair = np.flatnonzero(same & ~prev & ~following)
+		e = np.concatenate((order[pair], order[pair + 1]))
+		o = np.concatenate((order[pair + 1], order[pair]))
+		#Uv coordinates of the shared edge in both triangles, matched by vertex:
+		corner_uv = tri_uv.reshape((-1, 2))
+		a = corner_uv[e]
+		b = corner_uv[corner_end[e]]
+		same_dir = v0[o] == v0[e]
+		a_adj = np.where(same_dir[:,None], corner_uv[o], corner_uv[corner_end[o]])
+		b_adj = np.where(same_dir[:,None], corner_uv[corner_end[o]], corner_uv[o])
+		seam = (np.abs(a - a_adj).max(axis = 1) > bias) | (np.abs(b - b_adj).max(axis = 1) > bias)
+		seam &= (np.abs(b - a).max(axis = 1) > bias) & (np.abs(b_adj - a_adj).max(axis = 1) > bias)
+		(e, o, a, b, a_adj, b_adj) = (e[seam], o[seam], a[seam], b[seam], a_adj[seam], b_adj[seam])
+		za = a[:,0] + 1j * a[:,1]
+		zb = b[:,0] + 1j * b[:,1]
+		za_adj = a_adj[:,0] + 1j * a_adj[:,1]
+		zb_adj = b_adj[:,0] + 1j * b_adj[:,1]
+		#Islands with opposite winding are mirrored, the uv space is then reflected before the transform:
+		area = uv_area_sign(tri_uv)
+		mirror = area[e // 3] != area[o // 3]
+		za = np.where(mirror, np.conj(za), za)
+		zb = np.where(mirror, np.conj(zb), zb)
+		adj_tri[e] = o // 3
+		mul[e] = (zb_adj - za_adj) / (zb - za)
+		add[e] = za_adj - za * mul[e]
+		flip[e] = mirror
+		return SeamTable(tri_uv, adj_tri, mul, add, flip)
+
+	def continue_points(self, tri, edge, points, bias = 0.00001) :
+		"""
+		Continue points outside the triangles across the seam edges onto the adjacent islands.
+		tri:	Array (N) of triangles the points are closest to, -1 if no triangle was found
+		edge:	Array (N) of the closest edge of each triangle, -1 if no triangle was found
+		points:	Array (N x 2) of uv coordinates outside the triangles
+		Returns: Touple of arrays, bool mask (N) of points intersecting the adjacent triangle, the adjacent triangle index (N, -1 if no seam)
+		and the uvw coordinates in the adjacent triangle (N x 3)
+		"""
+		#Points without a closest triangle remain misses:
+		valid = (tri >= 0) & (edge >= 0)
+		e = tri.astype(np.int64) * 3 + edge
+		adj = np.full(len(points), -1, dtype=self.adj_tri.dtype)
+		adj[valid] = self.adj_tri[e[valid]]
+		hit = np.zeros(len(points), dtype=bool)
+		uvw = np.zeros((len(points), 3))
+		seam = np.flatnonzero(adj >= 0)
+		if len(seam) == 0 :
+			return (hit, adj, uvw)
+		e = e[seam]
+		z = points[seam,0] + 1j * points[seam,1]
+		z = np.where(self.flip[e], np.conj(z), z) * self.mul[e] + self.add[e]
+		(inside, bary) = barycentric_uv(self.tri_uv[adj[seam]], np.stack((z.real, z.imag), axis = 1), bias)
+		hit[seam] = inside
+		uvw[seam] = bary
+		return (hit, adj, uvw)
+
+	def to_arrays(self) :
+		"""
+		Dict of the table arrays, used to store the table. The uv triangles are stored with the uv index.
+		"""
+		return {'seam_adj_tri' : self.adj_tri, 'seam_mul' : self.mul, 'seam_add' : self.add, 'seam_flip' : self.flip}
+	def from_arrays(tri_uv, arrays) :
+		"""
+		Construction function that restores the table from the to_arrays dict, arrays are used without copying.
+		"""
+		return SeamTable(tri_uv, arrays['seam_adj_tri'], arrays['seam_mul'], arrays['seam_add'], arrays['seam_flip'])
+
+	def memory_size(self) :
+		"""
+		Memory (bytes) held by the table, excluding the shared uv triangles.
+		"""
+		return self.adj_tri.nbytes + self.mul.nbytes + self.add.nbytes + self.flip.nbytes
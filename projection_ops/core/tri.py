@@ -0,0 +1,275 @@
+#  tri.py (c) 2016 Mattias Fredriksson
+#
+# ##### BEGIN GPL LICENSE BLOCK #####
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+# ##### END GPL LICENSE BLOCK #####
+
+#Triangle kernels operating on numpy arrays, no blender modules are imported.
+
+import numpy as np
+
+#Default intersection bias
+TRI_BIAS = 0.00001
+
+def minMaxArray(co) :
+	"""
+	Find the minimum and maximum point of an array of points (N x D) in a single reduction, zero points if the array is empty.
+	Returns: Touple of arrays (D) with the (min, max) points
+	"""
+	if len(co) == 0 :
+		return (np.zeros(co.shape[1:], dtype=co.dtype), np.zeros(co.shape[1:], dtype=co.dtype))
+	return (co.min(axis = 0), co.max(axis = 0))
+
+def triMinMaxArray(tri) :
+	"""
+	Bounds of each triangle in an array of triangle points (N x 3 x D), equal to the component wise min/max of the corners.
+	The corners are compared element wise which is faster then reducing the short corner axis.
+	Returns: Touple of arrays (N x D) with the (min, max) points of each triangle
+	"""
+	vMin = np.minimum(tri[:,0], tri[:,1])
+	np.minimum(vMin, tri[:,2], out = vMin)
+	vMax = np.maximum(tri[:,0], tri[:,1])
+	np.maximum(vMax, tri[:,2], out = vMax)
+	return (vMin, vMax)
+
+def averageTexCoordArray(tri_uv, uvw) :
+	""" Calculates the Texture UV coordinates for arrays of triangle uv coordinates (N x 3 x 2) and barycentric coords (N x 3)
+	"""
+	return np.einsum('nij,ni->nj', tri_uv, uvw)
+
+def uvAreaArray(tri_uv) :
+	"""	Calculates the uv triangle area (equal to uv_Area) for an array of triangle uv coordinates (N x 3 x 2)
+	"""
+	return np.linalg.norm(tri_uv[:,1] - tri_uv[:,0], axis = 1) * np.linalg.norm(tri_uv[:,2] - tri_uv[:,0], axis = 1) * 0.5
+
+def pointInTriangleArray(point, tri, bias = 0) :
+	"""
+	Batched pointInTriangle, checks if each point is in the paired triangle, both must be in the same plane.
+	Arrays are broadcast, M triangles can be tested against N points by passing tri[:,None] and point[None].
+	point:	Array (... x 3) of points
+	tri:	Array (... x 3 x 3) of triangle points
+	bias:	Points are inside if all barycentric coordinates are larger then -bias (Default: 0)
+	Returns a bool mask (...) and the barycentric coordinates (... x 3)
+	"""
+	v0 = tri[...,1,:] - tri[...,0,:]
+	v1 = tri[...,2,:] - tri[...,0,:]
+	v2 = point - tri[...,0,:]
+
+	d00 = (v0 * v0).sum(axis = -1)
+	d01 = (v0 * v1).sum(axis = -1)
+	d11 = (v1 * v1).sum(axis = -1)
+	d20 = (v2 * v0).sum(axis = -1)
+	d21 = (v2 * v1).sum(axis = -1)
+
+	denom = d00 * d11 - d01 * d01
+	degenerate = denom == 0
+	invDenom = 1.0 / np.where(degenerate, 1, denom)
+
+	v = (d11 * d20 - d01 * d21) * invDenom
+	w = (d00 * d21 - d01 * d20) * invDenom
+	u = 1.0 - v - w
+	return ((u > -bias) & (v > -bias) & (w > -bias) & ~degenerate, np.stack((u, v, w), axis = -1))
+
+def barycentric_uv(tri, points, bias = TRI_BIAS) :
+	"""
+	Batched calculateBarycentricCoord2D, calculates the barycentric coordinates of each point in the paired triangle.
+	Arrays are broadcast, M triangles can be tested against N points by passing tri[:,None] and points[None].
+	tri:	Array (... x 3 x 2) of triangle points
+	points:	Array (... x 2) of points
+	bias:	Triangles with a smaller (doubled) area are treated as degenerate
+	Return: Touple with bool mask (...) if points are inside the triangles and an array (... x 3) with the uvw coordinates.
+	"""
+	e0 = tri[...,1,:] - tri[...,0,:]
+	e1 = tri[...,2,:] - tri[...,0,:]
+	e2 = points - tri[...,0,:]
+	d = e0[...,0] * e1[...,1] - e1[...,0] * e0[...,1]
+	degenerate = np.abs(d) < bias
+	d = 1 / np.where(degenerate, 1, d)
+	v = (e2[...,0] * e1[...,1] - e1[...,0] * e2[...,1]) * d
+	w = (e0[...,0] * e2[...,1] - e2[...,0] * e0[...,1]) * d
+	u = 1 - v - w
+	inside = (u > 0) & (v > 0) & (w > 0) & ~degenerate
+	return (inside, np.stack((u, v, w), axis = -1))
+
+def separatingTriAxisArray(tri_a0, tri_a1, tri_p, points) :
+	"""
+	Batched separatingTriAxis2D, calculates if sets of points overlap the triangles projected on the normal of a triangle edge.
+	Arrays are broadcast, the point sets are stored in the second last axis.
+	tri_a0, tri_a1:	Arrays (... x 2) of the first 2 points in the triangles defining the axis edge
+	tri_p:			Array (... x 2) of the third point in the triangles
+	points:			Array (... x K x 2) of the point sets that should be separated on the defined axis
+	Return:			Bool mask (...), True if the points intersect over the axis segment
+	"""
+	#Normal of the axis edge, projections are not normalized as only the overlap is compared:
+	axis = tri_a1 - tri_a0
+	axis = np.stack((-axis[...,1], axis[...,0]), axis = -1)
+	pa0 = (axis * tri_a0).sum(axis = -1)
+	pa1 = (axis * tri_p).sum(axis = -1)
+	proj = (axis[...,None,:] * points).sum(axis = -1)
+	pa_min = np.minimum(pa0, pa1)
+	pa_max = np.maximum(pa0, pa1)
+	overlap = (proj.min(axis = -1) <= pa_max) & (proj.max(axis = -1) >= pa_min)
+	#Axis has length ~0
+	return overlap & (axis != 0).any(axis = -1)
+
+def collideTriAARectArray(tri, rect_min, rect_max) :
+	"""
+	Batched collideTriAARect2D, checks if the triangles intersect the axis aligned rectangles using the separating axis theorem.
+	Arrays are broadcast, M triangles can be tested against N rectangles by passing tri[:,None] and rect_min[None], rect_max[None].
+	tri:		Array (... x 3 x 2) of the triangle points
+	rect_min:	Array (... x 2) of the rectangle min points
+	rect_max:	Array (... x 2) of the rectangle max points
+	Return:		Bool mask (...), True if the triangle intersects the rectangle
+	"""
+	#Rectangle and triangle bounds must overlap on the X and Y axis:
+	collide = ((rect_min <= tri.max(axis = -2)) & (rect_max >= tri.min(axis = -2))).all(axis = -1)
+	#Corners of the rectangles:
+	(rect_min, rect_max) = np.broadcast_arrays(rect_min, rect_max)
+	corners = np.stack((rect_min, np.stack((rect_min[...,0], rect_max[...,1]), axis = -1),
+		rect_max, np.stack((rect_max[...,0], rect_min[...,1]), axis = -1)), axis = -2)
+	#Check for a separating axis on the triangle edges:
+	(p0, p1, p2) = (tri[...,0,:], tri[...,1,:], tri[...,2,:])
+	collide = collide & separatingTriAxisArray(p0, p1, p2, corners)
+	collide = collide & separatingTriAxisArray(p1, p2, p0, corners)
+	return collide & separatingTriAxisArray(p2, p0, p1, corners)
+
+def normalTriIntersectionArray(point, tri_co, tri_no, face_no, bias = 0, cull = False) :
+	"""
+	Batched intersection test of points with the triangles extruded along the vertex normals (used to mirror vertices over a surface).
+	The triangle is offset along the vertex normals to the plane parallel to the face containing the point, which is then tested.
+	Arrays are broadcast, M triangles can be tested against N points by passing tri_*[:,None] and point[None].
+	point:		Array (... x 3) of points
+	tri_co:		Array (... x 3 x 3) of the triangle corner positions
+	tri_no:		Array (... x 3 x 3) of the triangle corner vertex normals
+	face_no:	Array (... x 3) of the triangle normals
+	bias:		Intersection bias, barycentric coordinates must be larger then -bias
+	cull:		If points behind the triangles are treated as not intersecting
+	Returns: Touple with bool mask (...) of intersections, the distances (...) to the triangle plane and the barycentric coordinates (... x 3)
+	"""
+	t = (face_no * (point - tri_co[...,0,:])).sum(axis = -1)
+	with np.errstate(divide = 'ignore', invalid = 'ignore') :
+		scale = t[...,None] / (face_no[...,None,:] * tri_no).sum(axis = -1)
+		plane_tri = scale[...,None] * tri_no + tri_co
+		(inside, uvw) = pointInTriangleArray(point, plane_tri, bias)
+	if cull :
+		inside &= t >= 0
+	return (inside, t, uvw)
+
+def rayTriIntersectionArray(origin, dir, tri, bias = TRI_BIAS) :
+	"""
+	Batched Moller-Trumbore ray/triangle intersection, calculates if the rays intersect the paired triangles.
+	Arrays are broadcast, N rays can be tested against M triangles by passing origin[:,None], dir[:,None] and tri[None].
+	Edge tests are inclusive and expanded with the bias, so rays hitting an edge shared by two triangles intersect both
+	and no ray can slip through the seams of a closed surface.
+	origin:	Array (... x 3) of ray origins
+	dir:	Array (... x 3) of ray directions, the distance is returned in the length of dir
+	tri:	Array (... x 3 x 3) of triangle points
+	bias:	Intersection bias, rays parallel to the triangle plane within the bias are treated as not intersecting
+	Returns: Touple with bool mask (...) of intersections, the ray distances (...) and the barycentric coordinates (... x 3)
+	"""
+	p0 = tri[...,0,:]
+	e1 = tri[...,1,:] - p0
+	e2 = tri[...,2,:] - p0
+	q = np.cross(dir, e2)
+	#Find the (scaled) area of the triangle, rays parallel to the plane have no area:
+	a = (e1 * q).sum(axis = -1)
+	parallel = np.abs(a) < bias
+	f = 1 / np.where(parallel, 1, a)
+	s = origin - p0
+	r = np.cross(s, e1)
+	#Barycentric weights of the second and third triangle point:
+	u = f * (s * q).sum(axis = -1)
+	v = f * (dir * r).sum(axis = -1)
+	t = f * (e2 * r).sum(axis = -1)
+	w = 1 - u - v
+	hit = (u >= -bias) & (v >= -bias) & (w >= -bias) & (t >= 0) & ~parallel
+	return (hit, t, np.stack((w, u, v), axis = -1))
+
+def closestRayTriArray(origin, dir, tri, bias = TRI_BIAS, batch_size = 1 << 20) :
+	"""
+	Finds the closest triangle intersected by each ray, testing every ray against every triangle.
+	origin:		Array (N x 3) of ray origins
+	dir:		Array (N x 3) of ray directions
+	tri:		Array (M x 3 x 3) of triangle points
+	bias:		Intersection bias, see rayTriIntersectionArray
+	batch_size:	Max number of (ray, triangle) tests in a batch
+	Returns: Touple with bool mask (N) of rays intersecting a triangle, the closest triangle index (N, -1 if no intersection),
+			the ray distances (N) and the barycentric coordinates (N x 3)
+	"""
+	num = len(origin)
+	index = np.full(num, -1, dtype=np.int64)
+	dist = np.full(num, np.inf)
+	uvw = np.zeros((num, 3))
+	batch = max(1, batch_size // max(1, len(tri)))
+	for start in range(0, num, batch) :
+		end = min(start + batch, num)
+		(hit, t, coord) = rayTriIntersectionArray(origin[start:end,None], dir[start:end,None], tri[None], bias)
+		t = np.where(hit, t, np.inf)
+		closest = np.argmin(t, axis = 1)
+		rows = np.arange(end - start)
+		found = hit[rows, closest]
+		index[start:end][found] = closest[found]
+		dist[start:end][found] = t[rows, closest][found]
+		uvw[start:end][found] = coord[rows, closest][found]
+	return (index >= 0, index, dist, uvw)
+
+def distance_edge_uv(e0, e1, points) :
+	"""
+	Batched distanceEdge, distance between each point and the paired line segment.
+	e0,e1:	Arrays (N x 2) of the points defining the segments
+	points:	Array (N x 2) of points
+	"""
+	point = points - e0
+	segment = e1 - e0
+	length = np.einsum('ij,ij->i', segment, segment)
+	t = np.einsum('ij,ij->i', segment, point) / np.where(length > 0, length, 1)
+	t = np.clip(t, 0, 1)
+	return np.linalg.norm(point - t[:,None] * segment, axis = 1)
+
+def uv_area_sign(tri_uv) :
+	"""
+	Sign of the (doubled) area of each uv triangle, negative for clockwise triangles.
+	"""
+	e0 = tri_uv[:,1] - tri_uv[:,0]
+	e1 = tri_uv[:,2] - tri_uv[:,0]
+	return np.sign(e0[:,0] * e1[:,1] - e1[:,0] * e0[:,1])
+
+def projectOnTriangles(tri_co, tri_no, face_no, tri, uvw, depth, smooth, clamp = None) :
+	"""
+	Calculate the projection points of vertices placed on the triangles at the barycentric weights
+	tri_co:		Array (F x 3 x 3) of the triangle corner positions
+	tri_no:		Array (F x 3 x 3) of the triangle corner vertex normals
+	face_no:	Array (F x 3) of the triangle normals
+	tri:		Array (N) of triangle indices the vertices are projected on
+	uvw:		Array (N x 3) of barycentric weights, defining how much each tri corner influences the vertex
+	depth:		Array (N) of distances of the vertices from the triangle surface
+	smooth:		If the vertex normals are interpolated, otherwise the face normal is used
+	clamp:		Bool mask (N) of vertices outside the triangle, their weights are clamped when interpolating the normal (Default: None)
+	Returns: Array (N x 3) of projected points
+	"""
+	uvw = uvw.astype(np.float32)
+	depth = np.asarray(depth, dtype=np.float32)
+	co = np.einsum('nij,ni->nj', tri_co[tri], uvw)
+	if smooth :
+		if clamp is not None :
+			uvw[clamp] = np.clip(uvw[clamp], 0, 1)
+		nor = np.einsum('nij,ni->nj', tri_no[tri], uvw)
+		length = np.linalg.norm(nor, axis = 1)
+		nor /= np.where(length > 0, length, 1)[:,None]
+	else :
+		nor = face_no[tri]
+	co += nor * depth[:,None]
+	return co
@@ -0,0 +1,582 @@
+#  uv_grid.py (c) 2016 Mattias Fredriksson
+#
+# ##### BEGIN GPL LICENSE BLOCK #####
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+# ##### END GPL LICENSE BLOCK #####
+
+#Packed uv partition grids operating on numpy arrays, no blender modules are imported.
+
+import threading
+import numpy as np
+from math import sqrt
+
+from .tri import *
+
+def udimTile(u, v) :
+	"""
+	UDIM tile number (1001, 1002...) of the integer uv tile offset, 10 tiles per row
+	"""
+	return 1001 + u + 10 * v
+def udimOffset(tile) :
+	"""
+	Integer uv offset (u, v) of the UDIM tile number
+	"""
+	return ((tile - 1001) % 10, (tile - 1001) // 10)
+
+def isin_sorted(values, table) :
+	"""
+	Bool mask of the values found in the table, equal to np.isin. np.isin requires numpy 1.13 (older blender builds ship
+	an older numpy) and np.in1d is removed in numpy 2.4, the values are searched in the sorted unique table instead.
+	values:	Array of integers to look up
+	table:	Array of integers to search in
+	"""
+	table = np.unique(table)
+	if len(table) == 0 :
+		return np.zeros(np.shape(values), dtype=bool)
+	ind = np.minimum(np.searchsorted(table, values), len(table) - 1)
+	return table[ind] == values
+def unique_rows(rows) :
+	"""
+	Unique rows of an integer array (N x 2), equal to np.unique(rows, axis = 0) which requires numpy 1.13.
+	Rows are sorted by the first and second column and equal rows are found from the packed (u << 32) + v key.
+	Returns: Touple of the unique rows (U x 2), the sort order of the rows (N), the start of each unique row
+	in the sorted order (U) and the index of the unique row for each row (N).
+	"""
+	order = np.lexsort((rows[:,1], rows[:,0]))
+	key = rows[order,0].astype(np.int64) * (1 << 32) + rows[order,1]
+	first = np.ones(len(rows), dtype=bool)
+	first[1:] = np.diff(key) != 0
+	start = np.flatnonzero(first)
+	inverse = np.empty(len(rows), dtype=np.int64)
+	inverse[order] = np.cumsum(first) - 1
+	return (rows[order[start]], order, start, inverse)
+
+def calc_partition_size(tri_uv, occupancy) :
+	"""
+	Estimates the partition size giving the specified mean face count in occupied partitions.
+	The expected number of square partitions a uv triangle overlaps is the area of the triangle expanded
+	by a partition (Minkowski sum) divided with the partition area: (a + s * (w + h) + s^2) / s^2,
+	where a is the triangle area, w, h the triangle extents and s the partition size.
+	Occupied partitions are estimated by the uv area divided with partition area, solving the relation
+	for s gives a second degree equation: N * s^2 + sum(w + h) * s - (occupancy - 1) * area = 0
+	tri_uv: 	Array (F x 3 x 2) of the uv triangles to measure
+	occupancy:	Target mean number of faces in each occupied partition (> 1)
+	Returns: The partition size or None if the uv map has no area
+	"""
+	num_face = len(tri_uv)
+	if num_face == 0 :
+		return None
+	e0 = tri_uv[:,1] - tri_uv[:,0]
+	e1 = tri_uv[:,2] - tri_uv[:,0]
+	area = float(np.abs(e0[:,0] * e1[:,1] - e1[:,0] * e0[:,1]).sum() * 0.5)
+	(low, high) = triMinMaxArray(tri_uv)
+	extent = float((high - low).sum())
+	if area <= 0 :
+		return None
+	occupancy = max(occupancy, 1)
+	return (sqrt(extent * extent + 4 * num_face * (occupancy - 1) * area) - extent) / (2 * num_face)
+
+def bin_triangles_uv(tri_uv, index, min_uv, part_size, partitions, chunk = 1 << 20) :
+	"""
+	Sorts the uv triangles into the grid partitions they intersect. Each triangle is tested against the partitions
+	overlapped by it's bounding box using the separating axis theorem.
+	tri_uv:		Array (F x 3 x 2) of the uv triangles
+	index:		Array of the face indices to sort
+	min_uv:		Min point of the grid
+	part_size:	Size of a grid partition
+	partitions:	Touple with the number of partitions on the x, y axis
+	chunk:		Max number of (triangle, partition) pairs tested in each batch
+	Returns: Touple with the arrays of partition indices (y * partitions x + x) and the face index intersecting each partition
+	"""
+	tris = tri_uv[index]
+	last = np.array(partitions) - 1
+	#Partition range overlapped by the triangle bounds:
+	(low, high) = triMinMaxArray(tris)
+	low = np.clip(np.floor((low - min_uv) / part_size), 0, last).astype(np.int64)
+	span = np.clip(np.floor((high - min_uv) / part_size), 0, last).astype(np.int64) - low + 1
+	count = span[:,0] * span[:,1]
+	total = np.cumsum(count)
+	cells = [np.zeros(0, dtype=np.int64)]
+	faces = [np.zeros(0, dtype=np.int64)]
+	start = 0
+	while start < len(index) :
+		#Batch of triangles with a limited number of overlapped partitions:
+		end = max(int(np.searchsorted(total, total[start] - count[start] + chunk, 'right')), start + 1)
+		num = count[start:end]
+		#Expand to a (triangle, partition) pair for each overlapped partition:
+		pair = np.repeat(np.arange(start, end), num)
+		local = np.arange(len(pair)) - np.repeat(np.cumsum(num) - num, num)
+		x = low[pair,0] + local % span[pair,0]
+		y = low[pair,1] + local // span[pair,0]
+		rect_min = min_uv + np.stack((x, y), axis = 1) * part_size
+		hit = collideTriAARectArray(tris[pair], rect_min, rect_min + part_size)
+		cells.append((y * partitions[0] + x)[hit])
+		faces.append(index[pair[hit]])
+		start = end
+	return (np.concatenate(cells), np.concatenate(faces).astype(np.int32))
+
+def ring_offsets(r) :
+	"""
+	Partition offsets (8r x 2, 1 x 2 for r = 0) on the square ring with chebyshev distance r around a partition.
+	"""
+	if r == 0 :
+		return np.zeros((1, 2), dtype=np.int64)
+	side = np.arange(-r, r + 1)
+	inner = side[1:-1]
+	return np.concatenate((np.stack((side, np.full(len(side), -r)), axis = 1), np.stack((side, np.full(len(side), r)), axis = 1),
+		np.stack((np.full(len(inner), -r), inner), axis = 1), np.stack((np.full(len(inner), r), inner), axis = 1)))
+
+class UVGrid :
+	"""
+	Packed partition grid over a uv map. The faces intersecting each partition are stored in compressed
+	row form: partition i (index = y * partitions x + x) holds the faces cell_tris[cell_start[i]:cell_start[i + 1]].
+	"""
+	def __init__(self, min_uv, max_uv, partitions, bias, tri_uv, cell_start, cell_tris) :
+		"""
+		min_uv, max_uv:	Touples (u, v) with the grid min/max points
+		partitions:		Touple with the number of partitions on the x, y axis
+		bias:			Intersection bias
+		tri_uv:			Array (F x 3 x 2) of the face uv coordinates
+		cell_start:		Array (cells + 1) of offsets into cell_tris for each partition
+		cell_tris:		Array of face indices contained in each partition
+		"""
+		self.min_uv = np.array(min_uv, dtype=np.float64)
+		self.max_uv = np.array(max_uv, dtype=np.float64)
+		self.partitions = (int(partitions[0]), int(partitions[1]))
+		self.part_size = (self.max_uv - self.min_uv) / self.partitions
+		self.bias = bias
+		self.tri_uv = tri_uv
+		self.cell_start = cell_start
+		self.cell_tris = cell_tris
+
+	def from_tri_uv(tri_uv, face_per_partition = 2, bias = TRI_BIAS, occupancy = None, index = None) :
+		"""
+		Construction function that creates a grid representing the uv triangles
+		tri_uv: 			Array (F x 3 x 2) of the uv triangles in face index order
+		face_per_partition:	Manual number of faces per partition, used if occupancy is None
+		occupancy:			Target mean number of faces in occupied partitions, partition size is then
+							calculated from the uv triangle area distribution (Default: None)
+		index:				Array of face indices if the grid should only contain a subset of the triangles (Default: None)
+		"""
+		index = np.arange(len(tri_uv)) if index is None else np.asarray(index)
+		tris = tri_uv[index]
+		#Find uv size:
+		(min_uv, max_uv) = minMaxArray(tris.reshape((-1, 2)))
+		#Add epsilon to size so the max points is floored into the grid:
+		max_uv = max_uv + bias
+		size = max_uv - min_uv
+		#Calculate the number of squares to create:
+		part_size = None
+		if occupancy is not None :
+			part_size = calc_partition_size(tris, occupancy)
+		if part_size is not None and part_size > 0 :
+			partitions = np.maximum(np.ceil(size / part_size), 1)
+		else :
+			num_part = len(tris) / face_per_partition
+			part_per_size = sqrt(num_part * 4) / size.sum()
+			partitions = np.maximum(np.ceil(size * part_per_size), 1)
+		#Apply a bias limit on partition count:
+		limit = size / partitions < bias * 100
+		partitions[limit] = np.ceil(size[limit] / (bias * 100))
+		partitions = (int(partitions[0]), int(partitions[1]))
+		(cells, faces) = bin_triangles_uv(tri_uv, index, min_uv, size / partitions, partitions)
+		return UVGrid.from_cells(min_uv, max_uv, partitions, bias, tri_uv, cells, faces)
+	def from_cells(min_uv, max_uv, partitions, bias, tri_uv, cells, faces) :
+		"""
+		Construction function that packs the (partition, face) pairs into a grid, faces are kept in order within each partition.
+		cells:	Array of partition indices (y * partitions x + x)
+		faces:	Array of the face index intersecting each partition in cells
+		Remaining arguments are passed to UVGrid.
+		"""
+		order = np.argsort(cells, kind = 'mergesort')
+		cell_start = np.zeros(partitions[0] * partitions[1] + 1, dtype=np.int64)
+		cell_start[1:] = np.cumsum(np.bincount(cells, minlength = partitions[0] * partitions[1]))
+		return UVGrid(min_uv, max_uv, partitions, bias, tri_uv, cell_start, faces[order].astype(np.int32))
+
+	def to_arrays(self) :
+		"""
+		Dict of the arrays defining the grid, used to store the grid.
+		"""
+		meta = np.array([self.min_uv[0], self.min_uv[1], self.max_uv[0], self.max_uv[1], self.partitions[0], self.partitions[1], self.bias])
+		return {'tri_uv' : self.tri_uv, 'cell_start' : self.cell_start, 'cell_tris' : self.cell_tris, 'grid_meta' : meta}
+	def from_arrays(arrays) :
+		"""
+		Construction function that restores a grid from the to_arrays dict, arrays are used without copying.
+		"""
+		meta = arrays['grid_meta']
+		return UVGrid(meta[0:2], meta[2:4], meta[4:6], float(meta[6]), arrays['tri_uv'], arrays['cell_start'], arrays['cell_tris'])
+
+	def contains(self, tri_uv) :
+		"""
+		Verify that the uv triangles (N x 3 x 2) are inside the grid area.
+		"""
+		if len(tri_uv) == 0 :
+			return True
+		(low, high) = minMaxArray(tri_uv.reshape((-1, 2)))
+		return bool(np.all(low >= self.min_uv) and np.all(high < self.max_uv))
+	def rebin(self, tri_uv, changed) :
+		"""
+		Create a grid for updated uv triangles where only the changed triangles are binned again, the partitions are kept.
+		tri_uv:		Array (F x 3 x 2) of the updated uv triangles
+		changed:	Array of the face indices with changed uv coordinates
+		Returns: The updated grid or None if the grid must be rebuilt (a changed triangle is outside the grid)
+		"""
+		changed = np.asarray(changed)
+		if not self.contains(tri_uv[changed]) :
+			return None
+		(cells, faces) = bin_triangles_uv(tri_uv, changed, self.min_uv, self.part_size, self.partitions)
+		cell = np.repeat(np.arange(len(self.cell_start) - 1), np.diff(self.cell_start))
+		keep = ~isin_sorted(self.cell_tris, changed)
+		cells = np.concatenate((cell[keep], cells))
+		faces = np.concatenate((self.cell_tris[keep], faces))
+		return UVGrid.from_cells(self.min_uv, self.max_uv, self.partitions, self.bias, tri_uv, cells, faces)
+
+	def memory_size(self) :
+		"""
+		Memory (bytes) held by the grid arrays.
+		"""
+		return self.tri_uv.nbytes + self.index_memory_size()
+	def index_memory_size(self) :
+		"""
+		Memory (bytes) held by the partition arrays, excluding the uv triangles.
+		"""
+		return self.cell_start.nbytes + self.cell_tris.nbytes
+
+	def cell_count(self) :
+		"""
+		Array with the number of faces contained in each partition (index = y * partitions x + x)
+		"""
+		return np.diff(self.cell_start)
+	def occupancy_histogram(self, max_bin = 8) :
+		"""
+		Counts the number of partitions holding each number of faces.
+		max_bin:	Last bin, partitions holding more faces are counted in it.
+		Returns: List where index i holds the number of partitions containing i faces.
+		"""
+		return np.bincount(np.minimum(self.cell_count(), max_bin), minlength = max_bin + 1).tolist()
+	def mean_occupancy(self) :
+		"""
+		Mean number of faces in the partitions containing atleast one face.
+		"""
+		count = self.cell_count()
+		occupied = np.count_nonzero(count)
+		if occupied == 0 :
+			return 0
+		return count.sum() / occupied
+	def occupancy_report(self) :
+		"""
+		Returns a string describing the partition count and the occupancy histogram.
+		"""
+		hist = self.occupancy_histogram()
+		bins = ", ".join(["%d: %d" % (i, hist[i]) for i in range(len(hist) - 1)])
+		return "Partitions: %dx%d, mean faces per partition: %.2f, histogram (faces: partitions) %s, %d+: %d" % (
+			self.partitions[0], self.partitions[1], self.mean_occupancy(), bins, len(hist) - 1, hist[-1])
+
+	def cell_range(self, points) :
+		"""
+		Find the faces in the partition containing each point.
+		points:	Array (N x 2) of uv coordinates
+		Returns: Touple of arrays, offset into cell_tris (N) and the number of faces in the partition (N, 0 if outside the grid)
+		"""
+		ind = np.floor((points - self.min_uv) / self.part_size).astype(np.int64)
+		valid = (ind[:,0] >= 0) & (ind[:,1] >= 0) & (ind[:,0] < self.partitions[0]) & (ind[:,1] < self.partitions[1])
+		cell = np.where(valid, ind[:,1] * self.partitions[0] + ind[:,0], 0)
+		start = self.cell_start[cell]
+		return (start, np.where(valid, self.cell_start[cell + 1] - start, 0))
+
+	def trace_point_uv(self, point_uv) :
+		"""
+		Trace intersection between a point and the uv faces in the grid.
+		Returns: Touple with bool for intersection, the uvw coordinates and the face index (None if no intersection)
+		"""
+		(hit, tri, uvw) = self.trace_points_uv(np.array([point_uv[:2]], dtype=np.float64))
+		if hit[0] :
+			return (True, uvw[0], int(tri[0]))
+		#Either outside the grid or no face found to intersect with:
+		return (False, None, None)
+	def trace_close_uv(self, point_uv) :
+		"""
+		Traces the closest edge to the point in the grid partition specified by the point
+		Returns: Touple with the distance to the edge, the face index and the uvw coordinates relative to the face (None if no face found)
+		"""
+		(tri, uvw, dist, edge) = self.trace_close_points_uv(np.array([point_uv[:2]], dtype=np.float64))
+		if tri[0] < 0 :
+			return (None, None, None)
+		return (dist[0], int(tri[0]), uvw[0])
+	def trace_points_uv(self, points) :
+		"""
+		Batched trace_point_uv, traces intersection between each point and the uv faces in the grid.
+		points:	Array (N x 2) of uv coordinates
+		Returns: Touple of arrays, bool mask for intersection (N), intersected face index (N, -1 if no intersection) and uvw coordinates (N x 3)
+		"""
+		num = len(points)
+		hit = np.zeros(num, dtype=bool)
+		tri = np.full(num, -1, dtype=np.int32)
+		uvw = np.zeros((num, 3))
+		if num == 0 :
+			return (hit, tri, uvw)
+		(start, count) = self.cell_range(points)
+		#Test the k:th face in each point's partition until all points are resolved:
+		for k in range(int(count.max())) :
+			idx = np.flatnonzero((count > k) & ~hit)
+			if len(idx) == 0 :
+				break
+			faces = self.cell_tris[start[idx] + k]
+			(intersect, bary) = barycentric_uv(self.tri_uv[faces], points[idx], self.bias)
+			idx = idx[intersect]
+			hit[idx] = True
+			tri[idx] = faces[intersect]
+			uvw[idx] = bary[intersect]
+		return (hit, tri, uvw)
+	def trace_close_points_uv(self, points) :
+		"""
+		Batched trace_close_uv, finds the face with the closest edge to each point. The partitions are searched in rings
+		around the partition of the point until no closer face can exist, so points in empty partitions or outside the grid
+		also find the closest face of the uv islands.
+		points:	Array (N x 2) of uv coordinates
+		Returns: Touple of arrays, closest face index (N, -1 only if the grid is empty),
+		uvw coordinates of the point relative to the face (N x 3), the distance to the closest edge (N)
+		and the index of the closest edge in the face (N, edge i is between corner i and i + 1).
+		"""
+		num = len(points)
+		tri = np.full(num, -1, dtype=np.int32)
+		edge = np.full(num, -1, dtype=np.int8)
+		dist = np.full(num, np.inf)
+		if num == 0 or len(self.cell_tris) == 0 :
+			return (tri, np.zeros((num, 3)), dist, edge)
+		#Partition of each point, points outside the grid start from the closest border partition:
+		last = np.array(self.partitions) - 1
+		ind = np.clip(np.floor((points - self.min_uv) / self.part_size), 0, last).astype(np.int64)
+		pending = np.arange(num)
+		for r in range(max(self.partitions)) :
+			#Partitions on the ring r steps from the point's partition:
+			cells = ind[pending][:,None,:] + ring_offsets(r)
+			valid = np.all((cells >= 0) & (cells <= last), axis = 2)
+			point = np.broadcast_to(pending[:,None], valid.shape)[valid]
+			cell = cells[valid][:,1] * self.partitions[0] + cells[valid][:,0]
+			start = self.cell_start[cell]
+			count = self.cell_start[cell + 1] - start
+			#Compare the edges of the k:th face in each partition with the closest found:
+			for k in range(int(count.max()) if len(count) > 0 else 0) :
+				sel = np.flatnonzero(count > k)
+				idx = point[sel]
+				faces = self.cell_tris[start[sel] + k]
+				tri_uv = self.tri_uv[faces]
+				tmp = np.stack([distance_edge_uv(tri_uv[:,x], tri_uv[:,(x + 1)%3], points[idx]) for x in range(3)], axis = 1)
+				closest = np.argmin(tmp, axis = 1)
+				tmp = tmp[np.arange(len(idx)), closest]
+				#Several partitions of the ring can hold a face for the same point, keep the closest pair of each point:
+				order = np.lexsort((tmp, idx))
+				first = np.ones(len(order), dtype=bool)
+				first[1:] = idx[order[1:]] != idx[order[:-1]]
+				order = order[first]
+				order = order[tmp[order] < dist[idx[order]]]
+				dist[idx[order]] = tmp[order]
+				tri[idx[order]] = faces[order]
+				edge[idx[order]] = closest[order]
+			#Continue until no face outside the searched partitions can be closer:
+			low = self.min_uv + (ind[pending] - r) * self.part_size
+			high = self.min_uv + (ind[pending] + r + 1) * self.part_size
+			pending = pending[dist[pending] > self.distance_outside(points[pending], low, high)]
+			if len(pending) == 0 :
+				break
+		found = tri >= 0
+		uvw = np.zeros((num, 3))
+		uvw[found] = barycentric_uv(self.tri_uv[tri[found]], points[found], self.bias)[1]
+		return (tri, uvw, dist, edge)
+	def distance_outside(self, points, low, high) :
+		"""
+		Lower bound of the distance from each point to the grid partitions outside the paired rectangle.
+		points:		Array (N x 2) of uv coordinates
+		low, high:	Arrays (N x 2) of the min/max points of the rectangles, aligned to the partitions
+		Returns: Array (N) of distances, inf if the rectangle covers the grid
+		"""
+		dist = np.full(len(points), np.inf)
+		#The partitions outside the rectangle are covered by the grid regions on each side of it:
+		for axis in range(2) :
+			for side in [low, high] :
+				region_low = np.tile(self.min_uv, (len(points), 1))
+				region_high = np.tile(self.max_uv, (len(points), 1))
+				if side is low :
+					region_high[:,axis] = low[:,axis]
+				else :
+					region_low[:,axis] = high[:,axis]
+				offset = np.maximum(np.maximum(region_low - points, points - region_high), 0)
+				empty = region_high[:,axis] <= region_low[:,axis]
+				dist = np.where(empty, dist, np.minimum(dist, np.linalg.norm(offset, axis = 1)))
+		return dist
+	def __str__(self) :
+		count = self.cell_count().reshape((self.partitions[1], self.partitions[0]))
+		str = "Partition grid X: %d, Y: %d \n" % self.partitions
+		for y in count  :
+			str += "["
+			for part in y :
+				str += "%d," % part
+			str += "]\n"
+		return str
+
+class TiledUVGrid :
+	"""
+	Uv index for uv maps spanning multiple UDIM tiles. Faces are sorted into the unit uv tiles they overlap and
+	a separate partition grid is built for each occupied tile, on the first query of a point in the tile.
+	Empty tiles are never allocated. Provides the same trace functions as UVGrid.
+	"""
+	def __init__(self, tri_uv, tiles, build, face_per_partition = 2, bias = 0.00001, occupancy = None) :
+		"""
+		tri_uv: 	Array (F x 3 x 2) of the uv triangles in face index order
+		tiles:		Dict mapping the (u, v) tile offset to the array of face indices overlapping the tile
+		build:		Function building the UVGrid of a tile: build(tri_uv, face_per_partition, bias, occupancy, index), see UVGrid.from_tri_uv
+		Remaining arguments are passed to the build function.
+		"""
+		self.tri_uv = tri_uv
+		self.tiles = tiles
+		self.build = build
+		self.face_per_partition = face_per_partition
+		self.bias = bias
+		self.occupancy = occupancy
+		#Built grids, keyed by tile offset. Grids can be requested from several projection threads:
+		self.grids = {}
+		self.lock = threading.Lock()
+
+	def tile_faces(tri_uv) :
+		"""
+		Sorts the faces into the uv tiles overlapped by the face bounding box.
+		Tiles are half-open ranges [u, u + 1), a face ending on a tile border does not overlap the next tile.
+		tri_uv: 	Array (F x 3 x 2) of the uv triangles
+		Returns: Dict mapping the (u, v) tile offset to an array of face indices
+		"""
+		if len(tri_uv) == 0 :
+			return {}
+		(low, high) = triMinMaxArray(tri_uv)
+		low = np.floor(low).astype(np.int64)
+		#Last tile overlapped, faces with no extent on the border still belong to the first tile:
+		high = np.maximum(np.ceil(high).astype(np.int64) - 1, low)
+		span = high - low
+		keys = []
+		faces = []
+		for du in range(int(span[:,0].max()) + 1) :
+			for dv in range(int(span[:,1].max()) + 1) :
+				sel = np.flatnonzero((span[:,0] >= du) & (span[:,1] >= dv))
+				keys.append(low[sel] + (du, dv))
+				faces.append(sel)
+		keys = np.concatenate(keys)
+		faces = np.concatenate(faces)
+		(unique, order, start, inverse) = unique_rows(keys)
+		return {(int(u), int(v)) : tile for ((u, v), tile) in zip(unique, np.split(faces[order], start[1:]))}
+
+	def tile_grid(self, tile) :
+		"""
+		Fetch the partition grid of the tile, the grid is built if not done yet.
+		tile:	(u, v) tile offset
+		Returns: Partition grid or None if no face overlaps the tile
+		"""
+		grid = self.grids.get(tile)
+		if grid is None and tile in self.tiles :
+			with self.lock :
+				grid = self.grids.get(tile)
+				if grid is None :
+					grid = self.build(self.tri_uv, self.face_per_partition, self.bias, self.occupancy, self.tiles[tile])
+					self.grids[tile] = grid
+		return grid
+
+	def tile_groups(self, points, closest = False) :
+		"""
+		Groups the points by the uv tile containing them.
+		points:		Array (N x 2) of uv coordinates
+		closest:	If points in empty tiles are grouped with the closest occupied tile instead of excluded (Default: False)
+		Returns: List of touples with the tile grid and the indices of the points in the tile.
+		"""
+		if len(points) == 0 :
+			return []
+		tile = np.floor(points).astype(np.int64)
+		if closest and len(self.tiles) > 0 :
+			keys = np.array(list(self.tiles.keys()), dtype=np.int64)
+			empty = np.flatnonzero(~isin_sorted(tile[:,0] * (1 << 32) + tile[:,1], keys[:,0] * (1 << 32) + keys[:,1]))
+			#Distance from the points to the unit square of each occupied tile:
+			offset = np.maximum(np.maximum(keys[None] - points[empty,None], points[empty,None] - (keys[None] + 1)), 0)
+			tile[empty] = keys[np.argmin(np.einsum('ijk,ijk->ij', offset, offset), axis = 1)]
+		(unique, order, start, inverse) = unique_rows(tile)
+		groups = []
+		for i, (u, v) in enumerate(unique) :
+			grid = self.tile_grid((int(u), int(v)))
+			if grid is not None :
+				groups.append((grid, np.flatnonzero(inverse == i)))
+		return groups
+
+	def trace_points_uv(self, points) :
+		"""
+		Batched trace_point_uv, see UVGrid.trace_points_uv.
+		"""
+		num = len(points)
+		hit = np.zeros(num, dtype=bool)
+		tri = np.full(num, -1, dtype=np.int32)
+		uvw = np.zeros((num, 3))
+		for (grid, idx) in self.tile_groups(points) :
+			(hit[idx], tri[idx], uvw[idx]) = grid.trace_points_uv(points[idx])
+		return (hit, tri, uvw)
+	def trace_close_points_uv(self, points) :
+		"""
+		Batched trace_close_uv limited to the tile of each point, points in empty tiles search the closest occupied tile.
+		See UVGrid.trace_close_points_uv.
+		"""
+		num = len(points)
+		tri = np.full(num, -1, dtype=np.int32)
+		uvw = np.zeros((num, 3))
+		dist = np.full(num, np.inf)
+		edge = np.full(num, -1, dtype=np.int8)
+		for (grid, idx) in self.tile_groups(points, True) :
+			(tri[idx], uvw[idx], dist[idx], edge[idx]) = grid.trace_close_points_uv(points[idx])
+		return (tri, uvw, dist, edge)
+	trace_point_uv = UVGrid.trace_point_uv
+	trace_close_uv = UVGrid.trace_close_uv
+
+	def to_arrays(self) :
+		"""
+		Dict of the arrays defining the tiles, used to store the index. Tile grids are not stored as they are built on demand.
+		"""
+		keys = sorted(self.tiles)
+		tile_start = np.zeros(len(keys) + 1, dtype=np.int64)
+		tile_start[1:] = np.cumsum([len(self.tiles[key]) for key in keys])
+		tile_faces = np.concatenate([self.tiles[key] for key in keys]) if len(keys) > 0 else np.zeros(0, dtype=np.int64)
+		meta = np.array([self.face_per_partition, self.bias, -1 if self.occupancy is None else self.occupancy])
+		return {'tri_uv' : self.tri_uv, 'tile_keys' : np.array(keys, dtype=np.int64).reshape((-1, 2)), 'tile_start' : tile_start,
+			'tile_faces' : tile_faces, 'tile_meta' : meta}
+	def from_arrays(arrays, build) :
+		"""
+		Construction function that restores the tiled index from the to_arrays dict, arrays are used without copying.
+		build:	Function building the tile grids, see __init__
+		"""
+		start = arrays['tile_start']
+		faces = arrays['tile_faces']
+		tiles = {(int(u), int(v)) : faces[start[i]:start[i + 1]] for i, (u, v) in enumerate(arrays['tile_keys'])}
+		meta = arrays['tile_meta']
+		occupancy = None if meta[2] < 0 else float(meta[2])
+		return TiledUVGrid(arrays['tri_uv'], tiles, build, float(meta[0]), float(meta[1]), occupancy)
+
+	def occupancy_report(self) :
+		"""
+		Returns a string describing the occupied tiles and the partitions of the built tile grids.
+		"""
+		report = "UDIM tiles: %d occupied, %d indexed" % (len(self.tiles), len(self.grids))
+		for tile in sorted(self.grids) :
+			report += "\nTile %d: %s" % (udimTile(tile[0], tile[1]), self.grids[tile].occupancy_report())
+		return report
+	def memory_size(self) :
+		"""
+		Memory (bytes) held by the uv triangles, the tile face lists and the built tile grids.
+		"""
+		size = self.tri_uv.nbytes + sum([faces.nbytes for faces in self.tiles.values()])
+		return size + sum([grid.index_memory_size() for grid in self.grids.values()])
@@ -1,8 +1,11 @@
 
 import bpy, bmesh
+import numpy as np
 from math import *
 from mathutils import *
 from .funcs_math import *
+from .mesh_arrays import *
+from .compat import *
 
 def findViewRotation(context) :
 	"""
@@ -21,7 +24,7 @@ def findViewForward(context) :
 	if context.area.type == 'VIEW_3D':
 		cQuat = context.area.spaces[0].region_3d.view_rotation
 		#Return camera rot as 4x4 matrix:
-		return cQuat @ Vector((0,0, -1))
+		return matmul(cQuat, Vector((0,0, -1)))
 	return Vector((0,0, -1))
 def findViewPos(context) :
 	"""
@@ -30,7 +33,7 @@ def findViewPos(context) :
 	if context.area.type == 'VIEW_3D':
 		#Return camera position
 		cQuat = context.area.spaces[0].region_3d.view_rotation
-		cam_off = cQuat @ Vector((0,0, 1)) * context.area.spaces[0].region_3d.view_distance
+		cam_off = matmul(cQuat, Vector((0,0, 1))) * context.area.spaces[0].region_3d.view_distance
 		return context.area.spaces[0].region_3d.view_location + cam_off
 	return Vector((0,0, 0))
 
@@ -78,15 +81,34 @@ def getBoundBoxVolume(object) :
 	side_b = Vector((object.bound_box[3][0],object.bound_box[3][1],object.bound_box[3][2])) - point
 	return up.length * side_a.length * side_b.length
 
+def getBoundBoxVolumes(objects) :
+	"""
+	Fetches the bounding box volumes of a list of blender objects as an array, equal to getBoundBoxVolume for each object.
+	"""
+	if len(objects) == 0 :
+		return np.zeros(0)
+	bound_box = np.array([object.bound_box for object in objects], dtype=np.float64).reshape((-1, 8, 3))
+	edges = bound_box[:,(4, 1, 3)] - bound_box[:,0,None]
+	return np.prod(np.linalg.norm(edges, axis = 2), axis = 1)
+def getMatrixWorldArray(objects) :
+	"""
+	Fetches the world matrices of a list of blender objects as an array (N x 4 x 4).
+	"""
+	return np.array([object.matrix_world for object in objects], dtype=np.float64).reshape((-1, 4, 4))
+def setMatrixWorldArray(objects, matrices) :
+	"""
+	Assigns the world matrices (N x 4 x 4) to the list of blender objects.
+	"""
+	for object, matrix in zip(objects, matrices.tolist()) :
+		object.matrix_world = Matrix(matrix)
+
 def generate_BVH(target_ob, depsgraph, bias = 0.00001) :
 	"""
 	Generate a bvh from a mesh object
 	"""
-	#Can't create from object, transformation not applied
-	bmesh = createBmesh(target_ob, target_ob.matrix_world, True, depsgraph, True)
-	bvh = bvhtree.BVHTree.FromBMesh(bmesh, epsilon = bias)
-	bmesh.free()
-	return bvh
+	#Can't create from object, transformation not applied. Build from the loop triangles, polygon indices equals loop triangle indices
+	mesh = MeshArrays.from_object(target_ob, depsgraph, target_ob.matrix_world, False)
+	return bvhtree.BVHTree.FromPolygons(mesh.vert_co.tolist(), mesh.tri_vert.tolist(), all_triangles = True, epsilon = bias)
 
 def if_scaleInversedFlipNormals(bmesh, scaleVec) :
 	"""
@@ -103,7 +125,7 @@ def createBmesh(ob = None, matrix = None, triangulate = False, depsgraph = None,
 	ob: 			Object to create the bmesh from (should be type = 'Mesh')
 	matrix:			Transformation matrix applied to the verts, if None verts originates from origo (Default: None)
 	triangulate:	True if the mesh faces should be triangulated (Default: False)
-	depsgraph:		Depsgraph related to the object, required if modifiers are applied (Default: None)
+	depsgraph:		Depsgraph (scene in 2.79) related to the object, required if modifiers are applied (Default: None)
 	applyModifier:	True if modifiers should be applied to the mesh, depsgraph req.? (Default: False)
 	Return:			A bmesh object, if no mesh object sent it is empty.
 	"""
@@ -128,6 +150,27 @@ def createBmesh(ob = None, matrix = None, triangulate = False, depsgraph = None,
 		bm.faces.ensure_lookup_table()
 
 	return bm
+def getVertexCoords(mesh, matrix = None) :
+	"""
+	Fetch the vertex coordinates of a mesh as a float32 array (N x 3).
+	mesh:	Mesh data to read from
+	matrix:	Transformation matrix applied to the coordinates (Default: None)
+	"""
+	co = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+	mesh.vertices.foreach_get('co', co)
+	co = co.reshape((-1, 3))
+	if matrix is not None :
+		mat = np.array(matrix, dtype=np.float32)
+		co = co @ mat[:3,:3].T
+		if len(mat) > 3 :
+			co += mat[:3,3]
+	return co
+def findMinMax(mesh, matrix = None) :
+	"""
+	Find the minimum and maximum point in the mesh data, reduced over the coordinate array of getVertexCoords().
+	Returns (min, max) vectors, zero vectors if the mesh has no vertices
+	"""
+	return findMinMaxArray(getVertexCoords(mesh, matrix))
 def copyMeshObject(ob, context, obTag = "_Copy", meshTag = "_CopyMesh"):
 	"""
 	Create a new mesh object by copying the specified object. If input object is not a mesh a
@@ -145,7 +188,7 @@ def copyMeshObject(ob, context, obTag = "_Copy", meshTag = "_CopyMesh"):
 	newOb.data.name = ob.name + meshTag
 	# Link object to the scene
 	if context is not None:
-		context.scene.collection.objects.link(newOb)
+		link_object(context.scene, newOb)
 	return newOb
 #end copyObject()
 def createEmptyMesh(name, context, obTag, meshTag):
@@ -182,11 +225,11 @@ def createEmptyMeshCopy(ob, context, obTag = "_Copy", meshTag = "_CopyMesh", cop
 		return newOb
 	# Link object to the scene
 	if context is not None:
-		context.scene.collection.objects.link(newOb)
+		link_object(context.scene, newOb)
 	#Copy modifiers:
 	bpy.ops.object.select_all(action='DESELECT')
-	bpy.context.view_layer.objects.active = ob
-	newOb.select_set(True)
+	set_active(bpy.context, ob)
+	select_set(newOb, True)
 	bpy.ops.object.make_links_data(type='MODIFIERS')
 	return newOb
 
@@ -203,7 +246,7 @@ def createMesh(bmesh, scene = None, matrix = None, name = "Object") :
 		newOb.matrix_world = matrix
 	#Link to scene
 	if scene is not None :
-		scene.objects.link(newOb)
+		link_object(scene, newOb)
 	#Set bmesh
 	bmesh.normal_update()
 	bmesh.to_mesh(newOb.data)
@@ -230,7 +273,43 @@ def setNamedMesh(bmesh, object_name, scene = None, matrix = None) :
 		bmesh.to_mesh(ob.data)
 		return ob
 	except :
-		return createMesh(bmesh, scene, object_name)
+		return createMesh(bmesh, scene, matrix, object_name)
+
+def setMeshCoords(mesh, co, select = None) :
+	""" Update the vertex coordinates of a mesh with unchanged topology, without a bmesh round-trip.
+	mesh:	Mesh data to update
+	co:		Array (N x 3) of vertex coordinates
+	select:	Bool array (N) of vertex selection, selection is flushed to edges and faces (Default: None)
+	"""
+	mesh.vertices.foreach_set('co', np.ascontiguousarray(co, dtype=np.float32).ravel())
+	if select is not None :
+		mesh.vertices.foreach_set('select', select)
+		#Flush selection, an edge or face is selected if all it's verts are:
+		edge_verts = np.empty(len(mesh.edges) * 2, dtype=np.int32)
+		mesh.edges.foreach_get('vertices', edge_verts)
+		mesh.edges.foreach_set('select', select[edge_verts].reshape((-1, 2)).all(axis = 1))
+		if len(mesh.polygons) > 0 :
+			loop_verts = np.empty(len(mesh.loops), dtype=np.int32)
+			mesh.loops.foreach_get('vertex_index', loop_verts)
+			loop_start = np.empty(len(mesh.polygons), dtype=np.int32)
+			mesh.polygons.foreach_get('loop_start', loop_start)
+			mesh.polygons.foreach_set('select', np.logical_and.reduceat(select[loop_verts], loop_start))
+	#Normals are not recalculated by writing the positions, smooth shading would otherwise use the old normals:
+	calc_normals(mesh)
+	mesh.update()
+def setNamedMeshCoords(co, select, object_name, matrix = None) :
+	""" Update the vertex coordinates of a mesh from the object name
+	Returns: The object or None if not found
+	"""
+	try :
+		ob = getObject(object_name)
+	except KeyError :
+		return None
+	#Before setting mesh data assign matrix:
+	if matrix is not None :
+		ob.matrix_world = matrix
+	setMeshCoords(ob.data, co, select)
+	return ob
 
 def verify_list(object) :
 	""" Creates a list of a object
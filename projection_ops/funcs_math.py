@@ -1,8 +1,10 @@
 
 import sys
+import numpy as np
 
 from math import *
 from mathutils import *
+from .core.tri import minMaxArray
 
 #Define pi
 pi = 3.14159265359
@@ -36,51 +38,13 @@ def lerpVector(vec0, vec1, amount) :
 	"""
 	return vec0 + (vec1 - vec0) * amount 
 
-def findMinMax(mesh) :
+def findMinMaxArray(co) :
 	"""	
-	Find the minimum and maximum point in the mesh
-	Returns (min, max)
-	"""
-	vMin = Vector((sys.float_info.max, sys.float_info.max, sys.float_info.max))
-	vMax = Vector((-sys.float_info.max, -sys.float_info.max, -sys.float_info.max))
-	for vert in mesh.verts:
-		vMin = minVec(vert.co, vMin)
-		vMax = maxVec(vert.co, vMax)
-	return (vMin, vMax)
-		
-def minVec(v0, v1) :
-	"""	Compare and return the minimal vector combination:
-	"""
-	vLen = min(len(v0), len(v1))
-	v = Vector((0,)*vLen)
-	for i in range(vLen) :
-		v[i] = min(v0[i], v1[i])
-	return v
-def minVec_x3(v0, v1, v2) :
-	"""	Compare and return the minimal vector combination:
-	"""
-	vLen = min(len(v0), len(v1), len(v2))
-	v = Vector((0,)*vLen)
-	for i in range(vLen) :
-		v[i] = min(v0[i], v1[i], v2[i])
-	return v
-
-def maxVec(v0, v1) :
-	"""	Compare and return the maximal vector combination:
-	"""
-	vLen = min(len(v0), len(v1))
-	v = Vector((0,)*vLen)
-	for i in range(vLen) :
-		v[i] = max(v0[i], v1[i])
-	return v
-def maxVec_x3(v0, v1, v2) :
-	"""	Compare and return the maximal vector combination:
-	"""
-	vLen = min(len(v0), len(v1), len(v2))
-	v = Vector((0,)*vLen)
-	for i in range(vLen) :
-		v[i] = max(v0[i], v1[i], v2[i])
-	return v
+	Find the minimum and maximum point in an array of coordinates (N x 3)
+	Returns (min, max) vectors, zero vectors if the array is empty
+	"""
+	(vMin, vMax) = minMaxArray(co)
+	return (Vector(vMin), Vector(vMax))
 	
 def rotateVec2(vec, angle) :
 	"""	Rotate CCW by angle
@@ -1,9 +1,15 @@
 import sys
+import numpy as np
 from math import *
 from mathutils import *
 
+from .core.tri import *
+
 class TriBias :
-	bias = 0.00001
+	"""
+	Default intersection bias, functions take the bias as an argument so it is never modified globally.
+	"""
+	bias = TRI_BIAS
 
 def averageTexCoord(triFace, uvw, uv_lay) :
 	""" Calculates the Texture UV coordinates from the specified barycentric coords
@@ -54,11 +60,15 @@ def pointInTriangle(point, p0,p1,p2) :
 	u = 1.0 - v - w
 	return (u > 0 and v > 0 and w > 0, u,v,w)
 
-def rayTriIntersection(origin, dir, mTri):
+def rayTriIntersection(origin, dir, mTri, bias = TriBias.bias):
 	"""
-	Calculates if a ray intersects the triangle and returns the barycentric coordinates:
-	#(func not verified)
-	#origin
+	Calculates if a ray intersects the triangle (Moller-Trumbore), see rayTriIntersectionArray for the batched version.
+	Edges are inclusive within the bias so rays hitting an edge shared by two triangles intersect both.
+	origin:	Ray origin
+	dir:	Ray direction, the distance is returned in the length of dir
+	mTri:	Triangulated bmesh face
+	bias:	Intersection bias
+	Returns: None if no intersection, otherwise a touple with the distance and the barycentric coordinates of the triangle verts.
 	"""
 	p0 = mTri.verts[0].co
 	e1 = mTri.verts[1].co - p0
@@ -67,33 +77,37 @@ def rayTriIntersection(origin, dir, mTri):
 	q = dir.cross(e2)
 	#Find the squared area of the triangle:
 	a = e1.dot(q)
-	#Avoid division by 0, triangles without area
-	if a > -TriBias.bias and a < TriBias.bias :
+	#Avoid division by 0, triangles without area or parallel to the ray
+	if a > -bias and a < bias :
 		return None
 	#Pre-divide the area, the u,v area calculations can then be multiplied to find the area partition
 	f = 1 / a
 	s = origin - p0
 	#Calculate the barycentric coordinate by calculating the squared area of u
 	u = f * s.dot(q)
-	if u < 0 :
+	if u < -bias :
 		return None #No intersection!
 	#Calculate v partition
 	r = s.cross(e1)
-	v = f * d.dot(r)
-	if v < 0 or u + v > 1 :
+	v = f * dir.dot(r)
+	if v < -bias or u + v > 1 + bias :
 		return None #No intersection!
+	#Intersection distance, intersections behind the origin are ignored:
+	t = f * e2.dot(r)
+	if t < 0 :
+		return None
 	#Find w, since u and v are signed inward the area they represented is inside the triangle
 	#Thus w can be found by subtraction:
 	w = 1 - u - v
-	#Intersection distance:
-	t = f * e2.dot(r)
-	return (t, Vector(u,v,w))
+	#u, v are the weights of the second and third vert:
+	return (t, Vector((w,u,v)))
 	
-def calculateBarycentricCoord2D(v0,v1,v2, point) :
+def calculateBarycentricCoord2D(v0,v1,v2, point, bias = TriBias.bias) :
 	"""
 	Calculates the barycentric coordinates from a triangle in 2D space
 	v0,v1,v2:	The three points of the triangle
 	point:		The point that should be tested with the triangle
+	bias:		Triangles with a smaller (doubled) area are treated as degenerate
 	Return: Touple with bool if point is inside triangle, then vector containing the uvw barycentric coordinates.
 	"""
 	e0 = v1-v0
@@ -101,7 +115,7 @@ def calculateBarycentricCoord2D(v0,v1,v2, point) :
 	e2 = point - v0
 	
 	d = (e0.x * e1.y - e1.x * e0.y)
-	if  d > -TriBias.bias and d < TriBias.bias :
+	if  d > -bias and d < bias :
 		return (False, Vector((0,)*3))
 	d = 1 / d
 	v = (e2.x * e1.y - e1.x * e2.y) * d
@@ -142,7 +156,7 @@ def separatingTriAxis2D(tri_a0, tri_a1, tri_p, pList) :
 	
 	#Calculate the segment on the axis the points overlap
 	pp_min = sys.float_info.max
-	pp_max = sys.float_info.min
+	pp_max = -sys.float_info.max
 	for p in pList :
 		proj = axis.dot(p)
 		pp =  proj * dot_inv #Project point distance on axis: squared length
@@ -159,13 +173,11 @@ def	collideTriAARect2D(p0, p1, p2, rectMin, rectMax) :
 	rectMin:	Point defining the min point in the rectangle
 	rectMax:	Point defining the max point in the rectangle
 	"""
-	minT = minVec(p0, p1,p2)
-	maxT = maxVec(p0,p1,p2)
 	#If the vectors projected on the X axis do not overlap we have no collision:
-	if not (rectMin.x <= maxT.x and rectMax.x >= minT.x) :
+	if not (rectMin.x <= max(p0.x, p1.x, p2.x) and rectMax.x >= min(p0.x, p1.x, p2.x)) :
 		return False;
 	#If the vectors projected on the Y axis do not overlap we have no collision:
-	if not (rectMin.y <= maxT.y and rectMax.y >= minT.y) :
+	if not (rectMin.y <= max(p0.y, p1.y, p2.y) and rectMax.y >= min(p0.y, p1.y, p2.y)) :
 		return False;
 
 	#Create a set of points from the four corners of the rectangle:
@@ -0,0 +1,280 @@
+#  lazy_ops.py (c) 2016 Mattias Fredriksson
+#
+# ##### BEGIN GPL LICENSE BLOCK #####
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+# ##### END GPL LICENSE BLOCK #####
+
+import bpy, sys, importlib
+
+from bpy.props import * #Property objects
+from bpy.app.handlers import persistent
+from .compat import make_annotations, update_handlers
+
+#Class attributes not copied from the implementation class
+IMPL_EXCLUDE = {'__module__', '__qualname__', '__doc__', '__dict__', '__weakref__', '__init__'}
+
+def load_implementation(cls) :
+	"""
+	Import the module implementing a registered operator and copy the implementation onto the operator class.
+	Heavy modules (numpy kernels, projection engine, partition grids) are first imported here instead of when the add-on loads.
+	cls:	Registered operator class with the impl_module attribute naming the implementing package module
+	"""
+	module = importlib.import_module('.' + cls.impl_module, __package__)
+	impl = getattr(module, cls.__name__)
+	#Base classes first so methods overridden by the implementation subclass replace them
+	for base in reversed(impl.__mro__[:-1]) :
+		for name, value in vars(base).items() :
+			if name not in IMPL_EXCLUDE :
+				setattr(cls, name, value)
+#end load_implementation()
+
+#Operator callbacks replaced by the implementation on first call. Blender validates the callback arguments so each is declared explicitly.
+def lazy_invoke(self, context, event) :
+	load_implementation(type(self))
+	return self.invoke(context, event)
+def lazy_execute(self, context) :
+	load_implementation(type(self))
+	return self.execute(context)
+def lazy_modal(self, context, event) :
+	load_implementation(type(self))
+	return self.modal(context, event)
+
+def snap_uv_tile(self, context) :
+	"""
+	Update callback of the uv_tile property, UDIM tiles start at 1001 and lower values are snapped to 0 (keep the found tile).
+	"""
+	if 0 < self.uv_tile < 1001 :
+		self.uv_tile = 0
+
+class UVProjectProperties :
+	"""
+	Properties shared by the uv projection operators. Blender only collects properties from base classes that are not
+	registered types, the operators inherit the properties from this class rather than from each other.
+	"""
+	proj_type_enum = [
+		("AXISALIGNED", "Axis Aligned", "The mesh axis with smallest angle toward the camera will be placed up on the projection surface", 1),
+		("CAMERA", "Camera View", "The mesh will be projected onto the surface using the camera axis as up. Depth is relative to the furthest and closest point to the camera", 2),
+		("ZISUP", "Z is Up", "Mesh will be placed on the surface with the Z axis pointing up", 3),
+		]
+
+	proj_type = EnumProperty(items=proj_type_enum,
+			name = "Surface Alignment",
+            description="Determines how the mesh will be aligned on the surface. Alignment primarily defines the mesh axis pointing up/away from the surface. It also affects how the mesh will be rotated around the axis and how the target area is determined for the projection",)
+	smooth = BoolProperty(name = "Smooth",
+            description="If the mesh placed on the surface will be smoothly bent around edges",
+			default=True)
+	keepRelative = BoolProperty(name = "Keep Relative Scale",
+            description="Scales the surface mapping to the same size ratio of the projected mesh",
+			default=False)
+	scalar = FloatProperty(name="Scale",
+            description="Scale the projected mesh (and the mapped UV area) on the surface",
+            default=1,  soft_min= 0.01, soft_max=10, step=2, precision=2)
+	depthAdd = FloatProperty(name="Surface Offset",
+            description="Move the projection closer/away from target surface by a fixed amount",
+            default=0, min=-sys.float_info.max, max=sys.float_info.max, step=1)
+	moveXY = FloatVectorProperty(name="Move",
+			description="Move the mesh over the surface by moving the mapped UV area along the UV coordinates",
+			default=(0.0, 0.0), size=2, step=1, precision=4)
+	rotation = FloatProperty(name="Rotate",
+            description="Rotate the mesh on the surface by rotating the mapped UV area",
+            default=0, min=-sys.float_info.max, max=sys.float_info.max, step=8)
+	scalarXYZ = FloatVectorProperty(name="Scale Separated",
+			description="Scale each X,Y surface mapping component separately or scale mesh Z axis",
+			default=(1.0, 1.0, 1.0), soft_min= 0.01, soft_max=10, size=3, step=2)
+	uv_tile = IntProperty(name="UDIM Tile",
+            description="Move the mapped UV area into the UDIM tile (1001, 1002...), 0 keeps the tile the mesh center is projected onto",
+            default=0, min=0, max=1100, update=snap_uv_tile)
+	auto_partition = BoolProperty(name = "Auto Partitions",
+            description="Fit the number of partitions the uv map is divided in to the uv triangle area distribution, targeting the number of faces per partition",
+			default=True)
+	occupancy = FloatProperty(name="Faces per Partition",
+            description="Target mean number of faces in each uv partition when partitions are fitted automatically. Lower value increases invoke stage but execute (updates) runs faster",
+            default=4, min=1.1, max=64, step=50)
+	partitions_per_face = FloatProperty(name="Partitions per face",
+            description="Used if Auto Partitions is disabled. Higher value increases invoke stage but execute (updates) runs faster. Higher value increases the numbers of partitions the uv map will be divided in",
+            default=0.5, min=0.1, max=20, step=100)
+	disk_cache = BoolProperty(name = "Disk Cache",
+            description="Store the target acceleration data next to the .blend file (or in the temp directory) and reuse it in later sessions if the target is unchanged",
+			default=False)
+	biasValue = FloatProperty(name="Intersection Bias",
+            description="Error marginal for intersection tests, can solve intersection problems",
+            default=0.00001, min=0.00001, max=1, step=1)
+	workers = IntProperty(name="Threads",
+            description="Number of threads projecting the selected meshes in parallel, 0 uses one thread per processor. Only useful when projecting many meshes",
+            default=1, min=0, max=64)
+	chunk_size = IntProperty(name="Chunk Size",
+            description="Number of vertices projected in each chunk, lower value reduces the peak memory when projecting very large meshes",
+            default=65536, min=1024, max=16777216)
+	printExecTime = BoolProperty(name = "Print Execution Time",
+            description="Prints execution time to the information panel, mutes warning in the last report panel",
+			default=False)
+
+class MESH_OT_UVProjectMesh(UVProjectProperties, bpy.types.Operator):
+	bl_idname = "mesh.project_onto_uvmapped_mesh"
+	bl_label = "Project Mesh onto UV Surface"
+	bl_info = "Projects a selected mesh object(s) onto the surface of the active mesh, fitting the mesh on the UV map of the target"
+	bl_options = {'REGISTER', 'UNDO'}
+
+	impl_module = 'uv_project'
+	invoke = lazy_invoke
+	execute = lazy_execute
+
+class MESH_OT_UVProjectMeshModal(UVProjectProperties, bpy.types.Operator):
+	bl_idname = "mesh.project_onto_uvmapped_mesh_modal"
+	bl_label = "Project Mesh onto UV Surface (Interactive)"
+	bl_info = "Interactively place the selected mesh object(s) on the surface of the active mesh by dragging the mapped UV area"
+	bl_options = {'REGISTER', 'UNDO', 'BLOCKING'}
+
+	preview_verts = IntProperty(name="Preview Vertices",
+            description="Maximum number of vertices in each mesh projected while dragging, the full mesh is projected when the mouse rests or the placement is confirmed",
+            default=2000, min=100, max=1000000)
+	refine_delay = FloatProperty(name="Refine Delay",
+            description="Seconds the mouse must rest before the full mesh is projected",
+            default=0.3, min=0.0, max=10, step=10)
+
+	impl_module = 'uv_project'
+	invoke = lazy_invoke
+	execute = lazy_execute
+	modal = lazy_modal
+
+class MESH_OT_ProjectMesh(bpy.types.Operator):
+	bl_idname = "mesh.project_onto_selected_mesh"
+	bl_label = "Project Mesh(es) onto Active"
+	bl_info = "Projects selected mesh(es) onto the active selected mesh"
+	bl_options = {'REGISTER', 'UNDO'}
+
+	depth_axis_enum = [
+		("Z", "Z", "The object's positive Z orientation axis will be used.", 0),
+		("Y", "Y", "The object's positive Y orientation axis will be used.", 1),
+		("X", "X", "The object's positive X orientation axis will be used.", 2),
+		("CAMERA", "View", "The camera forward axis determines the offset from the surface.", 3),
+		("CLOSEST", "Closest Axis", "The object's axis with the least angle to the camera view direction will determine the surface offset.", 4),
+		]
+	largest_obj_enum = [
+		("VOLUME", "Volume", "Parent is determined by the object with the largest bounding box volume.", 1),
+		("VERTCOUNT", "Vertex Count", "Parent is determined by the object with the most vertices.", 2),
+		("SINGLE", "Individual", "Each object is treated individually, and does not relate to the other objects.", 3)
+		]
+
+	depth_axis = EnumProperty(items=depth_axis_enum,
+			name = "Axis",
+            description="Select the axis defining the distance vertices will be placed from the surface. Each vertex will be placed at the same offset, from the surface, as the distance from the vertex to the furthest vertex on the axis. Using an object's orientation axis is useful to get a better fit on the surface, if vertices are oriented accordingly (the object has a 'floor' of coplanar vertices orthogonal to the axis). If multiple object's are selected, the axis is defined by the parent object",
+			default = 'CLOSEST',)
+	largest_obj = EnumProperty(items=largest_obj_enum,
+			name = "Selection Parent",
+            description="Determines how selected objects relate to each other, if selection should be projected as a group, select relevant parent function. Children will be projected relative to the parent object defined by the parent function",
+			default = 'SINGLE',)
+	depthOffset = FloatProperty(name="Surface Offset",
+            description="Move the projection closer/away from target surface by a fixed amount (along neg. view forward axis)",
+            default=0, min=-sys.float_info.max, max=sys.float_info.max, step=1)
+	bias = FloatProperty(name="Intersection Epsilon",
+            description="Error marginal for intersection tests, can solve intersection problems where vertices are projected through edges",
+            default=0.00001, min=0.00001, max=1, step=1, precision=4)
+
+	impl_module = 'project'
+	invoke = lazy_invoke
+	execute = lazy_execute
+
+class MESH_OT_MirrorMesh(bpy.types.Operator):
+	bl_idname = "mesh.mirror_mesh_along_normals"
+	bl_label = "Mirror Mesh over Defined Surface"
+	bl_info = "Mirrors selected mesh(es) along the surface normals of the active mesh"
+	bl_options = {'REGISTER', 'UNDO'}
+
+
+	mirrorSmooth = BoolProperty(name = "Smoothed",
+            description="If vertices will be mirrored smoothly over the mirror surface, if un-checked, each vertex will be reflected over the plane defined by the face used to mirror it in the mirror surface",
+			default=True)
+	cullBackfaces = BoolProperty(name = "No Backface Intersection",
+            description="Vertices will no longer be reflected along face normals 'facing away' from the vertex",
+			default=False)
+	onlyIntersectingVert = BoolProperty(name = "Intersecting verts only",
+            description="Mirror only vertices intersecting the mirror mesh. A vertex must project inside the area of triangulated face or will otherwise remain at it's current position",
+			default=True)
+	intersectClosest = BoolProperty(name = "(Expensive) Closest Intersection",
+            description="Force each vertex to be mirrored on the closest intersecting face, the option can solve problems where vertex projections intersect multiple faces. Closest face will be selected at the cost of not using acceleration algorithms",
+			default=False)
+	biasValue = FloatProperty(name="Intersection Bias",
+            description="Error marginal for intersection tests, can solve intersection problems",
+            default=0.00001, min=0.00001, max=1)
+
+	impl_module = 'mesh_mirror_script'
+	execute = lazy_execute
+
+class MESH_OT_AlignSelection(bpy.types.Operator):
+	bl_idname = "mesh.align_selection_view"
+	bl_label = "Align Selection to View"
+	bl_info = "Aligns the mesh rotation to the current view"
+	bl_options = {'REGISTER', 'UNDO'}
+
+
+	rot_type_enum = [
+		("Z", "Z", "Selection will be rotated so the Z axis is facing the camera", 0),
+		("Y", "Y", "Selection will be rotated so the Y axis is facing the camera", 1),
+		("X", "X", "Selection will be rotated so the X axis is facing the camera", 2),
+		("AXISALIGNED", "Axis Aligned", "Selection's XYZ axis will be aligned with the closest camera axis", 3),
+		("CLOSEST", "Closest", "Selection will be rotated so that the closest axis to the camera will face it", 4),
+		]
+	parent_obj_enum = [
+		("VERTCOUNT", "Vertex Count", "Use the object with the most vertices", 0),
+		("VOLUME", "Volume", "Use the object with largest bounding box", 1),
+		("ACTIVE", "Active", "Use the active object as the parent", 2),
+		]
+	rot_type = EnumProperty(items=rot_type_enum,
+			name = "Alignment",
+            description="Determines the axis of the parent object that will be aligned to the camera view",
+			default = 'CLOSEST',)
+	parent_obj = EnumProperty(items=parent_obj_enum,
+			name = "Selection Parent",
+            description="Method for determining the selected object that will be treated as the parent object",
+			default = 'ACTIVE',)
+	exclude_active = BoolProperty(name = "Exclude active object",
+            description="Exclude the active object from selection, and disallows it from parenting the selection (useful if it's a projection target selection)",
+			default=False)
+
+	impl_module = 'align_to_view'
+	invoke = lazy_invoke
+	execute = lazy_execute
+
+#List of operator classes in the package
+operators = [MESH_OT_UVProjectMesh, MESH_OT_UVProjectMeshModal, MESH_OT_ProjectMesh, MESH_OT_MirrorMesh, MESH_OT_AlignSelection]
+#Properties are assigned in the class bodies (2.79), declare them as annotations in 2.8
+make_annotations(UVProjectProperties)
+for op in operators :
+	make_annotations(op)
+
+@persistent
+def depsgraph_update_handler(scene, *depsgraph) :
+	"""
+	Invalidate cached target data of objects with changed geometry or transform.
+	The cache module is imported by the first projection, nothing is cached before it is loaded.
+	"""
+	cache = sys.modules.get(__package__ + '.target_cache')
+	if cache is not None :
+		cache.invalidate_updated(scene, *depsgraph)
+
+def register_handlers() :
+	handlers = update_handlers()
+	if depsgraph_update_handler not in handlers :
+		handlers.append(depsgraph_update_handler)
+def unregister_handlers() :
+	handlers = update_handlers()
+	if depsgraph_update_handler in handlers :
+		handlers.remove(depsgraph_update_handler)
+	#Cached data can't be invalidated without the handler
+	cache = sys.modules.get(__package__ + '.target_cache')
+	if cache is not None :
+		cache.target_cache.clear()
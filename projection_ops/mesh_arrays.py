@@ -0,0 +1,156 @@
+#  mesh_arrays.py (c) 2016 Mattias Fredriksson
+#
+# ##### BEGIN GPL LICENSE BLOCK #####
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+# ##### END GPL LICENSE BLOCK #####
+
+import bpy, bmesh
+import numpy as np
+
+from .compat import *
+
+class MeshArrays :
+	"""
+	Read-only array copy of a mesh: vertex positions and normals (V x 3), the loop triangles (T x 3) as vertex, loop and polygon
+	indices, triangle normals (T x 3) and the active uv layer (L x 2). Arrays are read with foreach_get into preallocated
+	buffers and the transform is applied with a single matrix multiply, no BMesh is created (except in 2.79, see tessellate_loop_triangles()).
+	"""
+	def __init__(self, vert_co, vert_no, tri_vert, tri_loop, tri_poly, tri_normal, loop_uv = None, uv_name = None) :
+		self.vert_co = vert_co
+		self.vert_no = vert_no
+		self.tri_vert = tri_vert
+		self.tri_loop = tri_loop
+		self.tri_poly = tri_poly
+		self.tri_normal = tri_normal
+		self.loop_uv = loop_uv
+		self.uv_name = uv_name
+
+	def from_mesh(mesh, matrix = None, uv = True) :
+		"""
+		Construction function reading the arrays from mesh data.
+		mesh:	Mesh data to read
+		matrix:	Transformation matrix applied to positions and normals (Default: None)
+		uv:		If the active uv layer should be read (Default: True)
+		"""
+		num_vert = len(mesh.vertices)
+		vert_co = np.empty(num_vert * 3, dtype=np.float32)
+		mesh.vertices.foreach_get('co', vert_co)
+		vert_no = np.empty(num_vert * 3, dtype=np.float32)
+		mesh.vertices.foreach_get('normal', vert_no)
+		vert_co = vert_co.reshape((-1, 3))
+		if API_28 :
+			(tri_vert, tri_loop, tri_poly, tri_normal) = read_loop_triangles(mesh)
+		else :
+			(tri_vert, tri_loop, tri_poly, tri_normal) = tessellate_loop_triangles(mesh, vert_co)
+		loop_uv = None
+		uv_name = None
+		if uv and mesh.uv_layers.active is not None :
+			uv_name = mesh.uv_layers.active.name
+			loop_uv = np.empty(len(mesh.loops) * 2, dtype=np.float32)
+			mesh.uv_layers.active.data.foreach_get('uv', loop_uv)
+			loop_uv = loop_uv.reshape((-1, 2))
+		arrays = MeshArrays(vert_co, vert_no.reshape((-1, 3)), tri_vert, tri_loop, tri_poly, tri_normal, loop_uv, uv_name)
+		if matrix is not None :
+			arrays.transform(matrix)
+		return arrays
+
+	def from_object(object, depsgraph = None, matrix = None, uv = True) :
+		"""
+		Construction function reading the arrays from a mesh object.
+		object:		Mesh object to read
+		depsgraph:	Depsgraph (scene in 2.79) the object is evaluated in, modifiers are applied if specified (Default: None)
+		Remaining arguments are passed to from_mesh.
+		"""
+		if depsgraph is None :
+			return MeshArrays.from_mesh(object.data, matrix, uv)
+		mesh = evaluated_mesh(object, depsgraph)
+		try :
+			return MeshArrays.from_mesh(mesh, matrix, uv)
+		finally :
+			clear_evaluated_mesh(object, depsgraph, mesh)
+
+	def transform(self, matrix) :
+		"""
+		Transform the positions and normals with the 4x4 (or 3x3) matrix.
+		Normals are transformed with the cofactor matrix so they remain perpendicular to the surface under non-uniform scale
+		and follow the flipped triangle winding under negative scale, equal to recalculating them from the transformed positions.
+		"""
+		mat = np.array(matrix, dtype=np.float64)
+		rot = mat[:3,:3]
+		self.vert_co = (self.vert_co @ rot.T).astype(np.float32)
+		if len(mat) > 3 :
+			self.vert_co += mat[:3,3].astype(np.float32)
+		cofactor = (np.linalg.inv(rot).T * np.linalg.det(rot)).astype(np.float32)
+		self.vert_no = normalize_rows(self.vert_no @ cofactor.T)
+		self.tri_normal = normalize_rows(self.tri_normal @ cofactor.T)
+
+	def tri_co(self) :
+		"""
+		Corner positions of each loop triangle (T x 3 x 3)
+		"""
+		return self.vert_co[self.tri_vert]
+	def tri_no(self) :
+		"""
+		Corner vertex normals of each loop triangle (T x 3 x 3)
+		"""
+		return self.vert_no[self.tri_vert]
+	def tri_uv(self) :
+		"""
+		Uv coordinates of each loop triangle corner (T x 3 x 2) or None if no uv layer was read
+		"""
+		if self.loop_uv is None :
+			return None
+		return self.loop_uv[self.tri_loop]
+
+def read_loop_triangles(mesh) :
+	"""
+	Read the mesh loop triangles as vertex and loop index (T x 3), polygon index (T) and normal (T x 3) arrays.
+	"""
+	mesh.calc_loop_triangles()
+	num_tri = len(mesh.loop_triangles)
+	tri_vert = np.empty(num_tri * 3, dtype=np.int32)
+	mesh.loop_triangles.foreach_get('vertices', tri_vert)
+	tri_loop = np.empty(num_tri * 3, dtype=np.int32)
+	mesh.loop_triangles.foreach_get('loops', tri_loop)
+	tri_poly = np.empty(num_tri, dtype=np.int32)
+	mesh.loop_triangles.foreach_get('polygon_index', tri_poly)
+	tri_normal = np.empty(num_tri * 3, dtype=np.float32)
+	mesh.loop_triangles.foreach_get('normal', tri_normal)
+	return (tri_vert.reshape((-1, 3)), tri_loop.reshape((-1, 3)), tri_poly, tri_normal.reshape((-1, 3)))
+
+def tessellate_loop_triangles(mesh, vert_co) :
+	"""
+	Fallback for read_loop_triangles() in 2.79 where meshes have no loop triangles. The polygons are triangulated with the
+	bmesh tessellation (same triangulation as the 2.8 loop triangles) and the triangle normals are calculated from the corners.
+	vert_co:	Vertex positions (V x 3) of the mesh
+	"""
+	bm = bmesh.new()
+	bm.from_mesh(mesh)
+	tess = bm.calc_tessface()
+	tri_vert = np.array([[loop.vert.index for loop in tri] for tri in tess], dtype=np.int32).reshape((-1, 3))
+	tri_loop = np.array([[loop.index for loop in tri] for tri in tess], dtype=np.int32).reshape((-1, 3))
+	tri_poly = np.array([tri[0].face.index for tri in tess], dtype=np.int32)
+	bm.free()
+	tri_co = vert_co[tri_vert]
+	tri_normal = normalize_rows(np.cross(tri_co[:,1] - tri_co[:,0], tri_co[:,2] - tri_co[:,0]))
+	return (tri_vert, tri_loop, tri_poly, tri_normal)
+
+def normalize_rows(vec) :
+	"""
+	Normalize each row vector of the array, zero vectors are kept.
+	"""
+	length = np.linalg.norm(vec, axis = 1)
+	return vec / np.where(length > 0, length, 1)[:,None]
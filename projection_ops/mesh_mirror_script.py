@@ -19,37 +19,22 @@
 
 
 import bpy, mathutils, bmesh, time
+import numpy as np
 
 from .funcs_blender import *
+from .compat import *
+from .mesh_arrays import *
+from .core.tri import *
 from queue import Queue
-from bpy.props import *
 from math import *
 
 
 largeFloat = 10000000
 
-class MESH_OT_MirrorMesh(bpy.types.Operator):
-	bl_idname = "mesh.mirror_mesh_along_normals"
-	bl_label = "Mirror Mesh over Defined Surface"
-	bl_info = "Mirrors selected mesh(es) along the surface normals of the active mesh"
-	bl_options = {'REGISTER', 'UNDO'}
-
-
-	mirrorSmooth: BoolProperty(name = "Smoothed",
-            description="If vertices will be mirrored smoothly over the mirror surface, if un-checked, each vertex will be reflected over the plane defined by the face used to mirror it in the mirror surface",
-			default=True)
-	cullBackfaces: BoolProperty(name = "No Backface Intersection",
-            description="Vertices will no longer be reflected along face normals 'facing away' from the vertex",
-			default=False)
-	onlyIntersectingVert: BoolProperty(name = "Intersecting verts only",
-            description="Mirror only vertices intersecting the mirror mesh. A vertex must project inside the area of triangulated face or will otherwise remain at it's current position",
-			default=True)
-	intersectClosest: BoolProperty(name = "(Expensive) Closest Intersection",
-            description="Force each vertex to be mirrored on the closest intersecting face, the option can solve problems where vertex projections intersect multiple faces. Closest face will be selected at the cost of not using acceleration algorithms",
-			default=False)
-	biasValue: FloatProperty(name="Intersection Bias",
-            description="Error marginal for intersection tests, can solve intersection problems",
-            default=0.00001, min=0.00001, max=1)
+class MESH_OT_MirrorMesh :
+	"""
+	Implementation of the lazy_ops.MESH_OT_MirrorMesh operator, copied onto the registered class on first use.
+	"""
 
 	#Shared Values set from the blender settings since functions call them statically as they are not related to the main class object.
 	#May not be the best solution but it works!
@@ -97,13 +82,8 @@ class MESH_OT_MirrorMesh(bpy.types.Operator):
 		if MESH_OT_MirrorMesh.displayExecutionTime :
 			self.report({'INFO'}, "Executing: mirror_mesh_func")
 
-		#Add a temporary modifier to triangulate the faces!
-		tmod = ob_act.modifiers.new(name='tmpTriangulate', type='TRIANGULATE')
-		tmod.quad_method = 'BEAUTY'
-		#Create a bmesh with the modifiers applied and vertices in world space !
-		mMesh = createBmesh(ob_act, ob_act.matrix_world, False, context.evaluated_depsgraph_get(), True)
-		#Clear tmp modifier
-		ob_act.modifiers.remove(tmod)
+		#Read the loop triangles of the mirror with the modifiers applied and vertices in world space !
+		mMesh = MirrorArrays(MeshArrays.from_object(ob_act, evaluated_depsgraph(context), ob_act.matrix_world, False))
 		#List of mirror object generated:
 		generated_mirrors = []
 
@@ -139,9 +119,7 @@ class MESH_OT_MirrorMesh(bpy.types.Operator):
 		# Leave only generated objects selected
 		bpy.ops.object.select_all(action='DESELECT')
 		for ob in generated_mirrors:
-			ob.select_set(True)
-		#
-		mMesh.free()
+			select_set(ob, True)
 		if MESH_OT_MirrorMesh.displayExecutionTime :
 			self.report({'INFO'}, "Finished, execution time: %.2f seconds ---" % (time.time() - start_time))
 		return {'FINISHED'}
@@ -151,19 +129,26 @@ class MESH_OT_MirrorMesh(bpy.types.Operator):
 		#create a our search data array
 		searchData = [SearchData() for i in range(len(mesh.verts))]
 
-		#loop through each vert in the
-		for i in range(len(searchData)):
-			if searchData[i].notMirrored():
-				#loop through every triangle in the mirror mesh and find the closest "triangle plane" that intersects
-				MESH_OT_MirrorMesh.findClosestTri(mesh.verts[i], mirrorMesh, searchData)
+		if MESH_OT_MirrorMesh.closestOnly :
+			#Every vert is tested against the whole mirror mesh, search all verts in batches before mirroring
+			MESH_OT_MirrorMesh.findClosestTris(mesh, mirrorMesh, searchData)
+			for i in range(len(searchData)):
 				mData = searchData[i]._mirrorData
-
-				#If we found a intersecting mirror face mirror it!
 				if mData is not None and mData._intersected :
-					#mirror the vertice
 					MESH_OT_MirrorMesh.mirrorVert(mesh.verts[i], mData)
-					#if we do not itterate on every vert, we search closest intersecting in the mirror mesh!
-					if not MESH_OT_MirrorMesh.closestOnly :
+		else :
+			#loop through each vert in the
+			for i in range(len(searchData)):
+				if searchData[i].notMirrored():
+					#test every triangle in the mirror mesh and find the closest "triangle plane" that intersects
+					MESH_OT_MirrorMesh.findClosestTri(mesh.verts[i], mirrorMesh, searchData)
+					mData = searchData[i]._mirrorData
+
+					#If we found a intersecting mirror face mirror it!
+					if mData is not None and mData._intersected :
+						#mirror the vertice
+						MESH_OT_MirrorMesh.mirrorVert(mesh.verts[i], mData)
+						#we search closest intersecting in the mirror mesh only for the first vert, connected verts search from it's face!
 						MESH_OT_MirrorMesh.mirrorConnected(i, mesh, mirrorMesh, searchData)
 
 		#We check if some vertices did not get mirrored
@@ -235,7 +220,7 @@ class MESH_OT_MirrorMesh(bpy.types.Operator):
 					MESH_OT_MirrorMesh.queueConnectedVerts(vert, searchData, vertQueue)
 				elif not MESH_OT_MirrorMesh.onlyIntersecting :
 					#If no intersection we mirror along the last mirror face plane
-					MESH_OT_MirrorMesh.findDistance(vert, lastMData._mirrorTri, searchData)
+					MESH_OT_MirrorMesh.findDistance(vert, lastMData._mirrorTri, mirrorMesh, searchData)
 					mData = searchData[i]._mirrorData
 					#MirrorFlat
 					MESH_OT_MirrorMesh.mirrorVert(vert, mData, True)
@@ -246,76 +231,67 @@ class MESH_OT_MirrorMesh(bpy.types.Operator):
 	def findFirstTri(vert, lastMFace, mirrorMesh, searchData) :
 		#
 		#	Itterates through all faces in the mirror mesh and tests for intersection, first intersecting adjacent face connected to the initial search face is returned
+		#	Faces are tested in rings around the initial face, each ring tested in a single call in the same order the faces were queued
 		#
 
-		faceQueue = Queue()
-		#Tag keep track on what face we have tested / in queue. False for not tested
-		taggedFaces = []
-
+		#Keep track on what face we have tested / in queue.
+		taggedFaces = set([lastMFace])
 		#Start testing from the initial face!
-		lastMFace.tag = True
-		faceQueue.put_nowait(lastMFace)
-		taggedFaces.append(lastMFace)
-
-		while not faceQueue.empty() :
-			face = faceQueue.get_nowait()
-			mDat = MESH_OT_MirrorMesh.triIntersection(vert.co, face)
-			if mDat is not None and mDat._intersected :
-				searchData[vert.index].setMirror(mDat)
+		faceQueue = [lastMFace]
+
+		co = np.array(vert.co)
+		while len(faceQueue) > 0 :
+			(inside, t, uvw) = mirrorMesh.intersect(co, faceQueue)
+			hit = np.flatnonzero(inside)
+			if len(hit) > 0 :
+				i = hit[0]
+				u, v, w = uvw[i]
+				searchData[vert.index].setMirror(MirrorData(mirrorMesh, faceQueue[i], True, float(t[i]), float(u), float(v), float(w)))
 				break #we found an intersecting tri
 			#Queue connected faces
-			MESH_OT_MirrorMesh.queueConnectedFaces(face, mirrorMesh, faceQueue, taggedFaces)
-
-		for f in taggedFaces :
-			f.tag = False
+			nextQueue = []
+			for face in faceQueue :
+				MESH_OT_MirrorMesh.queueConnectedFaces(face, mirrorMesh, nextQueue, taggedFaces)
+			faceQueue = nextQueue
 
 	def findClosestTri(vert, mirrorMesh, searchData) :
 		#
 		#	Updates the search data with the closest intersecting triangle plane (not closest triangle)
 		#
 
-		#Searches trough each triangle face in the mirror mesh to find the closest plane where the triangle intersects and updates the search data with it!
-		for tri in mirrorMesh.faces :
-			mDat = MESH_OT_MirrorMesh.triIntersection(vert.co, tri)
-			if mDat is not None and mDat._intersected :
-				searchData[vert.index].setClosestMirror(mDat)
+		#Tests each triangle face in the mirror mesh at once to find the closest plane where the triangle intersects and updates the search data with it!
+		(inside, t, uvw) = mirrorMesh.intersect(np.array(vert.co))
+		MESH_OT_MirrorMesh.setClosestTri(vert.index, mirrorMesh, inside, t, uvw, searchData)
 
-	def findDistance(vert, mTri, searchData) :
-		t = mTri.normal.dot(vert.co - mTri.verts[0].co)
-		mDat = MirrorData(mTri, False, t)
-		searchData[vert.index].setMirror(mDat)
-
-
-	def triIntersection(vertCo, mTri):
-
-		#distance between tri plane and vert
-		t = mTri.normal.dot(vertCo-mTri.verts[0].co)
-
-		#If we dont mirror verts behind the face
-		if MESH_OT_MirrorMesh.cull and t < 0 :
-			return None
+	def findClosestTris(mesh, mirrorMesh, searchData) :
+		#
+		#	Batched findClosestTri, updates the search data of every vert with the closest intersecting triangle plane.
+		#	Verts are tested in batches so the (verts x triangles) arrays are kept at a limited size.
+		#
 
-		#We find the three points along the normal of the triangle vertices which spans the plane which our vertice is contained in
-		p0 = t / mTri.normal.dot(mTri.verts[0].normal) * mTri.verts[0].normal + mTri.verts[0].co
-		p1 = t / mTri.normal.dot(mTri.verts[1].normal) * mTri.verts[1].normal + mTri.verts[1].co
-		p2 = t / mTri.normal.dot(mTri.verts[2].normal) * mTri.verts[2].normal + mTri.verts[2].co
+		co = np.array([vert.co for vert in mesh.verts]).reshape((-1, 3))
+		batch = max(1, MirrorArrays.batch_size // max(1, mirrorMesh.count))
+		for start in range(0, len(co), batch) :
+			(inside, t, uvw) = mirrorMesh.intersect(co[start:start + batch, None])
+			for i in range(len(inside)) :
+				MESH_OT_MirrorMesh.setClosestTri(start + i, mirrorMesh, inside[i], t[i], uvw[i], searchData)
 
-		v0 = p1-p0
-		v1 = p2-p0
-		v2 = vertCo - p0
+	def setClosestTri(index, mirrorMesh, inside, t, uvw, searchData) :
+		#
+		#	Sets the closest intersecting triangle plane from the arrays of intersection tests with each mirror triangle
+		#
 
-		d00 = v0.dot(v0)
-		d01 = v0.dot(v1)
-		d11 = v1.dot(v1)
-		d20 = v2.dot(v0)
-		d21 = v2.dot(v1)
+		if not inside.any() :
+			return
+		tri = int(np.argmin(np.where(inside, t, np.inf)))
+		u, v, w = uvw[tri]
+		searchData[index].setClosestMirror(MirrorData(mirrorMesh, tri, True, float(t[tri]), float(u), float(v), float(w)))
 
-		invDenom = 1.0 / (d00 * d11 - d01 * d01)
+	def findDistance(vert, mTri, mirrorMesh, searchData) :
+		t = float(mirrorMesh.face_no[mTri].dot(np.array(vert.co) - mirrorMesh.tri_co[mTri,0]))
+		mDat = MirrorData(mirrorMesh, mTri, False, t)
+		searchData[vert.index].setMirror(mDat)
 
-		v = (d11 * d20 - d01 * d21) * invDenom
-		w = (d00 * d21 - d01 * d20) * invDenom
-		u = 1.0 - v - w
-		return MirrorData(mTri, u > MESH_OT_MirrorMesh.biasNeg and v > MESH_OT_MirrorMesh.biasNeg and w > MESH_OT_MirrorMesh.biasNeg, t, u,v,w)
 
 	def queueConnectedVerts(vert, searchData, queue) :
 
@@ -336,12 +312,10 @@ class MESH_OT_MirrorMesh(bpy.types.Operator):
 		#	Adds adjacent faces of the specified face to the queue, if they are not already tested / in queue
 		#
 
-		for edge in face.edges :
-			for otherFace in edge.link_faces :
-				if not otherFace.tag :
-					queue.put_nowait(otherFace)
-					otherFace.tag = True
-					tagList.append(otherFace)
+		for otherFace in mMesh.adjacent(face) :
+			if otherFace not in tagList :
+				queue.append(otherFace)
+				tagList.add(otherFace)
 
 
 
@@ -349,6 +323,58 @@ def flipNormals(bmesh):
 	for face in bmesh.faces :
 		face.normal_flip()
 
+class MirrorArrays:
+
+#Triangle arrays of the mirror mesh read from it's loop triangles, used to test intersection with every triangle in a single call
+
+	#Max number of (vert, triangle) tests in a batch
+	batch_size = 1 << 20
+
+	def __init__(self, mesh):
+		self.count = len(mesh.tri_vert)
+		self.tri_co = mesh.tri_co().astype(np.float64)
+		self.tri_no = mesh.tri_no().astype(np.float64)
+		self.face_no = mesh.tri_normal.astype(np.float64)
+		(self.adj_start, self.adj_tri) = triangleAdjacency(mesh.tri_vert)
+
+	def intersect(self, co, tri = slice(None)):
+		#Intersection with the plane parallel to each triangle (or the specified triangles) containing the vert,
+		#spanned by the three points along the normals of the triangle vertices. co is broadcast against the triangle arrays
+		return normalTriIntersectionArray(co, self.tri_co[tri], self.tri_no[tri], self.face_no[tri], MESH_OT_MirrorMesh.bias, MESH_OT_MirrorMesh.cull)
+
+	def adjacent(self, tri):
+		#Triangles sharing an edge with the triangle
+		return self.adj_tri[self.adj_start[tri]:self.adj_start[tri + 1]].tolist()
+
+def triangleAdjacency(tri_vert):
+	#
+	#	Finds the triangles sharing an edge with each triangle
+	#	Returns: Touple with the arrays (start, tris), the triangles adjacent to triangle i are tris[start[i]:start[i + 1]]
+	#
+
+	num = len(tri_vert)
+	edges = np.sort(np.stack((tri_vert, np.roll(tri_vert, -1, axis = 1)), axis = 2).reshape((-1, 2)), axis = 1).astype(np.int64)
+	#Vertex count bound used to combine the edge verts into a single key, ndarray.max() raises on empty arrays:
+	vert_count = int(tri_vert.max()) + 1 if num > 0 else 1
+	key = edges[:,0] * vert_count + edges[:,1]
+	order = np.argsort(key, kind = 'mergesort')
+	key = key[order]
+	#Group the triangle edges sharing the same verts and pair every edge in a group with the others:
+	first = np.flatnonzero(np.concatenate(([True], key[1:] != key[:-1])))
+	size = np.diff(np.concatenate((first, [len(key)])))
+	group_size = np.repeat(size, size)
+	group_first = np.repeat(first, size)
+	src = np.repeat(np.arange(len(key)), group_size)
+	dst = group_first[src] + np.arange(len(src)) - np.repeat(np.cumsum(group_size) - group_size, group_size)
+	src = order[src] // 3
+	dst = order[dst] // 3
+	keep = src != dst
+	(src, dst) = (src[keep], dst[keep])
+	sort = np.argsort(src, kind = 'mergesort')
+	start = np.zeros(num + 1, dtype=np.int64)
+	start[1:] = np.cumsum(np.bincount(src, minlength = num))
+	return (start, dst[sort])
+
 class SearchData:
 
 #Stores data for each vertice to keep track on relation between the mesh and the mirror mesh
@@ -375,19 +401,19 @@ class MirrorData:
 
 #class used to store intersection data towards a triangle in the mirror mesh
 
-	def __init__(self, mirrorTri = None, intersected = False,t = largeFloat, u = 0,v = 0,w = 0, n = mathutils.Vector((0.0,0.0,0.0))):
+	def __init__(self, mirrorMesh = None, mirrorTri = None, intersected = False,t = largeFloat, u = 0,v = 0,w = 0):
 		self._u = u
 		self._v = v
 		self._w = w
 		self._t = t
-		self._n = n
+		self._mirrorMesh = mirrorMesh
 		self._mirrorTri = mirrorTri
 		self._intersected = intersected
 
 	def calcSmoothMirrorVector(self) :
-		norm = self._mirrorTri.verts[0].normal * self._u + self._mirrorTri.verts[1].normal * self._v + self._mirrorTri.verts[2].normal * self._w
-		norm.normalize()
-		return (-2 * self._t)/self._mirrorTri.normal.dot(norm) * norm
+		norm = self._mirrorMesh.tri_no[self._mirrorTri].T.dot((self._u, self._v, self._w))
+		norm /= np.linalg.norm(norm)
+		return mathutils.Vector((-2 * self._t)/self._mirrorMesh.face_no[self._mirrorTri].dot(norm) * norm)
 
 	def calcFlatMirrorVector(self) :
-		return (-2 * self._t) * self._mirrorTri.normal
+		return mathutils.Vector((-2 * self._t) * self._mirrorMesh.face_no[self._mirrorTri])
@@ -0,0 +1,51 @@
+#  partition_grid.py (c) 2016 Mattias Fredriksson
+#
+# ##### BEGIN GPL LICENSE BLOCK #####
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+# ##### END GPL LICENSE BLOCK #####
+
+import numpy as np
+from .core.uv_grid import *
+
+def rebin_uv_index(uv_index, tri_uv, changed) :
+	"""
+	Create a uv index for updated uv triangles where only the changed triangles are binned again, the partitions are kept.
+	uv_index:	The UVGrid to update
+	tri_uv:		Array (F x 3 x 2) of the updated uv triangles
+	changed:	Array of the face indices with changed uv coordinates
+	Returns: The updated grid or None if the index must be rebuilt (a changed triangle is outside the grid or the index is tiled)
+	"""
+	if not isinstance(uv_index, UVGrid) :
+		return None
+	return uv_index.rebin(tri_uv, changed)
+
+def uv_index_from_tri_uv(tri_uv, face_per_partition = 2, bias = 0.00001, occupancy = None) :
+	"""
+	Creates the uv index for the triangles, a tiled grid if the uv map spans multiple UDIM tiles, otherwise a single partition grid.
+	Arguments are passed to UVGrid.from_tri_uv.
+	"""
+	tiles = TiledUVGrid.tile_faces(tri_uv)
+	if len(tiles) > 1 :
+		return TiledUVGrid(tri_uv, tiles, UVGrid.from_tri_uv, face_per_partition, bias, occupancy)
+	return UVGrid.from_tri_uv(tri_uv, face_per_partition, bias, occupancy)
+
+def uv_index_from_arrays(arrays) :
+	"""
+	Restores a uv index stored with to_arrays, either a tiled or a single partition grid.
+	"""
+	if 'tile_keys' in arrays :
+		return TiledUVGrid.from_arrays(arrays, UVGrid.from_tri_uv)
+	return UVGrid.from_arrays(arrays)
@@ -0,0 +1,497 @@
+#  proj_data.py (c) 2016 Mattias Fredriksson
+#
+# ##### BEGIN GPL LICENSE BLOCK #####
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+# ##### END GPL LICENSE BLOCK #####
+import bpy, bmesh
+import numpy as np
+
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from math import *
+from mathutils import *
+from .funcs_tri import *
+from .funcs_math import *
+from .funcs_blender import *
+from .compat import *
+from .bound import *
+from .partition_grid import *
+from .axis_align import *
+from .target_cache import *
+from .mesh_arrays import *
+from .core.seams import *
+
+#Number of halving steps toward the mesh center used to trace a mesh corner onto the target
+TRACE_STEPS = 5
+
+class Setting(namedtuple('Setting', ['bias', 'smooth', 'scalar', 'moveXY', 'rotation', 'depth', 'proj_type',
+	'keepRelative', 'partitions_per_face', 'auto_partition', 'occupancy', 'uv_tile', 'disk_cache'])) :
+	"""
+	Immutable settings of a projection run, created from the blender settings on main class execution.
+	The settings object is passed through the projection pipeline, so separate projection runs do not share state.
+	scalar:	Touple (x,y,z) scaling the mapping and the mesh depth
+	moveXY:	Touple (x,y) moving the mapping
+	uv_tile:	UDIM tile the mapping is moved into, 0 keeps the tile found when generating the bounds
+	disk_cache:	If target data is stored/loaded from the disk cache
+	"""
+	__slots__ = ()
+
+class SourceMeshData :
+	"""	Object containing the projection information of a single mesh object
+	"""
+	def __init__(self, co, object, axis) :
+		#Vertex coordinates of the source mesh transformed into the "projection basis" (N x 3 float32 array)
+		self.co = co
+		#Projected vertex coordinates, updated on every execute and written directly into the mesh
+		self.result = co.copy()
+		self.ob_name = object.name
+		#Mesh center point in world coordinates and the axis defining the min/max area on the target
+		self.location = object.location.copy()
+		self.axis = axis
+		#Projection target data, calculated by ProjectionData.calculateBounds()
+		self.bounds = None
+		#Largest temporary memory used when projecting a chunk (bytes)
+		self.chunk_memory = 0
+
+class ProjectionData :
+	""" Object creating and storing the projection information
+	"""
+
+	def __init__(self, ob_target, cameraRotInv, cameraAxis, cameraPos, ortho, warning) :
+		#Use name for comparison objects will corrupt between execute calls
+		self.target_ob = ob_target.name
+		self.cameraRotInv = cameraRotInv
+		self.cameraAxis = cameraAxis
+		self.cameraPos = cameraPos
+		self.ortho = ortho
+		self.warning = warning
+		#Estimated peak memory (bytes) of the last projection run
+		self.peak_memory = 0
+		#Target and source data, generated by generateTargetData() and generateSourceData()
+		self.target = None
+		self.bvh = None
+		self.uv_grid = None
+		self.meshList = []
+
+	def isReleased(self) :
+		"""	Check if the target or source data is released (or not generated), the data must be generated again before projecting.
+		"""
+		return self.target is None or len(self.meshList) == 0
+	def free(self) :
+		"""	Release the target and source data, the object can't be used for projection until the data is generated again.
+		"""
+		self.free_target()
+		self.free_source()
+	def free_target(self) :
+		#Target data is owned by the target cache, release the references:
+		self.target = None
+		self.bvh = None
+		self.uv_grid = None
+	def free_source(self) :
+		#Source data only holds arrays, release the references:
+		self.meshList = []
+
+	def generateTargetData(self, object, context, setting) :
+		"""	Generates projection information for the target mesh
+		"""
+		if object is None :
+			self.warning.report({'ERROR'}, "No active mesh object found to use as projection target.")
+			return False
+		elif object.type != 'MESH':
+			self.warning.report({'ERROR'}, "Active object was not a mesh. Select an appropriate mesh object as projection target")
+			return False
+		occupancy = setting.occupancy if setting.auto_partition else None
+		#Reuse target data from earlier invocations, entries are invalidated when the target changes so a hit skips reading the mesh:
+		key = target_key(object, setting.bias, occupancy, setting.partitions_per_face)
+		self.target = target_cache.get(key)
+		if self.target is None :
+			self.target = self.loadTargetData(object, context, setting, occupancy, key)
+			if self.target is None :
+				return False
+			target_cache.put(key, self.target)
+		self.bvh = self.target.bvh
+		self.uv_grid = self.target.uv_grid
+		return True
+
+	def loadTargetData(self, object, context, setting, occupancy, key) :
+		"""	Read the target mesh and load the target data from the disk cache or generate it.
+		occupancy:	Target face count per uv partition or None if partitions per face setting is used.
+		key:		Target cache key of the object
+		Returns: Target data or None if the mesh can't be used as target.
+		"""
+		#Read the triangles with the modifiers applied and vertices in world space into arrays, in loop triangle order:
+		mesh = MeshArrays.from_object(object, evaluated_depsgraph(context), object.matrix_world)
+		if mesh.loop_uv is None :
+			self.warning.report({'ERROR'}, "No active UV layer found on the target surface. Make sure there is an unwrapped UV Map available to project on.")
+			return None
+		if len(mesh.tri_vert) == 0 :
+			self.warning.report({'ERROR'}, "Target mesh has no faces to project on.")
+			return None
+		if not setting.disk_cache :
+			return self.createTargetData(mesh, setting, occupancy, target_cache.find_base(key))
+		#Entries on disk are keyed by the mesh content:
+		path_key = disk_key(key, mesh)
+		target = disk_cache.load(path_key)
+		if target is None :
+			target = self.createTargetData(mesh, setting, occupancy, target_cache.find_base(key))
+			if not disk_cache.save(path_key, target) :
+				self.warning.report({'WARNING'}, "Target data could not be written to the disk cache: %s" % disk_cache.directory())
+		return target
+
+	def createTargetData(self, mesh, setting, occupancy, base = None) :
+		"""	Generates the target bvh tree, uv partition grid and triangle arrays.
+		The target is read into arrays of the evaluated mesh loop triangles, no bmesh copy is created.
+		mesh:		MeshArrays of the evaluated target in world space, with the active uv layer
+		occupancy:	Target face count per uv partition or None if partitions per face setting is used.
+		base:		Cached target data of an earlier version of the object, refitted if the topology is unchanged (Default: None)
+		"""
+		vert_co = mesh.vert_co
+		vert_no = mesh.vert_no
+		tri_vert = mesh.tri_vert
+		tri_uv = mesh.tri_uv().astype(np.float64)
+		face_no = mesh.tri_normal
+		#Only update the changed parts if an earlier version of the target is available:
+		if base is not None :
+			target = base.refit(vert_co, vert_no, tri_vert, tri_uv, face_no, 1 / setting.partitions_per_face, setting.bias, occupancy)
+			if target is not None :
+				return target
+		#Create a bvh tree of the triangles, used for specific projection calls. Polygon indices equals loop triangle indices.
+		bvh = build_bvh(vert_co, tri_vert, setting.bias)
+		#Generate partition grid (one for each occupied UDIM tile), partition size is either fitted to the uv map or set manually
+		uv_grid = uv_index_from_tri_uv(tri_uv, 1 / setting.partitions_per_face , setting.bias, occupancy)
+		#Map the uv seam edges to the adjacent triangles on the other side of the seam
+		seams = SeamTable.from_triangles(tri_vert, tri_uv, setting.bias)
+		#Per triangle frames: corner positions (F x 3 x 3), corner vertex normals (F x 3 x 3) and the face normal (F x 3)
+		return TargetData(bvh, uv_grid, seams, vert_co, tri_vert, vert_co[tri_vert], vert_no[tri_vert], face_no)
+
+	def ray_cast_target_uv(self, origins, maxDist = 10000) :
+		"""
+		Cast rays from each origin on the target mesh BVH tree and calculate the texture coordinates of the intersections.
+		The barycentric and texture coordinates for all rays are calculated in one pass.
+		Returns: Touple of arrays: bool mask (N) for rays intersecting a face, the uv coordinates (N x 2) and the uv area of the intersected face (N).
+		"""
+		num = len(origins)
+		dirs = np.zeros((num, 3))
+		ind = np.full(num, -1, dtype=np.int64)
+		for i, origin in enumerate(origins) :
+			dirs[i] = self.getCameraAxis(origin)
+			(hitLoc, nor, index, dist) = self.bvh.ray_cast(origin, Vector(dirs[i]), maxDist)
+			if hitLoc is not None :
+				ind[i] = index
+		cast = ind >= 0
+		hit = np.zeros(num, dtype=bool)
+		tex = np.zeros((num, 2))
+		uvArea = np.zeros(num)
+		#Calculate the barycentric coordinates by intersecting the rays with the faces found in the BVH tree
+		(valid, dist, uvw) = rayTriIntersectionArray(np.array(origins).reshape((-1, 3))[cast], dirs[cast], self.target.tri_co[ind[cast]])
+		triUV = self.uv_grid.tri_uv[ind[cast]]
+		hit[cast] = valid
+		tex[cast] = averageTexCoordArray(triUV, uvw)
+		uvArea[cast] = uvAreaArray(triUV)
+		return (hit, tex, uvArea)
+
+	def generateSourceData(self, ob_list, scene, setting) :
+		"""
+		Generate the oriented bmesh and pre-calculate the projection information for a list of objects that should be projected
+		ob_list: list of objects containing the meshes that should be projected
+		setting: Settings of the projection run
+		"""
+		meshList = []
+		for ob in ob_list :
+			if ob.type == 'MESH' and ob.name != self.target_ob :
+				meshList.append(self.createSourceData(ob, scene, setting))
+		#Calculate the bounds of all sources in one pass, discard sources not projecting onto the target
+		self.calculateBounds(meshList)
+		self.meshList = [meshData for meshData in meshList if meshData.bounds is not None]
+		return True
+
+	def createSourceData(self, object, scene, setting):
+		"""	Function that calculates the vertex coordinates of a mesh object to be projected onto the target.
+		Calculates the rotation so that the verts is placed in origo rotated how it will be placed on the surface (mesh Z is facing up from surface)
+		It also calculates which mesh axis represents the X,Y in world space of our surface oriented mesh.
+		The X,Y axis representation will then be projected onto the surface to find the oriented rectangle representation on the UV map.
+		"""
+		#Find the orientation basis of the projected mesh aligned with camera view:
+		loc, meshRot, sca = object.matrix_world.decompose()
+		meshRot = meshRot.to_matrix()
+		#
+		if setting.proj_type == 'ZISUP' :
+			rot = Matrix.Identity(3)
+			axis = zUpFindAxis(meshRot, self.cameraAxis)
+		elif setting.proj_type == 'CAMERA' :
+			rot = matmul(self.cameraRotInv, meshRot)
+			axis = self.cameraAxis.copy()
+		else : #setting.proj_type == 'AXISALIGNED'
+			#Aligns the mesh to (1,0,0),... axis in camera space
+			rot = axisAlignRotationMatrix(matmul(self.cameraRotInv, meshRot))
+			#Calculates the mesh axis representing our scrambled view oriented rotation, equal to:
+			#axis[0] = meshRot * rot.row[0] (X), gives the world x axis of the mesh in aligned camera view
+			#axis[1] = meshRot * rot.row[1] (Y)...
+			axis = matmul(meshRot, rot.transposed())
+
+		#Read the mesh coordinates directly into the "projection basis", no bmesh copy is kept
+		matrix = matmul(rot, scaleMatrix(sca, 3)).to_4x4()
+		return SourceMeshData(getVertexCoords(object.data, matrix), object, axis)
+
+	def projectMeshData(self, context, setting, workers = 1, chunk_size = 65536) :
+		"""
+		Function projecting each mesh using the gathered data and updates the mesh object.
+		setting:	Settings of the projection run
+		workers:	Number of threads projecting source meshes in parallel (Default: 1)
+		chunk_size:	Number of vertices projected in each chunk, bounds the temporary memory (Default: 65536)
+		"""
+		obList = []
+		if self.isReleased() :
+			self.warning.report({'ERROR'}, "Projection data was released, invoke the operator again to project the meshes.")
+			return 0
+		for meshData in self.meshList :
+			if meshData.bounds == None :
+				return 0
+		results = self.projectSources(setting, workers, chunk_size)
+		#Loop over the projected mesh data and update the blender objects on the main thread
+		for meshData, result in zip(self.meshList, results) :
+			(co, select, count_partial) = result
+
+			#Finalize the projection by writing the coordinates into the blender object
+			ob = setNamedMeshCoords(co, select, meshData.ob_name, Matrix.Identity(4))
+			if ob is None :
+				self.warning.report({'WARNING'}, "Mesh: %s was not found and could not be updated." %meshData.ob_name)
+				continue
+			obList.append(ob)
+			blen = len(co)
+			if blen - count_partial != 0:
+				self.warning.report({'WARNING'}, "Mesh: %s has %d vertices that did not project succesfully and are selected. Verify no holes in UV map or try lowering target mesh density" %(meshData.ob_name, blen - count_partial))
+		#Finally set the origin to geometry
+		#origin_to_geometry(obList)
+
+	def projectSources(self, setting, workers = 1, chunk_size = 65536) :
+		"""
+		Project the vertices of all source meshes without accessing the blender objects, see projectSource().
+		setting:	Settings of the projection run
+		workers:	Number of threads projecting source meshes in parallel (Default: 1)
+		chunk_size:	Number of vertices projected in each chunk, bounds the temporary memory (Default: 65536)
+		Returns: List of the projectSource() result for each source mesh
+		"""
+		if self.target is None :
+			raise RuntimeError("Projection target data was released, generate the target data before projecting")
+		#Project the sources, target data is only read and shared between the workers:
+		if workers > 1 and len(self.meshList) > 1 :
+			with ThreadPoolExecutor(max_workers = workers) as pool :
+				results = list(pool.map(lambda meshData : self.projectSource(meshData, setting, chunk_size), self.meshList))
+		else :
+			results = [self.projectSource(meshData, setting, chunk_size) for meshData in self.meshList]
+		#Peak memory of the source arrays and the chunk temporaries held concurrently by the workers:
+		chunks = sorted([meshData.chunk_memory for meshData in self.meshList], reverse = True)
+		self.peak_memory = sum([meshData.co.nbytes + meshData.result.nbytes + len(meshData.co) for meshData in self.meshList])
+		self.peak_memory += sum(chunks[:max(workers, 1)])
+		return results
+
+	def projectSource(self, meshData, setting, chunk_size = 65536) :
+		"""
+		Project the vertices of a source mesh without accessing the blender object, updates meshData.result.
+		Vertices are streamed through the uv grid in fixed size chunks so temporary memory is bounded by the chunk size.
+		Only reads the shared target data so separate sources can be projected concurrently.
+		Returns: Touple of the projected coordinates, vertex selection and the number of verts intersecting the uv map.
+		"""
+		co = meshData.result
+		#Verts that did not intersect the uv map are selected
+		select = np.zeros(len(co), dtype=bool)
+		meshData.chunk_memory = 0
+
+		count_partial = 0 #Keeps track of verts intersecting the uv map
+		for start in range(0, len(co), max(chunk_size, 1)) :
+			chunk = np.arange(start, min(start + chunk_size, len(co)))
+			(co[chunk], hit) = self.projectChunk(meshData, setting, chunk)
+			select[chunk] = ~hit
+			count_partial += int(np.count_nonzero(hit))
+		return (co, select, count_partial)
+
+	def transformBounds(self, bounds, setting) :
+		"""	Copy and transform the bounds to the settings
+		"""
+		bounds = bounds.copy()
+		if setting.keepRelative :
+			bounds.ensureMeshRatio()
+		#Values below the first UDIM tile (1001) would move the mapping to negative tiles, only 0 is valid there:
+		if setting.uv_tile >= 1001 :
+			bounds.moveToTile(setting.uv_tile)
+		bounds.move(Vector(setting.moveXY))
+		bounds.rotate(setting.rotation)
+		bounds.scale(Vector(setting.scalar[:2]))
+		return bounds
+
+	def traceSource(self, meshData, setting, index = None) :
+		"""	Transform the source coordinates to (u,v,depth) and trace all uv points in the grid.
+		meshData:	Source mesh data to trace
+		setting:	Settings of the projection run
+		index:		Array or slice of vertex indices to trace, if None all vertices are traced (Default: None)
+		Returns: Touple of the (u,v,depth) array and the trace_points_uv result
+		"""
+		bounds = self.transformBounds(meshData.bounds, setting)
+		co = meshData.co if index is None else meshData.co[index]
+		mat = np.array(bounds.uv_matrix())
+		uvd = co @ mat[:3,:3].T + mat[:3,3]
+		return (uvd,) + self.uv_grid.trace_points_uv(uvd[:,:2])
+
+	def projectPoints(self, meshData, setting, index = None) :
+		"""	Project source vertices without updating the mesh.
+		meshData:	Source mesh data to project
+		setting:	Settings of the projection run
+		index:		Array of vertex indices to project, if None all vertices are projected (Default: None)
+		Returns: Array (N x 3) of projected points
+		"""
+		return self.projectChunk(meshData, setting, index)[0]
+
+	def projectChunk(self, meshData, setting, index = None) :
+		"""	Calculate the projection of a set of source vertices.
+		Points intersecting the uv map are projected on the intersected face. Points outside the uv map are traced to the
+		closest island face, also from empty partitions in the gaps between islands. Points falling off an island across
+		a seam continue on the adjacent island, others are projected onto the face with the closest uv edge.
+		meshData:	Source mesh data to project
+		setting:	Settings of the projection run
+		index:		Array of vertex indices to project, if None all vertices are projected (Default: None)
+		Returns: Touple of the projected points (N x 3) and bool mask (N) of the vertices intersecting the uv map,
+		vertices without any face to project on (empty uv map) keep their current coordinates.
+		"""
+		(uvd, hit, tri, uvw) = self.traceSource(meshData, setting, index)
+		#If no intersection use the closest tri of the uv islands
+		miss = np.flatnonzero(~hit)
+		(tri[miss], uvw[miss], dist, edge) = self.uv_grid.trace_close_points_uv(uvd[miss,:2])
+		#Continue points across seam edges onto the adjacent island:
+		(cont, adj, bary) = self.target.seams.continue_points(tri[miss], edge, uvd[miss,:2], setting.bias)
+		miss = miss[cont]
+		tri[miss] = adj[cont]
+		uvw[miss] = bary[cont]
+		hit[miss] = True
+		meshData.chunk_memory = max(meshData.chunk_memory, uvd.nbytes + hit.nbytes + tri.nbytes + uvw.nbytes * 3)
+		#Only project vertices with a face, the triangle frames can't be indexed with -1:
+		found = tri >= 0
+		if np.all(found) :
+			points = calcVertProjPointArray(self.target, tri, uvw, uvd[:,2] * setting.scalar[2], setting, ~hit)
+		else :
+			points = (meshData.result if index is None else meshData.result[index]).copy()
+			points[found] = calcVertProjPointArray(self.target, tri[found], uvw[found], uvd[found,2] * setting.scalar[2], setting, ~hit[found])
+		return (points, hit)
+
+	def calculateBounds(self, meshList) :
+		"""
+		Calculates the oriented rectangle on the uv map used as projection target and the mesh bounding box (around the rotated mesh)
+		for each source. The center and all corner rays of the sources are cast in one batched pass, then the corner
+		fallbacks are resolved from the result arrays.
+		A corner is traced at the corner position and if failed, at the halfway points toward the mesh center.
+		If a trace is successfull and is not first, the relation between the found uv coordinates,
+		"halway" and center point is assumed equal to the scalar applied to the mesh halfway point.
+		meshList:	List of source mesh data, the bounds are assigned to each object (None if failed).
+		"""
+		#Ray origins for each source: center followed by the 4 corners for each halving step toward the center
+		stride = 1 + 4 * TRACE_STEPS
+		origins = []
+		minMax = []
+		for meshData in meshList :
+			#Min/Max box of the mesh
+			(vMin, vMax) = findMinMaxArray(meshData.co)
+			minMax.append((vMin, vMax))
+			alignedAxis = meshData.axis
+			meshPos = meshData.location
+			#Calculate the corners of the mesh in the basis aligned with view rotation (note* inverted Z).
+			#Currently the points will be slightly distorted, as the mesh on screen is not algined with camera (A axis alignment is applied)
+			#To fix this the rotation difference between camera and mesh origin could be applied to the min/max projection points (not bounds!)
+			#Note* only orthographic support for now
+			corners = []
+			corners.append(vMin.x * alignedAxis.col[0] + vMax.y * alignedAxis.col[1] + meshPos)	#topL
+			corners.append(vMax.x * alignedAxis.col[0] + vMax.y * alignedAxis.col[1] + meshPos)	#topR
+			corners.append(vMax.x * alignedAxis.col[0] + vMin.y * alignedAxis.col[1] + meshPos)	#botR
+			corners.append(vMin.x * alignedAxis.col[0] + vMin.y * alignedAxis.col[1] + meshPos)	#botL
+			origins.append(meshPos)
+			for x in range(TRACE_STEPS) :
+				mult = pow(0.5, x)
+				for corner in corners :
+					origins.append((corner - meshPos) * mult + meshPos)
+
+		#Project all points onto the target and calculate the texture coordinates of the intersection points:
+		(hit, tex, uvArea) = self.ray_cast_target_uv(origins)
+		hit = hit.reshape((-1, stride))
+		tex = tex.reshape((-1, stride, 2))
+		#Corners require a trace on a face with uv area, find the first successfull halving step of each corner:
+		cornerHit = (hit & (uvArea.reshape((-1, stride)) > 0))[:,1:].reshape((-1, TRACE_STEPS, 4))
+		cornerStep = np.argmax(cornerHit, axis = 1)
+		cornerFound = np.any(cornerHit, axis = 1)
+
+		for i, meshData in enumerate(meshList) :
+			meshName = meshData.ob_name
+			if not hit[i,0] :
+				self.warning.report({'WARNING'}, "Mesh: %s center point did not project onto the target" %(meshName))
+				continue
+			if not cornerFound[i].all() :
+				self.warning.report({'WARNING'}, "Mesh: %s could not project onto the target properly. Verify that target area is uv mapped or that mesh is between the camera and target" %(meshName))
+				continue
+			centerTex = Vector(tex[i,0])
+			corners = []
+			for c in range(4) :
+				step = cornerStep[i,c]
+				#Scale the result back by assuming the relation on the uv map and mesh is identic:
+				corners.append((Vector(tex[i, 1 + step * 4 + c]) - centerTex) / pow(0.5, step) + centerTex)
+			#Calculate bounds:
+			(vMin, vMax) = minMax[i]
+			meshData.bounds = Bounds.From_Corners(corners[0], corners[1], corners[2], corners[3], centerTex, vMin, vMax)
+			if meshData.bounds is None:
+				self.warning.report({'WARNING'}, "Mesh: %s projection target area is 0, verify the uv map and that the mesh is projected onto the target object" %(meshName))
+
+	def getCameraAxis(self, target_co) :
+		"""	Calculates the projection ray direction
+		"""
+		if self.ortho :
+			return -self.cameraAxis.col[2]
+		else :
+			dir = target_co - self.cameraPos
+			dir.normalize()
+			return dir
+def calcVertProjPointArray(target, tri, uvw, depth, setting, clamp = None) :
+	"""
+	Calculate the resulting projection points of vertices being projected onto faces with the barycentric weights
+	target:	Target data containing the triangle frames
+	tri:	Array (N) of face indices the vertices are projected on
+	uvw:	Array (N x 3) of barycentric weights, defining how much each tri corner influences the vertex
+	depth:	Array (N) of distances of the vertices from the plane defined by the tri
+	setting:	Settings of the projection run
+	clamp:	Bool mask (N) of vertices outside the face, their weights are clamped when interpolating the normal (Default: None)
+	Returns: Array (N x 3) of projected points
+	"""
+	return projectOnTriangles(target.tri_co, target.tri_no, target.face_no, tri, uvw, depth + setting.depth, setting.smooth, clamp)
+
+def zUpFindAxis(meshAxis, camAxis) :
+	"""	Finds the mesh axis that will represent the X,Y with Z rotated to point toward camera.
+		The current mesh axis orientation used to place the mesh Identity on the surface (ensures matrix orientation)
+	"""
+	xDot = meshAxis.col[0].dot(camAxis.col[2])
+	yDot = meshAxis.col[1].dot(camAxis.col[2])
+	zDot = meshAxis.col[2].dot(camAxis.col[2])
+
+	ret = meshAxis.copy()
+	if abs(xDot) > max(abs(yDot), abs(zDot)) :
+		#X axis faces camera, set X to Z axis
+		ret.col[0] = meshAxis.col[2] * sign(xDot)
+		ret.col[1] = meshAxis.col[1]
+	elif abs(yDot) > abs(zDot) :
+		#Y axis faces camera, set Y to Z axis
+		ret.col[0] = meshAxis.col[0]
+		ret.col[1] = meshAxis.col[2] * sign(yDot)
+	else :
+		#Z faces camera, flip X deppending on Z points away or toward camera
+		ret.col[0] = meshAxis.col[0] * -sign(zDot)
+		ret.col[1] = meshAxis.col[1]
+	ret.col[2] = meshAxis.col[0].cross(meshAxis.col[1])
+	return ret
@@ -23,46 +23,16 @@ from math import *
 from mathutils import *
 from .funcs_math import *
 from .funcs_blender import *
+from .compat import *
 from .plane import *
-from bpy.props import * #Property objects
 
 
-class MESH_OT_ProjectMesh(bpy.types.Operator):
-	bl_idname = "mesh.project_onto_selected_mesh"
-	bl_label = "Project Mesh(es) onto Active"
-	bl_info = "Projects selected mesh(es) onto the active selected mesh"
-	bl_options = {'REGISTER', 'UNDO'}
-
-	depth_axis_enum = [
-		("Z", "Z", "The object's positive Z orientation axis will be used.", 0),
-		("Y", "Y", "The object's positive Y orientation axis will be used.", 1),
-		("X", "X", "The object's positive X orientation axis will be used.", 2),
-		("CAMERA", "View", "The camera forward axis determines the offset from the surface.", 3),
-		("CLOSEST", "Closest Axis", "The object's axis with the least angle to the camera view direction will determine the surface offset.", 4),
-		]
-	largest_obj_enum = [
-		("VOLUME", "Volume", "Parent is determined by the object with the largest bounding box volume.", 1),
-		("VERTCOUNT", "Vertex Count", "Parent is determined by the object with the most vertices.", 2),
-		("SINGLE", "Individual", "Each object is treated individually, and does not relate to the other objects.", 3)
-		]
-
+class MESH_OT_ProjectMesh :
+	"""
+	Implementation of the lazy_ops.MESH_OT_ProjectMesh operator, copied onto the registered class on first use.
+	"""
 	displayExecutionTime = False
 
-	depth_axis: EnumProperty(items=depth_axis_enum,
-			name = "Axis",
-            description="Select the axis defining the distance vertices will be placed from the surface. Each vertex will be placed at the same offset, from the surface, as the distance from the vertex to the furthest vertex on the axis. Using an object's orientation axis is useful to get a better fit on the surface, if vertices are oriented accordingly (the object has a 'floor' of coplanar vertices orthogonal to the axis). If multiple object's are selected, the axis is defined by the parent object",
-			default = 'CLOSEST',)
-	largest_obj: EnumProperty(items=largest_obj_enum,
-			name = "Selection Parent",
-            description="Determines how selected objects relate to each other, if selection should be projected as a group, select relevant parent function. Children will be projected relative to the parent object defined by the parent function",
-			default = 'SINGLE',)
-	depthOffset: FloatProperty(name="Surface Offset",
-            description="Move the projection closer/away from target surface by a fixed amount (along neg. view forward axis)",
-            default=0, min=-sys.float_info.max, max=sys.float_info.max, step=1)
-	bias: FloatProperty(name="Intersection Epsilon",
-            description="Error marginal for intersection tests, can solve intersection problems where vertices are projected through edges",
-            default=0.00001, min=0.00001, max=1, step=1, precision=4)
-
 	def invoke(self, context, event) :
 		"""
 		Invoke stage, gathering information of the projection objects:
@@ -103,7 +73,7 @@ class MESH_OT_ProjectMesh(bpy.types.Operator):
 				self.report({'ERROR'}, "No selection to project found, make sure to select one source mesh object and an active mesh object as projection target")
 			return {'CANCELLED'}
 		#Generate projection info
-		bvh = generate_BVH(target_ob, context.evaluated_depsgraph_get(), self.bias)
+		bvh = generate_BVH(target_ob, evaluated_depsgraph(context), self.bias)
 		self.target_ob = target_ob.name
 
 		#Generate project data
@@ -0,0 +1,325 @@
+#  target_cache.py (c) 2016 Mattias Fredriksson
+#
+# ##### BEGIN GPL LICENSE BLOCK #####
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+# ##### END GPL LICENSE BLOCK #####
+
+import bpy, hashlib, os, glob, shutil, tempfile
+import numpy as np
+
+from collections import OrderedDict
+from mathutils.bvhtree import BVHTree
+from .partition_grid import *
+from .core.seams import *
+from .compat import *
+
+class TargetData :
+	"""
+	Acceleration data generated for a projection target: the bvh tree, the uv partition grid, the uv seam table, the vertex
+	positions (V x 3) and the triangle arrays in loop triangle order: vertex indices (F x 3), corner positions (F x 3 x 3),
+	corner vertex normals (F x 3 x 3) and face normals (F x 3). No blender mesh data is referenced, the positions are in world space.
+	Data is shared between operator invocations through the cache and must be treated as read-only.
+	"""
+	def __init__(self, bvh, uv_grid, seams, vert_co, tri_vert, tri_co, tri_no, face_no) :
+		self.bvh = bvh
+		self.uv_grid = uv_grid
+		self.seams = seams
+		self.vert_co = vert_co
+		self.tri_vert = tri_vert
+		self.tri_co = tri_co
+		self.tri_no = tri_no
+		self.face_no = face_no
+		self.size = self.calc_memory_size()
+
+	def calc_memory_size(self) :
+		"""
+		Estimate of the memory (bytes) held by the target data.
+		"""
+		arrays = self.vert_co.nbytes + self.tri_vert.nbytes + self.tri_co.nbytes + self.tri_no.nbytes + self.face_no.nbytes + self.uv_grid.memory_size() + self.seams.memory_size()
+		#Rough estimate of the bvh tree: triangle coordinates and node bounds.
+		return arrays + len(self.tri_co) * (36 + 64)
+
+	def to_arrays(self) :
+		"""
+		Dict of all arrays defining the target data. The bvh tree is not included, it is rebuilt from the triangles when loaded.
+		"""
+		arrays = {'vert_co' : self.vert_co, 'tri_vert' : self.tri_vert, 'tri_co' : self.tri_co, 'tri_no' : self.tri_no, 'face_no' : self.face_no}
+		arrays.update(self.uv_grid.to_arrays())
+		arrays.update(self.seams.to_arrays())
+		return arrays
+	def from_arrays(arrays) :
+		"""
+		Construction function that restores the target data from the to_arrays dict, the bvh tree is rebuilt from the triangles.
+		"""
+		uv_grid = uv_index_from_arrays(arrays)
+		seams = SeamTable.from_arrays(uv_grid.tri_uv, arrays)
+		bvh = build_bvh(arrays['vert_co'], arrays['tri_vert'], uv_grid.bias)
+		return TargetData(bvh, uv_grid, seams, arrays['vert_co'], arrays['tri_vert'], arrays['tri_co'], arrays['tri_no'], arrays['face_no'])
+
+	def refit(self, vert_co, vert_no, tri_vert, tri_uv, face_no, face_per_partition, bias, occupancy) :
+		"""
+		Create target data for changed positions or uv coordinates of the same mesh topology, reusing the unchanged structures.
+		Changed vertices are found by comparing with the cached positions. The bvh tree is reused if no vertex moved,
+		mathutils can't refit a bvh tree so it is otherwise rebuilt from the arrays. The uv grid is reused if no uv coordinate
+		changed, otherwise only the triangles with changed uv coordinates are binned again.
+		Arrays are read from the changed mesh (see TargetData), remaining arguments are the uv index build settings.
+		Returns: The updated target data or None if the topology differs.
+		"""
+		if len(vert_co) != len(self.vert_co) or not np.array_equal(tri_vert, self.tri_vert) :
+			return None
+		bvh = self.bvh
+		if np.any(vert_co != self.vert_co) :
+			bvh = build_bvh(vert_co, tri_vert, bias)
+		uv_grid = self.uv_grid
+		seams = self.seams
+		changed = np.flatnonzero(np.any(tri_uv != self.uv_grid.tri_uv, axis = (1, 2)))
+		if len(changed) > 0 :
+			uv_grid = rebin_uv_index(self.uv_grid, tri_uv, changed)
+			if uv_grid is None :
+				uv_grid = uv_index_from_tri_uv(tri_uv, face_per_partition, bias, occupancy)
+			seams = SeamTable.from_triangles(tri_vert, tri_uv, bias)
+		return TargetData(bvh, uv_grid, seams, vert_co, tri_vert, vert_co[tri_vert], vert_no[tri_vert], face_no)
+
+	def free(self) :
+		"""
+		Release the references to the arrays and the bvh tree, the data can't be used after the call.
+		"""
+		self.bvh = None
+		self.uv_grid = None
+		self.seams = None
+		self.vert_co = None
+		self.tri_vert = None
+		self.tri_co = None
+		self.tri_no = None
+		self.face_no = None
+		self.size = 0
+
+class TargetCache :
+	"""
+	LRU cache of target data, keyed by object name, world matrix, uv layer and the build settings (see target_key()).
+	The key does not depend on the mesh content, entries of changed objects are invalidated by the update handler.
+	Least recently used entries are evicted when the memory budget is exceeded.
+	"""
+	def __init__(self, budget) :
+		#Memory budget in bytes
+		self.budget = budget
+		self.size = 0
+		self.entries = OrderedDict()
+		#Keys of invalidated entries, only kept as refit base (see find_base())
+		self.stale = set()
+
+	def get(self, key) :
+		"""
+		Fetch the target data stored for the key, returns None if not found or invalidated.
+		"""
+		if key in self.stale :
+			return None
+		data = self.entries.get(key)
+		if data is not None :
+			self.entries.move_to_end(key)
+		return data
+
+	def put(self, key, data) :
+		"""
+		Store target data for the key and evict entries until the cache fits the budget.
+		"""
+		self.remove(key)
+		self.entries[key] = data
+		self.size += data.size
+		#Evict least recently used, always keep the latest entry:
+		while self.size > self.budget and len(self.entries) > 1 :
+			old_key, old = self.entries.popitem(last = False)
+			self.size -= old.size
+
+	def remove(self, key) :
+		data = self.entries.pop(key, None)
+		if data is not None :
+			self.size -= data.size
+		self.stale.discard(key)
+
+	def invalidate(self, object_name) :
+		"""
+		Invalidate the entries generated from the named object. The most recently used entry is kept (but never returned
+		by get()) as base for refitting the target data when the object is used as target again.
+		"""
+		keys = [key for key in self.entries if key[0] == object_name]
+		for key in keys[:-1] :
+			self.remove(key)
+		self.stale.update(keys[-1:])
+
+	def find_base(self, key) :
+		"""
+		Find the most recently used entry generated from the same object, uv layer and build settings as the key,
+		the data can be refitted to the changed object.
+		Returns: Target data or None if not found.
+		"""
+		for (entry_key, data) in reversed(self.entries.items()) :
+			if entry_key[0] == key[0] and entry_key[2:] == key[2:] :
+				return data
+		return None
+
+	def clear(self) :
+		"""
+		Remove and free all entries, only called when no operator can hold a reference to the data.
+		"""
+		for data in self.entries.values() :
+			data.free()
+		self.entries.clear()
+		self.stale.clear()
+		self.size = 0
+
+# Module level cache shared between operator invocations (256 MB budget).
+target_cache = TargetCache(256 * 1024 * 1024)
+
+class DiskCache :
+	"""
+	Optional cache persisting target data between sessions. The arrays of each entry are stored as raw .npy files
+	in a directory named by the content hash of the key, and loaded memory mapped (read-only) without copying.
+	The cache directory is placed next to the saved .blend file, or in the temporary directory for unsaved files.
+	Least recently used entries are removed when the total size exceeds the budget.
+	"""
+	#Format version of the stored arrays, entries written by other versions are not loaded
+	version = 3
+
+	def __init__(self, budget) :
+		#Disk budget in bytes
+		self.budget = budget
+
+	def directory(self) :
+		if bpy.data.filepath :
+			return os.path.join(os.path.dirname(bpy.data.filepath), "projection_cache")
+		return os.path.join(tempfile.gettempdir(), "projection_cache")
+
+	def path(self, key) :
+		"""
+		Entry directory of the key. The object name is excluded, entries only depend on the content of the target.
+		key:	Key extended with the content hash of the mesh (see disk_key()), the disk cache is not invalidated by the update handler
+		"""
+		return os.path.join(self.directory(), content_hash(repr((DiskCache.version,) + key[1:]).encode()).hexdigest())
+
+	def load(self, key) :
+		"""
+		Load the target data stored for the key, returns None if not found or if the entry could not be read.
+		"""
+		path = self.path(key)
+		if not os.path.isdir(path) :
+			return None
+		try :
+			arrays = {os.path.basename(file)[:-4] : np.load(file, mmap_mode = 'r') for file in glob.glob(os.path.join(path, '*.npy'))}
+			data = TargetData.from_arrays(arrays)
+			#Mark the entry as recently used
+			os.utime(path)
+		except (OSError, ValueError, KeyError) :
+			return None
+		return data
+
+	def save(self, key, data) :
+		"""
+		Store the target data arrays for the key and evict entries until the cache fits the budget.
+		Returns: False if the entry could not be written.
+		"""
+		path = self.path(key)
+		if os.path.isdir(path) :
+			return True
+		#Write to a temporary directory first so incomplete entries are never loaded:
+		tmp = "%s.%d.tmp" % (path, os.getpid())
+		try :
+			os.makedirs(tmp, exist_ok = True)
+			for (name, array) in data.to_arrays().items() :
+				np.save(os.path.join(tmp, name + '.npy'), np.ascontiguousarray(array))
+			os.rename(tmp, path)
+		except OSError :
+			shutil.rmtree(tmp, ignore_errors = True)
+			return False
+		self.evict()
+		return True
+
+	def evict(self) :
+		"""
+		Remove least recently used entries until the cache fits the budget, the latest entry is always kept.
+		"""
+		entries = []
+		for path in glob.glob(os.path.join(self.directory(), '*')) :
+			if os.path.isdir(path) and not path.endswith('.tmp') :
+				size = sum([os.path.getsize(file) for file in glob.glob(os.path.join(path, '*.npy'))])
+				entries.append((os.path.getmtime(path), size, path))
+		entries.sort()
+		total = sum([size for (time, size, path) in entries])
+		for (time, size, path) in entries[:-1] :
+			if total <= self.budget :
+				break
+			#Memory mapped entries may be locked on some platforms, they are evicted later
+			shutil.rmtree(path, ignore_errors = True)
+			total -= size
+
+	def clear(self) :
+		shutil.rmtree(self.directory(), ignore_errors = True)
+
+# Module level disk cache (1 GB budget)
+disk_cache = DiskCache(1024 * 1024 * 1024)
+
+def build_bvh(vert_co, tri_vert, bias) :
+	"""
+	Build the bvh tree of the triangle arrays, the bvh face indices equals the triangle indices.
+	"""
+	return BVHTree.FromPolygons(vert_co.tolist(), tri_vert.tolist(), all_triangles = True, epsilon = bias)
+
+def content_hash(data) :
+	"""
+	Create a 128 bit hash object of the bytes. Blake2 is not available in the python version of 2.79 (3.5), md5 is used instead.
+	"""
+	if hasattr(hashlib, 'blake2b') :
+		return hashlib.blake2b(data, digest_size = 16)
+	return hashlib.md5(data)
+
+def hash_mesh(mesh) :
+	"""
+	Calculate a content hash of the mesh arrays from the vertex positions, triangle topology and the uv coordinates.
+	mesh:	MeshArrays read from the target, the same arrays the target data is built from
+	"""
+	h = content_hash(np.ascontiguousarray(mesh.vert_co).tobytes())
+	h.update(np.ascontiguousarray(mesh.tri_vert).tobytes())
+	h.update(np.ascontiguousarray(mesh.tri_poly).tobytes())
+	if mesh.loop_uv is not None :
+		h.update(np.ascontiguousarray(mesh.tri_uv()).tobytes())
+	return h.hexdigest()
+
+def target_key(object, *settings) :
+	"""
+	Generate the cache key for a target object. The mesh is not read, entries of changed objects are invalidated
+	by the update handler (see invalidate_updated()) so a cache hit skips reading the target.
+	settings:	Additional build settings affecting the target data (bias, partition settings...).
+	Returns: Key tuple, first element is always the object name.
+	"""
+	matrix = tuple(v for row in object.matrix_world for v in row)
+	uv = object.data.uv_layers.active
+	return (object.name, matrix, None if uv is None else uv.name) + settings
+
+def disk_key(key, mesh) :
+	"""
+	Extend the cache key with the content hash of the mesh arrays, entries on disk outlive the update handler.
+	"""
+	return key + (hash_mesh(mesh),)
+
+def invalidate_updated(scene, *depsgraph) :
+	"""
+	Invalidate cached target data of objects with changed geometry or transform, called from the update handler
+	registered with the operators (see lazy_ops.register_handlers()).
+	"""
+	if len(target_cache.entries) == 0 :
+		return
+	for name in updated_objects(scene, *depsgraph) :
+		target_cache.invalidate(name)
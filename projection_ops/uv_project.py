@@ -0,0 +1,325 @@
+#  uv_project.py (c) 2016 Mattias Fredriksson
+#
+# ##### BEGIN GPL LICENSE BLOCK #####
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+# ##### END GPL LICENSE BLOCK #####
+
+import bpy, bgl, time, sys, os
+
+from .proj_data import *
+from .funcs_blender import *
+from .compat import *
+if API_28 :
+	#The gpu module replaced the immediate mode drawing of 2.79
+	import gpu
+	from gpu_extras.batch import batch_for_shader
+
+class MESH_OT_UVProjectMesh :
+	"""
+	Implementation of the lazy_ops.MESH_OT_UVProjectMesh operator, copied onto the registered class on first use.
+	"""
+
+	def __init__(self):
+		return
+
+	def __del__(self):
+		#Destructor cleanup
+		try:
+			self.projData.free()
+		except AttributeError:
+			pass
+
+	def update_setting(self) :
+		"""
+		Create the immutable settings for the next projection run from the operator properties.
+		Returns: The previous settings (None on first call).
+		"""
+		previous = getattr(self, 'setting', None)
+		self.setting = Setting(
+			bias = self.biasValue,
+			smooth = self.smooth,
+			scalar = (self.scalarXYZ[0] * self.scalar, self.scalarXYZ[1] * self.scalar, self.scalarXYZ[2] * self.scalar),
+			moveXY = (self.moveXY[0], self.moveXY[1]),
+			depth = self.depthAdd,
+			proj_type = self.proj_type,
+			rotation = self.rotation,
+			keepRelative = self.keepRelative,
+			partitions_per_face = self.partitions_per_face,
+			auto_partition = self.auto_partition,
+			occupancy = self.occupancy,
+			uv_tile = self.uv_tile,
+			disk_cache = self.disk_cache)
+		return previous
+
+	def workerCount(self) :
+		"""
+		Number of threads used to project the meshes.
+		"""
+		if self.workers == 0 :
+			return os.cpu_count() or 1
+		return self.workers
+
+	def invoke(self, context, event):
+		"""
+		Generate projection information required to project each mesh.
+		Note* blender mesh object references gets corrupted between execute stages.
+		"""
+		if not self.gatherData(context) :
+			return {'CANCELLED'}
+		return self.execute(context)
+
+	def gatherData(self, context) :
+		"""
+		Execute stage 1: Gather projection data for the active target and selected source objects.
+		Returns: False if the data could not be generated.
+		"""
+		start_time = time.time()
+		self.update_setting()
+		self.report({'INFO'}, "Executing: Mesh Projection UV")
+
+		# Get the active object and validate as mesh
+		ob_target = context.active_object
+		ob_sources = context.selected_objects
+
+		#Verify a list of objects to project.
+		proj_list = []
+		for ob in ob_sources :
+			if ob.type == 'MESH' and ob != ob_target :
+				proj_list.append(ob)
+		if len(proj_list) == 0 :
+			if len(ob_sources) > 0 :
+				self.report({'ERROR'}, "Only mesh objects can be projected, need atleast one project source and one target surface object")
+			else :
+				self.report({'ERROR'}, "Not enough mesh objects selected, need atleast one source and one target object")
+			return False
+
+
+		#Find 3d view camera rotation from context:
+		cameraRot = findViewRotation(context)
+		cameraRotInv = cameraRot.transposed()
+		camPos = findViewPos(context)
+		ortho = viewTypeOrtho(context)
+		#Generate the object holding the intitial data:
+		self.projData = ProjectionData(ob_target, cameraRotInv, cameraRot, camPos, ortho,  self)
+		#Generate the data for our target ob:
+		if not self.projData.generateTargetData(ob_target, context, self.setting):
+			#Error generating target data.
+			return False
+
+		#Generate projection information of the meshes that is being projected:
+		self.projData.generateSourceData(proj_list, context.scene, self.setting)
+		if self.printExecTime :
+			self.report({'INFO'}, self.projData.uv_grid.occupancy_report())
+			self.report({'INFO'}, "Finished, invoke stage execution time: %.2f seconds ---" % (time.time() - start_time))
+		return True
+
+
+	def execute(self, context):
+		"""
+		Project each mesh according to the gathered information and the settings.
+		"""
+		#Execute Stage 2: Project from gathered data according to settings:
+		start_time = time.time()
+		#Update settings, keep the previous for comparisions:
+		setting = self.update_setting()
+		#If axis alignment setting is changed new source data needs to be generated:
+		if setting.proj_type != self.proj_type :
+			self.projData.free_source()
+			self.projData.generateSourceData(context.selected_objects, context.scene, self.setting)
+		elif setting.partitions_per_face != self.partitions_per_face or setting.auto_partition != self.auto_partition or setting.occupancy != self.occupancy :
+			#Partitions changed, regenerate the target grid before projecting:
+			if not self.projData.generateTargetData(getObject(self.projData.target_ob, context.scene), context, self.setting) :
+				return {'CANCELLED'}
+			if self.printExecTime :
+				self.report({'INFO'}, self.projData.uv_grid.occupancy_report())
+		if self.projData.isReleased() :
+			self.report({'ERROR'}, "Projection data was released, invoke the operator again to project the meshes.")
+			return {'CANCELLED'}
+		#Project the meshes with the gathered information
+		self.projData.projectMeshData(context, self.setting, self.workerCount(), self.chunk_size)
+		#Finished
+		if self.printExecTime :
+			self.report({'INFO'}, "Finished, project stage execution time: %.2f seconds (%d threads), peak projection memory: %.1f MB ---" % (time.time() - start_time, self.workerCount(), self.projData.peak_memory / (1024 * 1024)))
+		return {'FINISHED'}
+
+class MESH_OT_UVProjectMeshModal(MESH_OT_UVProjectMesh):
+	"""
+	Implementation of the lazy_ops.MESH_OT_UVProjectMeshModal operator, copied onto the registered class on first use.
+	"""
+
+	def invoke(self, context, event):
+		"""
+		Gather the projection data and start the modal placement.
+		"""
+		if context.area.type != 'VIEW_3D' :
+			self.report({'ERROR'}, "Interactive projection must be called from a 3D view")
+			return {'CANCELLED'}
+		if not self.gatherData(context) :
+			return {'CANCELLED'}
+		#Store the initial mesh state, restored if the placement is cancelled:
+		self.restore = []
+		for meshData in self.projData.meshList :
+			ob = getObject(meshData.ob_name)
+			self.restore.append((ob.name, ob.matrix_world.copy(), getVertexCoords(ob.data)))
+		#Decimated vertex subset of each mesh projected while dragging:
+		for meshData in self.projData.meshList :
+			stride = max(ceil(len(meshData.co) / self.preview_verts), 1)
+			meshData.preview_index = np.arange(0, len(meshData.co), stride)
+		self.mode = 'MOVE'
+		self.beginTransform(event)
+		self.preview = []
+		self.batch = None
+		self.shader = gpu.shader.from_builtin('3D_UNIFORM_COLOR') if API_28 else None
+		#Full resolution is pending if the mesh is not projected with the current values
+		self.pending = False
+		self.last_move = time.time()
+		self.updatePreview()
+		self.draw_handle = bpy.types.SpaceView3D.draw_handler_add(draw_preview, (self,), 'WINDOW', 'POST_VIEW')
+		self.timer = context.window_manager.event_timer_add(0.05, window = context.window)
+		context.window_manager.modal_handler_add(self)
+		self.updateHeader(context)
+		return {'RUNNING_MODAL'}
+
+	def execute(self, context):
+		"""
+		Project with the current properties, called from the redo panel after the placement is confirmed.
+		The projection data gathered on invoke is kept until the operator is destroyed, it is only gathered
+		again if the operator is executed without invoke (repeat last) or the data was released.
+		"""
+		if (getattr(self, 'projData', None) is None or self.projData.isReleased()) and not self.gatherData(context) :
+			return {'CANCELLED'}
+		return MESH_OT_UVProjectMesh.execute(self, context)
+
+	def beginTransform(self, event) :
+		"""
+		Store the mouse position and property values the drag is relative to.
+		"""
+		self.init_mouse = Vector((event.mouse_region_x, event.mouse_region_y))
+		self.init_move = Vector(self.moveXY)
+		self.init_rotation = self.rotation
+		self.init_scale = self.scalar
+
+	def modal(self, context, event):
+		if event.type == 'MOUSEMOVE' :
+			self.dragTransform(context, event)
+			self.update_setting()
+			self.updatePreview()
+			self.last_move = time.time()
+			self.pending = True
+		elif event.type in {'G', 'R', 'S'} and event.value == 'PRESS' :
+			self.mode = {'G' : 'MOVE', 'R' : 'ROTATE', 'S' : 'SCALE'}[event.type]
+			self.beginTransform(event)
+		elif event.type == 'TIMER' :
+			#Progressive refinement, project the full meshes when the mouse rests:
+			if self.pending and time.time() - self.last_move > self.refine_delay :
+				self.projData.projectMeshData(context, self.setting, self.workerCount(), self.chunk_size)
+				self.pending = False
+				self.preview = []
+				self.batch = None
+		elif event.type in {'LEFTMOUSE', 'RET', 'NUMPAD_ENTER'} and event.value == 'PRESS' :
+			self.projData.projectMeshData(context, self.setting, self.workerCount(), self.chunk_size)
+			self.finish(context)
+			return {'FINISHED'}
+		elif event.type in {'RIGHTMOUSE', 'ESC'} and event.value == 'PRESS' :
+			self.finish(context)
+			self.restoreMeshes()
+			#Cancelled operators are not redone, release the projection data:
+			self.projData.free()
+			return {'CANCELLED'}
+		else :
+			return {'PASS_THROUGH'} if event.type in {'WHEELUPMOUSE', 'WHEELDOWNMOUSE', 'MIDDLEMOUSE'} else {'RUNNING_MODAL'}
+		self.updateHeader(context)
+		context.area.tag_redraw()
+		return {'RUNNING_MODAL'}
+
+	def dragTransform(self, context, event) :
+		"""
+		Map the mouse drag to the move, rotate or scale property depending on the current mode.
+		"""
+		mouse = Vector((event.mouse_region_x, event.mouse_region_y))
+		center = Vector((context.region.width, context.region.height)) * 0.5
+		if self.mode == 'MOVE' :
+			#Move along the mapped uv axes, dragging over the region width moves the area four times its size:
+			bounds = self.projData.meshList[0].bounds if len(self.projData.meshList) > 0 else None
+			if bounds is None :
+				return
+			delta = (mouse - self.init_mouse) * (4 * max(bounds.uvSize.x, bounds.uvSize.y) / context.region.width)
+			delta = rotateVec2(delta.x * bounds.xAxis + delta.y * bounds.yAxis, self.rotation)
+			self.moveXY = self.init_move + delta
+		elif self.mode == 'ROTATE' :
+			a = self.init_mouse - center
+			b = mouse - center
+			if a.length > 0 and b.length > 0 :
+				self.rotation = self.init_rotation + degrees(atan2(a.x * b.y - a.y * b.x, a.dot(b)))
+		else : #self.mode == 'SCALE'
+			a = (self.init_mouse - center).length
+			if a > 0 :
+				self.scalar = max(self.init_scale * (mouse - center).length / a, 0.001)
+
+	def updatePreview(self) :
+		"""
+		Project the decimated vertex subsets and generate the preview point batch.
+		"""
+		preview = [self.projData.projectPoints(meshData, self.setting, meshData.preview_index) for meshData in self.projData.meshList]
+		self.preview = np.concatenate(preview) if len(preview) > 0 else np.zeros((0, 3), dtype=np.float32)
+		if API_28 and len(self.preview) > 0 :
+			self.batch = batch_for_shader(self.shader, 'POINTS', {"pos" : self.preview})
+		else :
+			self.batch = None
+
+	def updateHeader(self, context) :
+		context.area.header_text_set("Projection %s | Move: (%.4f, %.4f) Rotate: %.2f Scale: %.3f | G/R/S: Move/Rotate/Scale, LMB/Enter: Confirm, RMB/Esc: Cancel" % (
+			self.mode.capitalize(), self.moveXY[0], self.moveXY[1], self.rotation, self.scalar))
+
+	def finish(self, context) :
+		"""
+		Remove the modal handlers and the preview. The projection data is kept for the redo panel (see execute()).
+		"""
+		bpy.types.SpaceView3D.draw_handler_remove(self.draw_handle, 'WINDOW')
+		context.window_manager.event_timer_remove(self.timer)
+		header_text_clear(context.area)
+		context.area.tag_redraw()
+		self.preview = []
+		self.batch = None
+
+	def restoreMeshes(self) :
+		"""
+		Restore the source meshes to the state before the operator was called.
+		"""
+		for (name, matrix, co) in self.restore :
+			ob = getObject(name)
+			ob.matrix_world = matrix
+			setMeshCoords(ob.data, co)
+
+def draw_preview(op) :
+	"""
+	Draw callback rendering the projected preview points of the modal operator.
+	"""
+	if len(op.preview) == 0 :
+		return
+	bgl.glPointSize(4)
+	if API_28 :
+		op.shader.bind()
+		op.shader.uniform_float("color", (1.0, 0.6, 0.1, 1.0))
+		op.batch.draw(op.shader)
+	else :
+		#Immediate mode, the number of points is limited by the preview vertex count
+		bgl.glColor4f(1.0, 0.6, 0.1, 1.0)
+		bgl.glBegin(bgl.GL_POINTS)
+		for co in op.preview :
+			bgl.glVertex3f(co[0], co[1], co[2])
+		bgl.glEnd()
+	bgl.glPointSize(1)
@@ -0,0 +1,175 @@
+#  blender_stand_ins.py (c) 2016 Mattias Fredriksson
+#
+# ##### BEGIN GPL LICENSE BLOCK #####
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+# ##### END GPL LICENSE BLOCK #####
+
+#Local stand-ins for the blender modules only available inside blender (bpy, bmesh, bgl, gpu, mathutils.bvhtree).
+#They provide the names the package modules use at import time and the api calls exercised by the tests, nothing else.
+#The numpy kernels and mathutils (pip package) are the real implementations.
+
+import sys, types, importlib
+
+#Blender only modules replaced while the stand-ins are installed
+STAND_IN_MODULES = ['bpy', 'bpy.props', 'bpy.app', 'bpy.app.handlers', 'bmesh', 'bgl', 'gpu', 'gpu_extras', 'gpu_extras.batch', 'mathutils.bvhtree']
+PACKAGE = 'projection_ops'
+
+class Operator :
+	"""
+	Stand-in of bpy.types.Operator recording the reports.
+	"""
+	def report(self, type, message) :
+		self.reports = getattr(self, 'reports', [])
+		self.reports.append((type, message))
+
+class Object :
+	pass
+class Mesh :
+	pass
+
+class PropertyDeferred :
+	"""
+	Stand-in of the deferred property object returned by the bpy.props functions from 2.93.
+	"""
+	def __init__(self, function, keywords) :
+		self.function = function
+		self.keywords = keywords
+PropertyDeferred.__name__ = '_PropertyDeferred'
+
+def property_function(name, version) :
+	def function(**keywords) :
+		#Properties are (function, keywords) tuples before 2.93
+		if version >= (2, 93, 0) :
+			return PropertyDeferred(function, keywords)
+		return (function, keywords)
+	function.__name__ = name
+	return function
+
+class DrawHandlers :
+	"""
+	Stand-in of bpy.types.SpaceView3D tracking the added draw handlers.
+	"""
+	def __init__(self) :
+		self.handlers = []
+	def draw_handler_add(self, function, args, region_type, draw_type) :
+		handle = (function, args)
+		self.handlers.append(handle)
+		return handle
+	def draw_handler_remove(self, handle, region_type) :
+		self.handlers.remove(handle)
+
+class Utils :
+	"""
+	Stand-in of bpy.utils tracking the registered classes.
+	"""
+	def __init__(self) :
+		self.registered = []
+	def register_class(self, cls) :
+		if cls in self.registered :
+			raise ValueError("register_class(...): already registered as a subclass '%s'" % cls.__name__)
+		self.registered.append(cls)
+	def unregister_class(self, cls) :
+		if cls not in self.registered :
+			raise RuntimeError("unregister_class(...): missing bl_rna attribute from '%s'" % cls.__name__)
+		self.registered.remove(cls)
+
+class BVHTree :
+	"""
+	Stand-in of mathutils.bvhtree.BVHTree storing the polygons it was built from.
+	"""
+	def __init__(self, co, polygons) :
+		self.co = co
+		self.polygons = polygons
+	def FromPolygons(co, polygons, all_triangles = False, epsilon = 0.0) :
+		return BVHTree(co, polygons)
+
+def persistent(function) :
+	return function
+
+def create_modules(version = (2, 80, 0)) :
+	"""
+	Create the stand-in modules for the blender api version.
+	Returns: Dict of the modules keyed by module name.
+	"""
+	bpy = types.ModuleType('bpy')
+	props = types.ModuleType('bpy.props')
+	props.__all__ = []
+	for name in ['BoolProperty', 'EnumProperty', 'FloatProperty', 'FloatVectorProperty', 'IntProperty', 'StringProperty'] :
+		setattr(props, name, property_function(name, version))
+		props.__all__.append(name)
+	handlers = types.ModuleType('bpy.app.handlers')
+	handlers.persistent = persistent
+	handlers.load_post = []
+	if version >= (2, 80, 0) :
+		handlers.depsgraph_update_post = []
+	else :
+		handlers.scene_update_post = []
+	app = types.ModuleType('bpy.app')
+	app.version = version
+	app.debug = False
+	app.handlers = handlers
+	bpy.props = props
+	bpy.app = app
+	bpy.types = types.SimpleNamespace(Operator = Operator, Object = Object, Mesh = Mesh, SpaceView3D = DrawHandlers())
+	bpy.utils = Utils()
+	bpy.data = types.SimpleNamespace(filepath = '', objects = {}, meshes = {})
+	bpy.context = types.SimpleNamespace()
+	bvhtree = types.ModuleType('mathutils.bvhtree')
+	bvhtree.BVHTree = BVHTree
+	batch = types.ModuleType('gpu_extras.batch')
+	batch.batch_for_shader = None
+	gpu_extras = types.ModuleType('gpu_extras')
+	gpu_extras.batch = batch
+	return {'bpy' : bpy, 'bpy.props' : props, 'bpy.app' : app, 'bpy.app.handlers' : handlers,
+		'bmesh' : types.ModuleType('bmesh'), 'bgl' : types.ModuleType('bgl'), 'gpu' : types.ModuleType('gpu'),
+		'gpu_extras' : gpu_extras, 'gpu_extras.batch' : batch, 'mathutils.bvhtree' : bvhtree}
+
+def unload_package() :
+	for name in [name for name in sys.modules if name == PACKAGE or name.startswith(PACKAGE + '.')] :
+		del sys.modules[name]
+
+class StandIns :
+	"""
+	Installs the stand-in modules and imports a fresh copy of the package against them, restored on uninstall().
+	"""
+	def __init__(self, version = (2, 80, 0)) :
+		self.version = version
+		self.modules = create_modules(version)
+		self.previous = {}
+
+	def install(self) :
+		for name in STAND_IN_MODULES :
+			self.previous[name] = sys.modules.get(name)
+			sys.modules[name] = self.modules[name]
+		unload_package()
+		return self
+
+	def uninstall(self) :
+		unload_package()
+		for (name, module) in self.previous.items() :
+			if module is None :
+				sys.modules.pop(name, None)
+			else :
+				sys.modules[name] = module
+
+	def bpy(self) :
+		return self.modules['bpy']
+
+	def module(self, name) :
+		"""
+		Import a package module (relative name) against the stand-ins.
+		"""
+		return importlib.import_module(PACKAGE + '.' + name)
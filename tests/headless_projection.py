@@ -0,0 +1,67 @@
+#  headless_projection.py (c) 2016 Mattias Fredriksson
+#
+# ##### BEGIN GPL LICENSE BLOCK #####
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+# ##### END GPL LICENSE BLOCK #####
+
+#ProjectionData of a plane target and random source meshes created from arrays, without blender objects or a 3D view.
+#Used by the tests and benchmarks of the projection stage, the proj_data module is imported against the stand-ins.
+
+import types
+import numpy as np
+
+from mathutils import Vector
+from mesh_data import plane_grid
+
+def target_data(proj_data, partitions = 16) :
+	"""
+	Target data of a partitions x partitions plane with the uv map equal to the XY position, see ProjectionData.createTargetData.
+	"""
+	(vert_co, vert_no, tri_vert, tri_uv, face_no) = plane_grid(partitions)
+	return proj_data.TargetData(proj_data.build_bvh(vert_co, tri_vert, 0.00001), proj_data.uv_index_from_tri_uv(tri_uv),
+		proj_data.SeamTable.from_triangles(tri_vert, tri_uv), vert_co, tri_vert, vert_co[tri_vert], vert_no[tri_vert], face_no)
+
+def source_data(proj_data, name, verts, seed = 0) :
+	"""
+	Source mesh data of random vertices in the unit cube, the bounds map the cube onto the inner part of the uv square.
+	"""
+	co = np.random.RandomState(seed).random_sample((verts, 3)).astype(np.float32)
+	meshData = proj_data.SourceMeshData(co, types.SimpleNamespace(name = name, location = Vector()), None)
+	meshData.bounds = proj_data.Bounds(Vector((0, 0, 0)), Vector((1, 1, 1)), Vector((1, 0)), Vector((0, 1)),
+		Vector((0, 0)), Vector((0.05, 0.05)), Vector((0.95, 0.95)))
+	return meshData
+
+def projection_data(proj_data, sources = 1, verts = 1000, partitions = 16, warning = None) :
+	"""
+	Create projection data for a plane target and the source meshes, as generated on invoke.
+	warning:	Object the projection reports to (Default: None)
+	"""
+	data = proj_data.ProjectionData(types.SimpleNamespace(name = 'Target'), None, None, None, True, warning)
+	data.target = target_data(proj_data, partitions)
+	data.bvh = data.target.bvh
+	data.uv_grid = data.target.uv_grid
+	data.meshList = [source_data(proj_data, 'Source%d' % i, verts, i) for i in range(sources)]
+	return data
+
+def setting(proj_data, **changes) :
+	"""
+	Settings of a projection run, keyword arguments replace the defaults.
+	"""
+	values = dict(bias = 0.00001, smooth = True, scalar = (1, 1, 1), moveXY = (0, 0), rotation = 0, depth = 0,
+		proj_type = 'ZISUP', keepRelative = False, partitions_per_face = 2, auto_partition = False, occupancy = 2, uv_tile = 0,
+		disk_cache = False)
+	values.update(changes)
+	return proj_data.Setting(**values)
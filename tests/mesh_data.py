@@ -0,0 +1,46 @@
+#  mesh_data.py (c) 2016 Mattias Fredriksson
+#
+# ##### BEGIN GPL LICENSE BLOCK #####
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+# ##### END GPL LICENSE BLOCK #####
+
+#Procedural meshes used by the tests and benchmarks, in the array layout read by mesh_arrays.MeshArrays.
+
+import numpy as np
+
+def plane_grid(n, size = 1.0) :
+	"""
+	Triangulated n x n quad plane in the XY plane (Z up), with the uv coordinates equal to the XY position divided by the size.
+	Returns: Touple of the vertex positions (V x 3), vertex normals (V x 3), triangle vertex indices (T x 3),
+	triangle uv coordinates (T x 3 x 2) and the face normals (T x 3)
+	"""
+	x = np.linspace(0, size, n + 1)
+	(gx, gy) = np.meshgrid(x, x, indexing = 'ij')
+	vert_co = np.stack((gx.ravel(), gy.ravel(), np.zeros(gx.size)), axis = 1).astype(np.float32)
+	vert_no = np.tile(np.array([0, 0, 1], dtype=np.float32), (len(vert_co), 1))
+	#Lower left vertex of each quad:
+	v00 = np.arange(n * (n + 1)).reshape((n, n + 1))[:,:n].ravel()
+	v10 = v00 + n + 1
+	tri_vert = np.concatenate((np.stack((v00, v10, v10 + 1), axis = 1), np.stack((v00, v10 + 1, v00 + 1), axis = 1))).astype(np.int32)
+	tri_uv = vert_co[tri_vert][:,:,:2].astype(np.float64) / size
+	face_no = np.tile(np.array([0, 0, 1], dtype=np.float32), (len(tri_vert), 1))
+	return (vert_co, vert_no, tri_vert, tri_uv, face_no)
+
+def random_triangles(count, seed = 0) :
+	"""
+	Random triangles (count x 3 x 3) inside the unit cube.
+	"""
+	return np.random.RandomState(seed).random_sample((count, 3, 3))
@@ -0,0 +1,78 @@
+#  test_align_to_view.py (c) 2016 Mattias Fredriksson
+#
+# ##### BEGIN GPL LICENSE BLOCK #####
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+# ##### END GPL LICENSE BLOCK #####
+
+#Batched parent relative transform of the align selection operator against the per object Matrix multiplies it replaced.
+
+import types
+import numpy as np
+import pytest
+
+from math import radians
+from mathutils import Euler, Matrix, Vector
+
+def random_matrix(rng) :
+	#Translated, rotated and non-uniformly scaled world matrix
+	scale = Matrix.Identity(4)
+	for i in range(3) :
+		scale[i][i] = rng.uniform(0.2, 3.0)
+	rotation = Euler([radians(a) for a in rng.uniform(-180, 180, 3)]).to_matrix().to_4x4()
+	return Matrix.Translation(Vector(rng.uniform(-10, 10, 3))) @ rotation @ scale
+
+def selected_objects(count, seed = 0) :
+	"""
+	Stand-ins of the selected objects with random world matrices and bounding boxes.
+	"""
+	rng = np.random.RandomState(seed)
+	objects = []
+	for i in range(count) :
+		(low, high) = (rng.uniform(-2, 0, 3), rng.uniform(0.1, 2, 3))
+		bound_box = [(high[0] if x else low[0], high[1] if y else low[1], high[2] if z else low[2]) for x in (0, 1) for y in (0, 1) for z in (0, 1)]
+		#Blender bound_box corner order: (-x -y -z), (-x -y +z), (-x +y +z), (-x +y -z), then the same for +x
+		bound_box = [bound_box[i] for i in (0, 1, 3, 2, 4, 5, 7, 6)]
+		objects.append(types.SimpleNamespace(name = 'Object%d' % i, matrix_world = random_matrix(rng), bound_box = bound_box))
+	return objects
+
+@pytest.fixture
+def align(blender) :
+	return (blender.module('align_to_view'), blender.module('funcs_blender'))
+
+@pytest.mark.parametrize('count', [0, 1, 50])
+def test_orientation_matches_per_object(align, count) :
+	(align_to_view, funcs_blender) = align
+	objects = selected_objects(count)
+	rng = np.random.RandomState(1)
+	parent_world_inv = random_matrix(rng).inverted()
+	parent_mat = random_matrix(rng)
+	#Per object multiply of the earlier orientation()
+	expected = [parent_mat @ parent_world_inv @ ob.matrix_world for ob in objects]
+	op = align_to_view.MESH_OT_AlignSelection()
+	funcs_blender.setMatrixWorldArray(objects, op.orientation(funcs_blender.getMatrixWorldArray(objects), parent_world_inv, parent_mat))
+	for (ob, matrix) in zip(objects, expected) :
+		assert isinstance(ob.matrix_world, Matrix)
+		assert np.allclose(np.array(ob.matrix_world), np.array(matrix), atol = 1e-5)
+
+def test_volume_parent_matches_per_object(align) :
+	(align_to_view, funcs_blender) = align
+	objects = selected_objects(50, 2)
+	volumes = [funcs_blender.getBoundBoxVolume(ob) for ob in objects]
+	assert np.allclose(funcs_blender.getBoundBoxVolumes(objects), volumes)
+	op = types.SimpleNamespace(parent_obj = 'VOLUME', exclude_active = False)
+	(parent, children) = align_to_view.MESH_OT_AlignSelection.findParent(op, None, objects)
+	assert parent is objects[int(np.argmax(volumes))]
+	assert len(children) == 49 and parent not in children
@@ -0,0 +1,78 @@
+#  test_bounds.py (c) 2016 Mattias Fredriksson
+#
+# ##### BEGIN GPL LICENSE BLOCK #####
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+# ##### END GPL LICENSE BLOCK #####
+
+#The affine uv_matrix() applied on redo against the per vertex Bounds.calcUVPoint it replaced.
+
+import types
+import numpy as np
+import pytest
+
+from mathutils import Vector
+from projection_ops.bound import Bounds
+from headless_projection import setting
+
+def bounds() :
+	#Rotated, non-square mapping of a box not starting at the origin
+	corners = [Vector((0.2, 0.7)), Vector((0.6, 0.8)), Vector((0.7, 0.4)), Vector((0.3, 0.3))]
+	return Bounds.From_Corners(corners[0], corners[1], corners[2], corners[3], Vector((0.45, 0.55)),
+		Vector((-1.0, -0.5, 0.2)), Vector((2.0, 1.5, 0.9)))
+
+def transform(bounds, keepRelative, tile, move, rotation, scale) :
+	#Redo transforms in the order of ProjectionData.transformBounds
+	if keepRelative :
+		bounds.ensureMeshRatio()
+	if tile >= 1001 :
+		bounds.moveToTile(tile)
+	bounds.move(Vector(move))
+	bounds.rotate(rotation)
+	bounds.scale(Vector(scale))
+	return bounds
+
+@pytest.mark.parametrize('keepRelative, tile, move, rotation, scale', [
+	(False, 0, (0, 0), 0, (1, 1)),
+	(True, 0, (0.1, -0.3), 35, (1, 1)),
+	(False, 1012, (0.25, 0.5), -120, (0.5, 2.0)),
+	(True, 1001, (-2.0, 0.0), 400, (1.5, 1.5)),
+	])
+def test_uv_matrix_matches_calc_uv_point(keepRelative, tile, move, rotation, scale) :
+	b = transform(bounds(), keepRelative, tile, move, rotation, scale)
+	co = np.random.RandomState(0).random_sample((200, 3)) * (4, 3, 1) - (1.5, 1, 0)
+	expected = np.array([b.calcUVPoint(Vector(v)) for v in co])
+	mat = np.array(b.uv_matrix())
+	uvd = co @ mat[:3,:3].T + mat[:3,3]
+	assert np.allclose(uvd, expected, atol = 1e-5)
+	#Homogeneous row is kept
+	assert np.allclose(mat[3], (0, 0, 0, 1))
+
+@pytest.mark.parametrize('tile, offset', [(0, (0, 0)), (1, (0, 0)), (1000, (0, 0)), (1001, (0, 0)), (1002, (1, 0)), (1012, (1, 1)), (1100, (9, 9))])
+def test_transform_bounds_tile(blender, tile, offset) :
+	#Values between 0 and the first UDIM tile keep the tile found when the bounds were generated, never a negative tile
+	proj_data = blender.module('proj_data')
+	b = bounds()
+	moved = proj_data.ProjectionData.transformBounds(None, b, setting(proj_data, uv_tile = tile))
+	assert moved.texOrigo.x - b.texOrigo.x == pytest.approx(offset[0] - np.floor(b.texOrigo.x) if tile >= 1001 else 0)
+	assert moved.texOrigo.y - b.texOrigo.y == pytest.approx(offset[1] - np.floor(b.texOrigo.y) if tile >= 1001 else 0)
+	assert moved.texOrigo.x >= 0 and moved.texOrigo.y >= 0
+
+@pytest.mark.parametrize('tile, snapped', [(0, 0), (1, 0), (1000, 0), (1001, 1001), (1100, 1100)])
+def test_uv_tile_snaps_below_first_tile(blender, tile, snapped) :
+	(function, keywords) = blender.module('lazy_ops').UVProjectProperties.__annotations__['uv_tile']
+	op = types.SimpleNamespace(uv_tile = tile)
+	keywords['update'](op, None)
+	assert op.uv_tile == snapped
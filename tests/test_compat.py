@@ -0,0 +1,177 @@
+#  test_compat.py (c) 2016 Mattias Fredriksson
+#
+# ##### BEGIN GPL LICENSE BLOCK #####
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+# ##### END GPL LICENSE BLOCK #####
+
+#The compat functions are run against the stand-ins of each supported api flavour (2.79, 2.80 and 2.93+).
+
+import types
+import pytest
+
+class Operand :
+	"""
+	Records the operator used to combine the operands.
+	"""
+	def __init__(self, name) :
+		self.name = name
+	def __mul__(self, other) :
+		return Operand("(%s * %s)" % (self.name, other.name))
+	def __matmul__(self, other) :
+		return Operand("(%s @ %s)" % (self.name, other.name))
+
+class Recorder :
+	"""
+	Records the method calls and attribute assignments made by the compat functions.
+	"""
+	def __init__(self, **attributes) :
+		self.__dict__['calls'] = []
+		self.__dict__.update(attributes)
+	def __setattr__(self, name, value) :
+		self.calls.append(('set', name, value))
+	def __getattr__(self, name) :
+		return lambda *args : self.calls.append((name,) + args)
+
+def is_28(blender) :
+	return blender.version >= (2, 80, 0)
+
+def test_api_flag(blender_version) :
+	compat = blender_version.module('compat')
+	assert compat.API_28 == is_28(blender_version)
+
+def test_matmul(blender_version) :
+	compat = blender_version.module('compat')
+	op = '@' if is_28(blender_version) else '*'
+	result = compat.matmul(Operand('a'), Operand('b'), Operand('c'))
+	#Multiplied from left to right:
+	assert result.name == "((a %s b) %s c)" % (op, op)
+
+def test_make_annotations(blender_version) :
+	compat = blender_version.module('compat')
+	props = blender_version.modules['bpy.props']
+	class Mixin :
+		scalar = props.FloatProperty(name = "Scalar")
+	class Operator(Mixin, blender_version.bpy().types.Operator) :
+		bl_idname = "mesh.test"
+		count = props.IntProperty(name = "Count")
+	for cls in [Mixin, Operator] :
+		compat.make_annotations(cls)
+	assert Operator.bl_idname == "mesh.test"
+	if is_28(blender_version) :
+		#Properties are moved to the annotations of the class declaring them
+		assert 'count' not in Operator.__dict__ and 'scalar' not in Mixin.__dict__
+		assert compat.is_property(Operator.__annotations__['count'])
+		assert compat.is_property(Mixin.__annotations__['scalar'])
+		assert 'bl_idname' not in Operator.__annotations__
+	else :
+		assert compat.is_property(Operator.count) and compat.is_property(Operator.scalar)
+		assert '__annotations__' not in Operator.__dict__
+
+def test_is_property(blender_version) :
+	compat = blender_version.module('compat')
+	assert compat.is_property(blender_version.modules['bpy.props'].BoolProperty(name = "Flag"))
+	assert not compat.is_property(("Flag", {}))
+	assert not compat.is_property("Flag")
+
+def test_update_handlers(blender_version) :
+	compat = blender_version.module('compat')
+	handlers = blender_version.modules['bpy.app.handlers']
+	expected = handlers.depsgraph_update_post if is_28(blender_version) else handlers.scene_update_post
+	assert compat.update_handlers() is expected
+
+def test_updated_objects(blender_version) :
+	compat = blender_version.module('compat')
+	if is_28(blender_version) :
+		def update(name, geometry, transform, type = blender_version.bpy().types.Object) :
+			id = type()
+			id.original = types.SimpleNamespace(name = name)
+			return types.SimpleNamespace(id = id, is_updated_geometry = geometry, is_updated_transform = transform)
+		depsgraph = types.SimpleNamespace(updates = [update('A', True, False), update('B', False, False),
+			update('C', False, True), update('D', True, True, blender_version.bpy().types.Mesh)])
+		assert compat.updated_objects(None, depsgraph) == ['A', 'C']
+	else :
+		scene = types.SimpleNamespace(objects = [types.SimpleNamespace(name = 'A', is_updated = True, is_updated_data = False),
+			types.SimpleNamespace(name = 'B', is_updated = False, is_updated_data = False),
+			types.SimpleNamespace(name = 'C', is_updated = False, is_updated_data = True)])
+		assert compat.updated_objects(scene) == ['A', 'C']
+
+def test_select_and_active(blender_version) :
+	compat = blender_version.module('compat')
+	ob = Recorder()
+	compat.select_set(ob, True)
+	scene = Recorder(objects = Recorder())
+	view_layer = Recorder(objects = Recorder())
+	context = types.SimpleNamespace(scene = scene, view_layer = view_layer)
+	compat.set_active(context, ob)
+	if is_28(blender_version) :
+		assert ob.calls == [('select_set', True)]
+		assert view_layer.objects.calls == [('set', 'active', ob)] and scene.objects.calls == []
+	else :
+		assert ob.calls == [('set', 'select', True)]
+		assert scene.objects.calls == [('set', 'active', ob)] and view_layer.objects.calls == []
+
+def test_link_object(blender_version) :
+	compat = blender_version.module('compat')
+	scene = Recorder(objects = Recorder(), collection = Recorder(objects = Recorder()))
+	ob = object()
+	compat.link_object(scene, ob)
+	if is_28(blender_version) :
+		assert scene.collection.objects.calls == [('link', ob)] and scene.objects.calls == []
+	else :
+		assert scene.objects.calls == [('link', ob)] and scene.collection.objects.calls == []
+
+def test_evaluated_mesh(blender_version) :
+	compat = blender_version.module('compat')
+	mesh = object()
+	evaluated = Recorder(to_mesh = lambda : mesh)
+	ob = Recorder(evaluated_get = lambda depsgraph : evaluated, to_mesh = lambda scene, modifiers, settings : mesh)
+	context = types.SimpleNamespace(scene = 'scene', evaluated_depsgraph_get = lambda : 'depsgraph')
+	depsgraph = compat.evaluated_depsgraph(context)
+	assert depsgraph == ('depsgraph' if is_28(blender_version) else 'scene')
+	assert compat.evaluated_mesh(ob, depsgraph) is mesh
+	blender_version.bpy().data.meshes = Recorder()
+	compat.clear_evaluated_mesh(ob, depsgraph, mesh)
+	if is_28(blender_version) :
+		assert evaluated.calls == [('to_mesh_clear',)]
+	else :
+		assert blender_version.bpy().data.meshes.calls == [('remove', mesh)]
+
+def test_calc_normals(blender_version) :
+	compat = blender_version.module('compat')
+	mesh = Recorder()
+	compat.calc_normals(mesh)
+	assert mesh.calls == [('calc_normals',)]
+	#Removed in 4.0 where normals are calculated on demand
+	compat.calc_normals(types.SimpleNamespace())
+
+def test_header_text_clear(blender_version) :
+	compat = blender_version.module('compat')
+	area = Recorder()
+	compat.header_text_clear(area)
+	assert area.calls == [('header_text_set', None)] if is_28(blender_version) else [('header_text_set',)]
+
+def test_create_mesh_links_scene(blender_version) :
+	#funcs_blender links new objects through link_object in every api version
+	funcs_blender = blender_version.module('funcs_blender')
+	data = blender_version.bpy().data
+	data.meshes = types.SimpleNamespace(new = lambda name : Recorder(name = name))
+	data.objects = types.SimpleNamespace(new = lambda name, mesh : Recorder(name = name, data = mesh))
+	scene = Recorder(objects = Recorder(), collection = Recorder(objects = Recorder()))
+	bm = Recorder()
+	ob = funcs_blender.createMesh(bm, scene, None, "Copy")
+	linked = scene.collection.objects if is_28(blender_version) else scene.objects
+	assert linked.calls == [('link', ob)]
+	assert bm.calls == [('normal_update',), ('to_mesh', ob.data)]
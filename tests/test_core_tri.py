@@ -0,0 +1,164 @@
+#  test_core_tri.py (c) 2016 Mattias Fredriksson
+#
+# ##### BEGIN GPL LICENSE BLOCK #####
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+# ##### END GPL LICENSE BLOCK #####
+
+#The array kernels in core/tri.py compared with the scalar mathutils versions in funcs_tri.py.
+
+import types
+import numpy as np
+import pytest
+
+mathutils = pytest.importorskip('mathutils')
+from mathutils import Vector
+from mesh_data import random_triangles
+from projection_ops.core.tri import *
+from projection_ops.funcs_tri import pointInTriangle, rayTriIntersection, averageCo, averageNorm, collideTriAARect2D
+
+def face(tri_co, tri_no = None) :
+	"""
+	Stand-in of a triangulated bmesh face with the corner positions and vertex normals.
+	"""
+	tri_no = np.zeros((3, 3)) if tri_no is None else tri_no
+	return types.SimpleNamespace(verts = [types.SimpleNamespace(co = Vector(co), normal = Vector(no)) for (co, no) in zip(tri_co, tri_no)])
+
+def edge_and_vertex_rays(tri) :
+	"""
+	Rays from above each triangle aimed at the corners, the edge midpoints and the center.
+	Returns: Touple of the origins, directions and triangle index of each ray
+	"""
+	normal = np.cross(tri[:,1] - tri[:,0], tri[:,2] - tri[:,0])
+	normal /= np.linalg.norm(normal, axis = 1)[:,None]
+	targets = [tri[:,0], tri[:,1], tri[:,2], (tri[:,0] + tri[:,1]) * 0.5, (tri[:,1] + tri[:,2]) * 0.5,
+		(tri[:,2] + tri[:,0]) * 0.5, tri.mean(axis = 1)]
+	target = np.concatenate(targets)
+	dir = -np.tile(normal, (len(targets), 1))
+	index = np.tile(np.arange(len(tri)), len(targets))
+	return (target - dir, dir, index)
+
+def test_ray_tri_intersection() :
+	tri = random_triangles(50)
+	#Random rays and rays hitting the corners and edges of the triangles:
+	rng = np.random.RandomState(2)
+	origin = rng.random_sample((200, 3)) * 2 - 0.5
+	dir = rng.random_sample((200, 3)) - 0.5
+	index = rng.randint(0, len(tri), 200)
+	(edge_origin, edge_dir, edge_index) = edge_and_vertex_rays(tri)
+	origin = np.concatenate((origin, edge_origin))
+	dir = np.concatenate((dir, edge_dir))
+	index = np.concatenate((index, edge_index))
+	(hit, t, uvw) = rayTriIntersectionArray(origin, dir, tri[index])
+	for i in range(len(origin)) :
+		result = rayTriIntersection(Vector(origin[i]), Vector(dir[i]), face(tri[index[i]]))
+		assert hit[i] == (result is not None), i
+		if result is not None :
+			assert t[i] == pytest.approx(result[0], abs = 1e-5)
+			assert np.allclose(uvw[i], result[1], atol = 1e-5)
+	#Every edge and vertex ray intersects the triangle it is aimed at:
+	assert hit[-len(edge_index):].all()
+
+def test_shared_edge_hits_both_triangles() :
+	tri = np.array([[[0, 0, 0], [1, 0, 0], [0, 1, 0]], [[1, 0, 0], [1, 1, 0], [0, 1, 0]]], dtype=np.float64)
+	origin = np.array([[0.5, 0.5, 1.0]])
+	dir = np.array([[0, 0, -1.0]])
+	(hit, t, uvw) = rayTriIntersectionArray(origin[:,None], dir[:,None], tri[None])
+	assert hit.all()
+	assert np.allclose(t, 1)
+
+def test_closest_ray_tri() :
+	tri = random_triangles(40, 3)
+	(origin, dir, index) = edge_and_vertex_rays(tri)
+	rng = np.random.RandomState(4)
+	origin = np.concatenate((origin, rng.random_sample((100, 3)) * 2 - 0.5))
+	dir = np.concatenate((dir, rng.random_sample((100, 3)) - 0.5))
+	#Small batches so the rays are split over several batches:
+	(hit, closest, dist, uvw) = closestRayTriArray(origin, dir, tri, batch_size = 500)
+	faces = [face(t) for t in tri]
+	for i in range(len(origin)) :
+		results = [(r[0], j, r[1]) for (j, r) in enumerate([rayTriIntersection(Vector(origin[i]), Vector(dir[i]), f) for f in faces]) if r is not None]
+		assert hit[i] == (len(results) > 0), i
+		if len(results) > 0 :
+			(t, j, coord) = min(results, key = lambda r : r[0])
+			assert dist[i] == pytest.approx(t, abs = 1e-5)
+			#Equal distances (shared corners) may resolve to either triangle:
+			if closest[i] != j :
+				assert dist[i] == pytest.approx(min([r[0] for r in results if r[1] == closest[i]]), abs = 1e-5)
+			else :
+				assert np.allclose(uvw[i], coord, atol = 1e-5)
+		else :
+			assert closest[i] == -1
+
+def test_point_in_triangle() :
+	tri = random_triangles(30, 5)
+	rng = np.random.RandomState(6)
+	#Points in the plane of each triangle: random weights, corners and edge midpoints
+	weights = np.concatenate((rng.random_sample((30, 3)) * 1.4 - 0.2, np.eye(3), [[0.5, 0.5, 0], [0, 0.5, 0.5], [0.5, 0, 0.5]]))
+	weights[:,2] = 1 - weights[:,0] - weights[:,1]
+	point = np.einsum('wj,tjk->twk', weights, tri)
+	(inside, uvw) = pointInTriangleArray(point, tri[:,None])
+	for i in range(len(tri)) :
+		for j in range(len(weights)) :
+			result = pointInTriangle(Vector(point[i,j]), Vector(tri[i,0]), Vector(tri[i,1]), Vector(tri[i,2]))
+			#mathutils calculates in single precision, points on the edges can round to either side:
+			if j < 30 :
+				assert inside[i,j] == result[0], (i, j)
+			assert np.allclose(uvw[i,j], result[1:], atol = 1e-5)
+	#Corners and edges are inside with the bias:
+	assert pointInTriangleArray(point, tri[:,None], TRI_BIAS)[0][:,30:].all()
+
+@pytest.mark.parametrize('smooth', [True, False])
+def test_project_on_triangles(smooth) :
+	tri_co = random_triangles(20, 7).astype(np.float32)
+	rng = np.random.RandomState(8)
+	tri_no = rng.random_sample((20, 3, 3)).astype(np.float32) - 0.5
+	face_no = np.cross(tri_co[:,1] - tri_co[:,0], tri_co[:,2] - tri_co[:,0])
+	face_no /= np.linalg.norm(face_no, axis = 1)[:,None]
+	#Vertices on corners, edges and inside the triangles
+	tri = np.concatenate((rng.randint(0, 20, 50), np.arange(20), np.arange(20)))
+	uvw = np.concatenate((rng.dirichlet((1, 1, 1), 50), np.tile([[1, 0, 0]], (20, 1)), np.tile([[0, 0.5, 0.5]], (20, 1))))
+	depth = rng.random_sample(len(tri)) - 0.5
+	co = projectOnTriangles(tri_co, tri_no, face_no, tri, uvw, depth, smooth)
+	for i in range(len(tri)) :
+		f = face(tri_co[tri[i]], tri_no[tri[i]])
+		weights = Vector(uvw[i])
+		nor = averageNorm(f, weights) if smooth else Vector(face_no[tri[i]])
+		expected = averageCo(f, weights) + nor * depth[i]
+		assert np.allclose(co[i], expected, atol = 1e-4), i
+
+def test_collide_tri_rect() :
+	tri = np.random.RandomState(8).random_sample((200, 3, 2))
+	rect_min = np.random.RandomState(9).random_sample((200, 2)) * 0.8
+	rect_max = rect_min + 0.05
+	collide = collideTriAARectArray(tri, rect_min, rect_max)
+	assert 0 < np.count_nonzero(collide) < len(tri)
+	for i in range(len(tri)) :
+		assert collideTriAARect2D(Vector(tri[i,0]), Vector(tri[i,1]), Vector(tri[i,2]), Vector(rect_min[i]), Vector(rect_max[i])) == collide[i], i
+
+class Vertices(list) :
+	"""
+	Stand-in of the mesh vertex collection, coordinates are read with foreach_get.
+	"""
+	def foreach_get(self, name, out) :
+		out[:] = np.array(self, dtype=np.float32).reshape(-1)
+
+def test_find_min_max(blender) :
+	funcs_blender = blender.module('funcs_blender')
+	co = np.random.RandomState(10).random_sample((300, 3)).astype(np.float32) * 4 - 2
+	(vMin, vMax) = funcs_blender.findMinMax(types.SimpleNamespace(vertices = Vertices(co.tolist())))
+	assert np.allclose(vMin, co.min(axis = 0)) and np.allclose(vMax, co.max(axis = 0))
+	(vMin, vMax) = funcs_blender.findMinMax(types.SimpleNamespace(vertices = Vertices()))
+	assert vMin.length == 0 and vMax.length == 0
@@ -0,0 +1,89 @@
+#  test_lazy_ops.py (c) 2016 Mattias Fredriksson
+#
+# ##### BEGIN GPL LICENSE BLOCK #####
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+# ##### END GPL LICENSE BLOCK #####
+
+#The operator stubs import their implementation module on the first call and replace themselves with the implementation.
+
+import sys, types, importlib
+
+IMPL_MODULES = ['uv_project', 'project', 'mesh_mirror_script', 'align_to_view', 'proj_data', 'target_cache', 'uv_grid']
+
+class Implementation :
+	"""
+	Implementation of the align operator recording the calls, replacing the view dependent align_to_view module.
+	"""
+	calls = []
+	def invoke(self, context, event) :
+		Implementation.calls.append('invoke')
+		return self.execute(context)
+	def execute(self, context) :
+		Implementation.calls.append('execute')
+		return {'FINISHED'}
+
+def count_loads(monkeypatch, lazy_ops) :
+	loaded = []
+	load_implementation = lazy_ops.load_implementation
+	def counting_load(cls) :
+		loaded.append(cls)
+		load_implementation(cls)
+	monkeypatch.setattr(lazy_ops, 'load_implementation', counting_load)
+	return loaded
+
+def test_import_defers_implementations(blender) :
+	importlib.import_module('projection_ops')
+	assert [name for name in IMPL_MODULES if 'projection_ops.' + name in sys.modules] == []
+
+def test_stub_loads_implementation_once(blender, monkeypatch) :
+	lazy_ops = blender.module('lazy_ops')
+	module = types.ModuleType('projection_ops.align_to_view')
+	module.MESH_OT_AlignSelection = type('MESH_OT_AlignSelection', (Implementation,), {})
+	monkeypatch.setitem(sys.modules, 'projection_ops.align_to_view', module)
+	Implementation.calls = []
+	loaded = count_loads(monkeypatch, lazy_ops)
+
+	op_type = lazy_ops.MESH_OT_AlignSelection
+	idname = op_type.bl_idname
+	assert op_type.execute is lazy_ops.lazy_execute
+	#First call loads the implementation and forwards the call
+	assert op_type().invoke(None, None) == {'FINISHED'}
+	assert loaded == [op_type]
+	assert op_type.invoke is Implementation.invoke
+	assert op_type.execute is Implementation.execute
+	#Later calls, on new operator instances as well, go directly to the implementation
+	for i in range(3) :
+		assert op_type().execute(None) == {'FINISHED'}
+		assert op_type().invoke(None, None) == {'FINISHED'}
+	assert loaded == [op_type]
+	assert Implementation.calls == ['invoke', 'execute'] + ['execute', 'invoke', 'execute'] * 3
+	#Operator definition is kept
+	assert op_type.bl_idname == idname
+	assert op_type.__module__ == lazy_ops.__name__
+
+def test_load_real_implementations(blender) :
+	lazy_ops = blender.module('lazy_ops')
+	for op_type in lazy_ops.operators :
+		definition = dict(vars(op_type))
+		lazy_ops.load_implementation(op_type)
+		impl = getattr(sys.modules['projection_ops.' + op_type.impl_module], op_type.__name__)
+		for name in ['invoke', 'execute', 'modal'] :
+			if name in definition :
+				assert getattr(op_type, name) is getattr(impl, name), op_type.__name__ + '.' + name
+		#Registration attributes and properties are not replaced
+		for name in ['bl_idname', 'bl_label', 'bl_options', '__annotations__'] :
+			if name in definition :
+				assert vars(op_type)[name] is definition[name], op_type.__name__ + '.' + name
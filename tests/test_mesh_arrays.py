@@ -0,0 +1,69 @@
+#  test_mesh_arrays.py (c) 2016 Mattias Fredriksson
+#
+# ##### BEGIN GPL LICENSE BLOCK #####
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+# ##### END GPL LICENSE BLOCK #####
+
+#Transform of the mesh arrays against the normals recalculated from the transformed positions and the scalar inverse transpose.
+
+import numpy as np
+import pytest
+
+from math import radians
+from mathutils import Matrix, Vector
+from mesh_data import plane_grid
+
+def curved_mesh(mesh_arrays, n = 6) :
+	"""
+	Curved n x n plane, vertex normals are the normalized sum of the adjacent face normals.
+	"""
+	(vert_co, vert_no, tri_vert, tri_uv, face_no) = plane_grid(n)
+	vert_co[:,2] = 0.2 * np.sin(vert_co[:,0] * 3) * np.cos(vert_co[:,1] * 2)
+	tri_co = vert_co[tri_vert]
+	face_no = np.cross(tri_co[:,1] - tri_co[:,0], tri_co[:,2] - tri_co[:,0])
+	face_no /= np.linalg.norm(face_no, axis = 1)[:,None]
+	vert_no = np.zeros_like(vert_co)
+	for i in range(3) :
+		np.add.at(vert_no, tri_vert[:,i], face_no)
+	vert_no /= np.linalg.norm(vert_no, axis = 1)[:,None]
+	return mesh_arrays.MeshArrays(vert_co, vert_no, tri_vert, tri_vert, np.arange(len(tri_vert)), face_no)
+
+def scale_matrix(scale) :
+	mat = Matrix.Identity(4)
+	for i in range(3) :
+		mat[i][i] = scale[i]
+	return mat
+
+#Non-uniform scale, rotated and translated, and a mirroring negative scale
+@pytest.mark.parametrize('scale', [(3.0, 0.5, 1.0), (1.0, 1.0, 4.0), (-2.0, 1.0, 0.5)])
+def test_transform_normals_non_uniform_scale(blender, scale) :
+	mesh_arrays = blender.module('mesh_arrays')
+	mesh = curved_mesh(mesh_arrays)
+	vert_no = mesh.vert_no.copy()
+	matrix = Matrix.Translation((0.5, -1.0, 2.0)) @ Matrix.Rotation(radians(30), 4, Vector((1, 2, 3)).normalized()) @ scale_matrix(scale)
+	mesh.transform(matrix)
+	#Face normals equal the normals recalculated from the transformed corners, also following the flipped winding:
+	tri_co = mesh.tri_co().astype(np.float64)
+	face_no = np.cross(tri_co[:,1] - tri_co[:,0], tri_co[:,2] - tri_co[:,0])
+	face_no /= np.linalg.norm(face_no, axis = 1)[:,None]
+	assert np.allclose(mesh.tri_normal, face_no, atol = 1e-5)
+	#Vertex normals with the scalar inverse transpose, flipped by the determinant sign:
+	normal_matrix = matrix.to_3x3().inverted().transposed()
+	sign = 1 if matrix.to_3x3().determinant() > 0 else -1
+	for (no, transformed) in zip(vert_no, mesh.vert_no) :
+		assert np.allclose(transformed, (normal_matrix @ Vector(no)).normalized() * sign, atol = 1e-5)
+	#Normals remain perpendicular to the transformed surface
+	assert np.allclose(np.einsum('ij,ij->i', tri_co[:,1] - tri_co[:,0], mesh.tri_normal), 0, atol = 1e-5)
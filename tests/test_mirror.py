@@ -0,0 +1,178 @@
+#  test_mirror.py (c) 2016 Mattias Fredriksson
+#
+# ##### BEGIN GPL LICENSE BLOCK #####
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+# ##### END GPL LICENSE BLOCK #####
+
+#The batched mirror surface search in mesh_mirror_script.py compared with scalar reference implementations.
+
+import types
+import numpy as np
+import pytest
+
+from mathutils import Vector
+from mesh_data import plane_grid
+from projection_ops.core.tri import normalTriIntersectionArray
+from projection_ops.funcs_tri import pointInTriangle
+
+def mirror_surface(mesh_mirror_script, mesh_arrays, n = 6) :
+	"""
+	Curved n x n plane used as mirror surface, vertex normals are the normalized sum of the adjacent face normals.
+	Returns: Touple of the MirrorArrays and the triangle vertex indices
+	"""
+	(vert_co, vert_no, tri_vert, tri_uv, face_no) = plane_grid(n)
+	vert_co[:,2] = 0.2 * np.sin(vert_co[:,0] * 3) * np.cos(vert_co[:,1] * 2)
+	tri_co = vert_co[tri_vert]
+	face_no = np.cross(tri_co[:,1] - tri_co[:,0], tri_co[:,2] - tri_co[:,0])
+	face_no /= np.linalg.norm(face_no, axis = 1)[:,None]
+	vert_no = np.zeros_like(vert_co)
+	for i in range(3) :
+		np.add.at(vert_no, tri_vert[:,i], face_no)
+	vert_no /= np.linalg.norm(vert_no, axis = 1)[:,None]
+	mesh = mesh_arrays.MeshArrays(vert_co, vert_no, tri_vert, tri_vert, np.arange(len(tri_vert)), face_no)
+	return (mesh_mirror_script.MirrorArrays(mesh), tri_vert)
+
+def source_verts(count, seed = 0) :
+	"""
+	Stand-in of the bmesh verts of the mirrored mesh, positions above the mirror surface.
+	"""
+	co = np.random.RandomState(seed).random_sample((count, 3)) * (1.2, 1.2, 0.5) - (0.1, 0.1, -0.05)
+	return [types.SimpleNamespace(co = Vector(c), index = i) for (i, c) in enumerate(co)]
+
+def intersect_scalar(co, mirror, tri) :
+	"""
+	Scalar reference of MirrorArrays.intersect: the triangle is offset along the vertex normals to the plane parallel
+	to the face containing the point, which is then tested with funcs_tri.pointInTriangle.
+	Returns: Distance to the triangle plane if the point intersects, otherwise None.
+	"""
+	face_no = Vector(mirror.face_no[tri])
+	t = face_no.dot(co - Vector(mirror.tri_co[tri,0]))
+	if t < 0 :
+		return None
+	corners = [Vector(mirror.tri_co[tri,i]) + Vector(mirror.tri_no[tri,i]) * (t / face_no.dot(Vector(mirror.tri_no[tri,i]))) for i in range(3)]
+	if not pointInTriangle(co, corners[0], corners[1], corners[2])[0] :
+		return None
+	return t
+
+@pytest.fixture
+def mirror(blender) :
+	return (blender.module('mesh_mirror_script'), blender.module('mesh_arrays'))
+
+def ambiguous(co, surface, bias = 0.001) :
+	"""
+	Check if the point is within the bias of an edge of the offset triangles, the batched and scalar tests may then differ.
+	"""
+	inner = normalTriIntersectionArray(np.array(co), surface.tri_co, surface.tri_no, surface.face_no, -bias)[0]
+	outer = normalTriIntersectionArray(np.array(co), surface.tri_co, surface.tri_no, surface.face_no, bias)[0]
+	return np.any(inner != outer)
+
+def closest_scalar(co, surface) :
+	hits = [(intersect_scalar(co, surface, tri), tri) for tri in range(surface.count)]
+	hits = [(t, tri) for (t, tri) in hits if t is not None]
+	return min(hits) if len(hits) > 0 else None
+
+@pytest.mark.parametrize('batch_size', [1 << 20, 100])
+def test_find_closest_tris(mirror, monkeypatch, batch_size) :
+	(mesh_mirror_script, mesh_arrays) = mirror
+	Mirror = mesh_mirror_script.MESH_OT_MirrorMesh
+	monkeypatch.setattr(mesh_mirror_script.MirrorArrays, 'batch_size', batch_size)
+	(surface, tri_vert) = mirror_surface(mesh_mirror_script, mesh_arrays)
+	verts = source_verts(150)
+	batched = [mesh_mirror_script.SearchData() for v in verts]
+	Mirror.findClosestTris(types.SimpleNamespace(verts = verts), surface, batched)
+	single = [mesh_mirror_script.SearchData() for v in verts]
+	for vert in verts :
+		Mirror.findClosestTri(vert, surface, single)
+	hits = 0
+	for vert in verts :
+		i = vert.index
+		if ambiguous(vert.co, surface) :
+			continue
+		expected = closest_scalar(vert.co, surface)
+		for data in [batched[i], single[i]] :
+			assert data.mirrored() == (expected is not None), i
+			if expected is not None :
+				assert data._mirrorData._mirrorTri == expected[1]
+				assert data._mirrorData._t == pytest.approx(expected[0], abs = 1e-5)
+		hits += expected is not None
+	assert hits > 50
+
+def adjacency_scalar(tri_vert) :
+	"""
+	Scalar reference of triangleAdjacency: triangles sharing an edge, in triangle order.
+	"""
+	edges = {}
+	for (i, tri) in enumerate(tri_vert.tolist()) :
+		for j in range(3) :
+			edges.setdefault(tuple(sorted((tri[j], tri[(j + 1) % 3]))), []).append(i)
+	adjacent = [[] for tri in tri_vert]
+	for tris in edges.values() :
+		for a in tris :
+			adjacent[a].extend([b for b in tris if b != a])
+	return [sorted(a) for a in adjacent]
+
+def test_triangle_adjacency(mirror) :
+	(mesh_mirror_script, mesh_arrays) = mirror
+	tri_vert = plane_grid(5)[2]
+	#Non-manifold edge shared by three triangles and a separate triangle
+	tri_vert = np.concatenate((tri_vert, [[0, 1, 40], [41, 42, 43]])).astype(np.int32)
+	(start, tris) = mesh_mirror_script.triangleAdjacency(tri_vert)
+	assert [sorted(tris[start[i]:start[i + 1]].tolist()) for i in range(len(tri_vert))] == adjacency_scalar(tri_vert)
+	(start, tris) = mesh_mirror_script.triangleAdjacency(np.zeros((0, 3), dtype=np.int32))
+	assert list(start) == [0] and len(tris) == 0
+
+def first_scalar(co, surface, adjacent, first) :
+	"""
+	Scalar reference of findFirstTri: faces are tested one at a time, ring by ring around the first face.
+	"""
+	tagged = set([first])
+	ring = [first]
+	while len(ring) > 0 :
+		for tri in ring :
+			t = intersect_scalar(co, surface, tri)
+			if t is not None :
+				return (t, tri)
+		next = []
+		for tri in ring :
+			for other in adjacent[tri] :
+				if other not in tagged :
+					next.append(other)
+					tagged.add(other)
+		ring = next
+	return None
+
+def test_find_first_tri(mirror) :
+	(mesh_mirror_script, mesh_arrays) = mirror
+	Mirror = mesh_mirror_script.MESH_OT_MirrorMesh
+	(surface, tri_vert) = mirror_surface(mesh_mirror_script, mesh_arrays)
+	adjacent = adjacency_scalar(tri_vert)
+	verts = source_verts(100, 1)
+	rng = np.random.RandomState(2)
+	hits = 0
+	for vert in verts :
+		if ambiguous(vert.co, surface) :
+			continue
+		first = int(rng.randint(surface.count))
+		data = [mesh_mirror_script.SearchData() for v in verts]
+		Mirror.findFirstTri(vert, first, surface, data)
+		expected = first_scalar(vert.co, surface, adjacent, first)
+		mirror_data = data[vert.index]._mirrorData
+		assert (mirror_data is not None) == (expected is not None)
+		if expected is not None :
+			assert mirror_data._mirrorTri == expected[1]
+			assert mirror_data._t == pytest.approx(expected[0], abs = 1e-5)
+			hits += 1
+	assert hits > 30
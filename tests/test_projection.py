@@ -0,0 +1,125 @@
+#  test_projection.py (c) 2016 Mattias Fredriksson
+#
+# ##### BEGIN GPL LICENSE BLOCK #####
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+# ##### END GPL LICENSE BLOCK #####
+
+#Projection stage of ProjectionData on headless projection data (plane target, random sources), see headless_projection.py.
+
+import types
+import numpy as np
+import pytest
+
+from mathutils import Vector
+from mesh_data import plane_grid, random_triangles
+import headless_projection
+from headless_projection import projection_data, setting
+
+#Vertices in each source mesh
+VERTS = 1000
+
+@pytest.fixture
+def proj_data(blender) :
+	return blender.module('proj_data')
+
+#Chunks of 1 vertex project each vertex separately like the per vertex loop the chunks replaced
+@pytest.mark.parametrize('chunk_size', [1, 7, VERTS - 1, VERTS, VERTS + 1])
+def test_chunks_match_single_pass(proj_data, chunk_size) :
+	#Rotated and moved mapping so part of the vertices fall outside the uv map and are traced to the closest faces
+	run = setting(proj_data, moveXY = (0.3, 0.1), rotation = 20)
+	data = projection_data(proj_data, 1, VERTS)
+	meshData = data.meshList[0]
+	(expected, hit) = data.projectChunk(meshData, run, np.arange(VERTS))
+	assert 0 < np.count_nonzero(hit) < VERTS
+	vertex_memory = meshData.chunk_memory / VERTS
+	(co, select, count_partial) = data.projectSource(meshData, run, chunk_size)
+	assert np.allclose(co, expected)
+	assert np.array_equal(select, ~hit)
+	assert count_partial == np.count_nonzero(hit)
+	#Temporaries are bounded by the chunk size
+	assert meshData.chunk_memory == vertex_memory * min(chunk_size, VERTS)
+
+def calc_vert_proj_point_scalar(proj_data, tri_co, tri_no, face_no, uvw, depth, setting, clamp) :
+	#Per vertex calcVertProjPoint and calcVertProjPointClamp on a face stand-in, replaced by the triangle frame arrays
+	face = types.SimpleNamespace(normal = Vector(face_no), verts = [types.SimpleNamespace(co = Vector(co), normal = Vector(no)) for (co, no) in zip(tri_co, tri_no)])
+	uvw = Vector(uvw)
+	depth += setting.depth
+	co = proj_data.averageCo(face, uvw)
+	if not setting.smooth :
+		return co + face.normal * depth
+	if clamp :
+		uvw = Vector([min(max(w, 0), 1) for w in uvw])
+	return co + proj_data.averageNorm(face, uvw) * depth
+
+@pytest.mark.parametrize('smooth', [True, False])
+def test_triangle_frames_match_scalar(proj_data, smooth) :
+	tri_co = random_triangles(30, 3).astype(np.float32)
+	rng = np.random.RandomState(4)
+	tri_no = rng.random_sample((30, 3, 3)).astype(np.float32) - 0.5
+	tri_no /= np.linalg.norm(tri_no, axis = 2)[:,:,None]
+	face_no = np.cross(tri_co[:,1] - tri_co[:,0], tri_co[:,2] - tri_co[:,0])
+	face_no /= np.linalg.norm(face_no, axis = 1)[:,None]
+	target = types.SimpleNamespace(tri_co = tri_co, tri_no = tri_no, face_no = face_no)
+	#Inside the triangles and outside (negative weights) for the clamped vertices missing the uv map
+	tri = rng.randint(0, 30, 200)
+	uvw = np.concatenate((rng.dirichlet((1, 1, 1), 100), rng.dirichlet((1, 1, 1), 100) * 1.6 - (0.3, 0.2, 0.1)))
+	depth = rng.random_sample(200) - 0.5
+	clamp = np.arange(200) >= 100
+	run = setting(proj_data, smooth = smooth, depth = 0.25)
+	co = proj_data.calcVertProjPointArray(target, tri, uvw, depth, run, clamp)
+	for i in range(len(tri)) :
+		expected = calc_vert_proj_point_scalar(proj_data, tri_co[tri[i]], tri_no[tri[i]], face_no[tri[i]], uvw[i], depth[i], run, clamp[i])
+		assert np.allclose(co[i], expected, atol = 1e-4), i
+
+def test_free_fails_loudly(blender, proj_data) :
+	warning = blender.bpy().types.Operator()
+	data = projection_data(proj_data, 2, 100, warning = warning)
+	assert not data.isReleased()
+	data.free()
+	assert data.isReleased()
+	assert data.target is None and data.bvh is None and data.uv_grid is None and data.meshList == []
+	with pytest.raises(RuntimeError) :
+		data.projectSources(setting(proj_data))
+	#Projecting the meshes reports the released data instead of silently writing nothing
+	assert data.projectMeshData(None, setting(proj_data)) == 0
+	assert [type for (type, message) in warning.reports] == [{'ERROR'}]
+
+def test_free_source_keeps_target(blender, proj_data) :
+	warning = blender.bpy().types.Operator()
+	data = projection_data(proj_data, 2, 100, warning = warning)
+	(target, bvh, uv_grid) = (data.target, data.bvh, data.uv_grid)
+	data.free_source()
+	assert data.isReleased() and data.meshList == []
+	assert data.target is target and data.bvh is bvh and data.uv_grid is uv_grid
+	assert data.projectMeshData(None, setting(proj_data)) == 0
+	assert [type for (type, message) in warning.reports] == [{'ERROR'}]
+	#Regenerated sources project on the kept target
+	data.meshList = [headless_projection.source_data(proj_data, 'Source0', 100, 0)]
+	assert not data.isReleased()
+	assert len(data.projectSources(setting(proj_data))) == 1
+
+def test_empty_uv_map_keeps_misses(proj_data) :
+	#Target without faces, no vertex has a face to be projected on
+	(vert_co, vert_no, tri_vert, tri_uv, face_no) = plane_grid(4)
+	(tri_vert, tri_uv, face_no) = (tri_vert[:0], tri_uv[:0], face_no[:0])
+	data = projection_data(proj_data, 1, 100)
+	data.target = proj_data.TargetData(proj_data.build_bvh(vert_co, tri_vert, 0.00001), proj_data.uv_index_from_tri_uv(tri_uv),
+		proj_data.SeamTable.from_triangles(tri_vert, tri_uv), vert_co, tri_vert, vert_co[tri_vert], vert_no[tri_vert], face_no)
+	data.uv_grid = data.target.uv_grid
+	meshData = data.meshList[0]
+	(co, select, count_partial) = data.projectSource(meshData, setting(proj_data, moveXY = (0.3, 0.1)), 32)
+	assert count_partial == 0 and select.all()
+	assert np.array_equal(co, meshData.co)
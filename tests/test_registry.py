@@ -0,0 +1,83 @@
+#  test_registry.py (c) 2016 Mattias Fredriksson
+#
+# ##### BEGIN GPL LICENSE BLOCK #####
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+# ##### END GPL LICENSE BLOCK #####
+
+#Register/unregister round trips of the package against the stand-in bpy.utils of each api flavour.
+
+import sys, types, importlib
+import pytest
+
+def load_package(blender) :
+	return importlib.import_module('projection_ops')
+
+def test_register_round_trip(blender_version) :
+	package = load_package(blender_version)
+	utils = blender_version.bpy().utils
+	for i in range(2) :
+		package.register()
+		assert utils.registered == package.operators
+		assert package.registered == package.operators
+		package.unregister()
+		assert utils.registered == []
+		assert package.registered == []
+
+def test_register_update_handler(blender_version) :
+	package = load_package(blender_version)
+	compat = blender_version.module('compat')
+	lazy_ops = blender_version.module('lazy_ops')
+	package.register()
+	#The handler is registered with the operators, without importing the cache module
+	assert compat.update_handlers() == [lazy_ops.depsgraph_update_handler]
+	assert 'projection_ops.target_cache' not in sys.modules
+	lazy_ops.depsgraph_update_handler(None)
+	package.unregister()
+	assert compat.update_handlers() == []
+	assert blender_version.bpy().utils.registered == []
+
+def test_unregister_clears_cache(blender_version) :
+	package = load_package(blender_version)
+	package.register()
+	target_cache = blender_version.module('target_cache')
+	data = types.SimpleNamespace(size = 1, free = lambda : None)
+	target_cache.target_cache.put(('Target',), data)
+	package.unregister()
+	assert len(target_cache.target_cache.entries) == 0
+
+def test_unregister_skips_unregistered_classes(blender_version) :
+	package = load_package(blender_version)
+	package.register()
+	#Classes unregistered elsewhere (e.g. by a failed reload) are skipped
+	blender_version.bpy().utils.unregister_class(package.operators[1])
+	package.unregister()
+	assert blender_version.bpy().utils.registered == []
+	assert package.registered == []
+
+def test_operator_properties(blender_version) :
+	package = load_package(blender_version)
+	compat = blender_version.module('compat')
+	lazy_ops = blender_version.module('lazy_ops')
+	for op in package.operators :
+		#Properties are declared the way the api version collects them
+		if compat.API_28 :
+			props = dict(getattr(lazy_ops.UVProjectProperties, '__annotations__', {}))
+			for cls in reversed(op.__mro__) :
+				props.update(cls.__dict__.get('__annotations__', {}))
+			assert len(props) > 0 and all([compat.is_property(p) for p in props.values()]), op.__name__
+			assert not any([compat.is_property(v) for v in vars(op).values()])
+		else :
+			assert any([compat.is_property(getattr(op, name)) for name in dir(op)]), op.__name__
@@ -0,0 +1,94 @@
+#  test_seams.py (c) 2016 Mattias Fredriksson
+#
+# ##### BEGIN GPL LICENSE BLOCK #####
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+# ##### END GPL LICENSE BLOCK #####
+
+import numpy as np
+
+from mesh_data import plane_grid
+from projection_ops.core.seams import SeamTable
+from projection_ops.core.tri import distance_edge_uv
+from projection_ops.core.uv_grid import UVGrid
+
+def split_strip() :
+	"""
+	Two quads sharing the edge (1, 4) in 3D, unwrapped to separate uv islands with a gap between them:
+	the left quad covers u [0, 0.25] and the right quad u [0.75, 1], the seam maps u + 0.5 onto the right island.
+	"""
+	tri_vert = np.array([[0, 1, 4], [0, 4, 3], [1, 2, 5], [1, 5, 4]], dtype=np.int32)
+	#3D vertices on a 3 x 2 grid, vertex i at (i % 3, i // 3):
+	x = tri_vert % 3
+	y = tri_vert // 3
+	u = np.where(np.arange(4)[:,None] < 2, x * 0.25, 0.75 + (x - 1) * 0.25)
+	tri_uv = np.stack((u, y * 0.25), axis = 2).astype(np.float64)
+	return (tri_vert, tri_uv)
+
+def closest_faces(tri_uv, points) :
+	"""
+	Scalar reference for the closest face search: distance to the closest edge over all faces.
+	"""
+	dist = np.full(len(points), np.inf)
+	for face in tri_uv :
+		for x in range(3) :
+			e0 = np.broadcast_to(face[x], points.shape)
+			e1 = np.broadcast_to(face[(x + 1)%3], points.shape)
+			dist = np.minimum(dist, distance_edge_uv(e0, e1, points))
+	return dist
+
+def test_gap_points_continue_across_seam() :
+	(tri_vert, tri_uv) = split_strip()
+	grid = UVGrid.from_tri_uv(tri_uv, 0.05)
+	seams = SeamTable.from_triangles(tri_vert, tri_uv)
+	points = np.array([[0.3, 0.1], [0.7, 0.15]])
+	#The points are in empty partitions of the gap between the islands:
+	assert np.all(grid.cell_range(points)[1] == 0)
+	assert not grid.trace_points_uv(points)[0].any()
+	(tri, uvw, dist, edge) = grid.trace_close_points_uv(points)
+	assert np.allclose(dist, 0.05)
+	assert list(tri // 2) == [0, 1]
+	(hit, adj, bary) = seams.continue_points(tri, edge, points)
+	assert hit.all()
+	#Continued onto the other island, at the same offset from the seam:
+	assert list(adj // 2) == [1, 0]
+	continued = np.einsum('ijk,ij->ik', tri_uv[adj], bary)
+	assert np.allclose(continued, [[0.8, 0.1], [0.2, 0.15]])
+
+def test_points_without_face_remain_misses() :
+	#Triangle -1 and edge 2 indexes the last edge of the table (a seam edge) if used unmasked
+	(tri_vert, tri_uv) = split_strip()
+	seams = SeamTable.from_triangles(tri_vert, tri_uv)
+	assert seams.adj_tri[-1] >= 0
+	tri = np.array([-1, -1, 0], dtype=np.int32)
+	edge = np.array([2, -1, 1], dtype=np.int8)
+	points = np.array([[0.3, 0.1], [0.3, 0.1], [0.3, 0.1]])
+	(hit, adj, bary) = seams.continue_points(tri, edge, points)
+	assert list(hit) == [False, False, True]
+	assert list(adj[:2]) == [-1, -1]
+
+def test_closest_face_matches_all_faces() :
+	#Plane with faces removed, leaving empty partitions inside and around the uv map
+	tri_uv = plane_grid(6)[3]
+	rng = np.random.RandomState(1)
+	tri_uv = tri_uv[rng.random_sample(len(tri_uv)) < 0.3]
+	grid = UVGrid.from_tri_uv(tri_uv, 0.1)
+	points = rng.random_sample((500, 2)) * 1.6 - 0.3
+	(tri, uvw, dist, edge) = grid.trace_close_points_uv(points)
+	assert np.all(tri >= 0)
+	assert np.allclose(dist, closest_faces(tri_uv, points))
+	#The edge index and distance agree with the returned face:
+	face = tri_uv[tri]
+	assert np.allclose(dist, distance_edge_uv(face[np.arange(len(tri)), edge], face[np.arange(len(tri)), (edge + 1) % 3], points))
@@ -0,0 +1,207 @@
+#  test_target_cache.py (c) 2016 Mattias Fredriksson
+#
+# ##### BEGIN GPL LICENSE BLOCK #####
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+# ##### END GPL LICENSE BLOCK #####
+
+import os, types
+import numpy as np
+import pytest
+
+from mathutils import Matrix
+from mesh_data import plane_grid
+
+def target_data(target_cache, n = 4) :
+	"""
+	Build the target data of a n x n plane, as done by ProjectionData.createTargetData.
+	"""
+	(vert_co, vert_no, tri_vert, tri_uv, face_no) = plane_grid(n)
+	return target_cache.TargetData(target_cache.build_bvh(vert_co, tri_vert, 0.00001), target_cache.uv_index_from_tri_uv(tri_uv),
+		target_cache.SeamTable.from_triangles(tri_vert, tri_uv), vert_co, tri_vert, vert_co[tri_vert], vert_no[tri_vert], face_no)
+
+def key(name, x = 0.0, uv_name = 'UVMap') :
+	return (name, (1.0, 0.0, 0.0, x) + (0.0, 1.0, 0.0, 0.0) + (0.0, 0.0, 1.0, 0.0) + (0.0, 0.0, 0.0, 1.0), uv_name, 0.00001, None, 2)
+
+def target_object(name, x = 0.0, uv_name = 'UVMap') :
+	uv = types.SimpleNamespace(name = uv_name) if uv_name else None
+	return types.SimpleNamespace(name = name, type = 'MESH', matrix_world = Matrix.Translation((x, 0, 0)),
+		data = types.SimpleNamespace(uv_layers = types.SimpleNamespace(active = uv)))
+
+@pytest.fixture
+def target_cache(blender) :
+	return blender.module('target_cache')
+
+def test_put_get(target_cache) :
+	cache = target_cache.TargetCache(1 << 30)
+	data = target_data(target_cache)
+	cache.put(key('A'), data)
+	assert cache.get(key('A')) is data
+	assert cache.get(key('A', 1.0)) is None
+	assert cache.size == data.size
+	#Replacing an entry does not count the old data
+	cache.put(key('A'), data)
+	assert cache.size == data.size
+
+def test_target_key(target_cache) :
+	#The key is generated from the object without reading the mesh
+	assert target_cache.target_key(target_object('A', 2.0), 0.00001, None, 2) == key('A', 2.0)
+	assert target_cache.target_key(target_object('A', uv_name = None), 0.00001, None, 2)[2] is None
+
+def test_evict_least_recently_used(target_cache) :
+	data = [target_data(target_cache) for i in range(3)]
+	cache = target_cache.TargetCache(data[0].size * 2)
+	cache.put(key('A'), data[0])
+	cache.put(key('B'), data[1])
+	#Fetching A makes B the least recently used entry
+	cache.get(key('A'))
+	cache.put(key('C'), data[2])
+	assert list(cache.entries.keys()) == [key('A'), key('C')]
+	assert cache.size == data[0].size * 2
+
+def test_evict_keeps_latest(target_cache) :
+	data = target_data(target_cache)
+	cache = target_cache.TargetCache(data.size // 2)
+	cache.put(key('A'), target_data(target_cache))
+	cache.put(key('B'), data)
+	#The latest entry is kept even if it exceeds the budget on its own
+	assert list(cache.entries.keys()) == [key('B')]
+	assert cache.get(key('B')) is data
+
+def test_invalidate_keeps_latest(target_cache) :
+	cache = target_cache.TargetCache(1 << 30)
+	for k in [key('A', 0.0), key('B', 0.0), key('A', 1.0), key('A', 2.0)] :
+		cache.put(k, target_data(target_cache))
+	latest = cache.get(key('A', 2.0))
+	cache.invalidate('A')
+	assert list(cache.entries.keys()) == [key('B', 0.0), key('A', 2.0)]
+	#The kept entry is never returned for the changed object, only used as base for refitting it
+	assert cache.get(key('A', 2.0)) is None
+	assert cache.get(key('B', 0.0)) is not None
+	assert cache.find_base(key('A', 2.0)) is latest
+	assert cache.find_base(key('A', 3.0)) is latest
+	assert cache.find_base(key('A', 3.0, 'UVMap.001')) is None
+	assert cache.find_base(key('C')) is None
+	#Storing the rebuilt data makes the key valid again
+	data = target_data(target_cache)
+	cache.put(key('A', 2.0), data)
+	assert cache.get(key('A', 2.0)) is data
+	assert len(cache.stale) == 0
+
+def test_update_handler_invalidates(blender, target_cache, monkeypatch) :
+	monkeypatch.setattr(target_cache, 'target_cache', target_cache.TargetCache(1 << 30))
+	target_cache.target_cache.put(key('A'), target_data(target_cache))
+	target_cache.target_cache.put(key('B'), target_data(target_cache))
+	#Geometry of A changed
+	lazy_ops = blender.module('lazy_ops')
+	monkeypatch.setattr(target_cache, 'updated_objects', lambda scene, *depsgraph : ['A'])
+	lazy_ops.depsgraph_update_handler(None, None)
+	assert target_cache.target_cache.get(key('A')) is None
+	assert target_cache.target_cache.get(key('B')) is not None
+
+def test_cache_hit_skips_reading_mesh(blender, target_cache, monkeypatch) :
+	proj_data = blender.module('proj_data')
+	monkeypatch.setattr(proj_data, 'target_cache', target_cache.TargetCache(1 << 30))
+	data = target_data(target_cache)
+	proj_data.target_cache.put(key('A'), data)
+	reads = []
+	monkeypatch.setattr(proj_data.MeshArrays, 'from_object', lambda *args : reads.append(args))
+	setting = types.SimpleNamespace(bias = 0.00001, auto_partition = False, occupancy = 4, partitions_per_face = 2, disk_cache = False)
+	projection = proj_data.ProjectionData(target_object('A'), None, None, None, True, None)
+	assert projection.generateTargetData(target_object('A'), None, setting)
+	assert projection.target is data and projection.uv_grid is data.uv_grid
+	assert reads == []
+
+def assert_same_target(refit, rebuilt, points) :
+	#Same triangle frames, uv traces, seams and bvh tree as the target data rebuilt from the changed mesh
+	for name in ['tri_co', 'tri_no', 'face_no'] :
+		assert np.array_equal(getattr(refit, name), getattr(rebuilt, name))
+	for (a, b) in zip(refit.uv_grid.trace_points_uv(points), rebuilt.uv_grid.trace_points_uv(points)) :
+		assert np.allclose(a, b)
+	for (a, b) in zip(refit.uv_grid.trace_close_points_uv(points), rebuilt.uv_grid.trace_close_points_uv(points)) :
+		assert np.allclose(a, b)
+	for (name, array) in refit.seams.to_arrays().items() :
+		assert np.array_equal(array, rebuilt.seams.to_arrays()[name])
+	#The stand-in bvh tree keeps the polygons it was built from
+	assert np.allclose(refit.bvh.co, rebuilt.bvh.co) and refit.bvh.polygons == rebuilt.bvh.polygons
+
+@pytest.mark.parametrize('change', ['co', 'uv'])
+def test_refit_matches_rebuild(target_cache, change) :
+	(vert_co, vert_no, tri_vert, tri_uv, face_no) = plane_grid(8)
+	base = target_cache.TargetData(target_cache.build_bvh(vert_co, tri_vert, 0.00001), target_cache.uv_index_from_tri_uv(tri_uv),
+		target_cache.SeamTable.from_triangles(tri_vert, tri_uv), vert_co, tri_vert, vert_co[tri_vert], vert_no[tri_vert], face_no)
+	(vert_co, tri_uv) = (vert_co.copy(), tri_uv.copy())
+	if change == 'co' :
+		#Lift the first corner of triangle 20
+		vert_co[tri_vert[20, 0], 2] += 0.05
+	else :
+		#Shrink triangle 20 in uv space, the only triangle with changed uv coordinates
+		tri_uv[20] = tri_uv[20].mean(axis = 0) + (tri_uv[20] - tri_uv[20].mean(axis = 0)) * 0.5
+	refit = base.refit(vert_co, vert_no, tri_vert, tri_uv, face_no, 2, 0.00001, None)
+	rebuilt = target_cache.TargetData(target_cache.build_bvh(vert_co, tri_vert, 0.00001), target_cache.uv_index_from_tri_uv(tri_uv),
+		target_cache.SeamTable.from_triangles(tri_vert, tri_uv), vert_co, tri_vert, vert_co[tri_vert], vert_no[tri_vert], face_no)
+	#Unchanged structures are reused
+	if change == 'co' :
+		assert refit.uv_grid is base.uv_grid and refit.seams is base.seams and refit.bvh is not base.bvh
+	else :
+		assert refit.bvh is base.bvh and refit.uv_grid is not base.uv_grid
+	points = np.random.RandomState(2).random_sample((400, 2)) * 1.2 - 0.1
+	assert_same_target(refit, rebuilt, points)
+
+def test_clear(target_cache) :
+	cache = target_cache.TargetCache(1 << 30)
+	data = target_data(target_cache)
+	cache.put(key('A'), data)
+	cache.clear()
+	assert len(cache.entries) == 0 and cache.size == 0
+	assert data.tri_co is None
+
+def disk_key(name, mesh_hash = 'a') :
+	#Disk entries are keyed with the mesh content hash appended, see target_cache.disk_key()
+	return key(name) + (mesh_hash,)
+
+@pytest.fixture
+def disk_cache(blender, target_cache, tmp_path) :
+	#Entries are written next to the saved .blend file
+	blender.bpy().data.filepath = str(tmp_path / 'scene.blend')
+	return target_cache.DiskCache(1 << 30)
+
+def test_disk_save_load(target_cache, disk_cache, tmp_path) :
+	data = target_data(target_cache)
+	assert disk_cache.load(disk_key('A')) is None
+	assert disk_cache.save(disk_key('A'), data)
+	assert disk_cache.directory() == str(tmp_path / 'projection_cache')
+	loaded = disk_cache.load(disk_key('A'))
+	assert loaded is not None
+	for (name, array) in data.to_arrays().items() :
+		assert np.array_equal(loaded.to_arrays()[name], array), name
+	#Entries only depend on the content, not the object name
+	assert disk_cache.load(disk_key('B')) is not None
+	assert disk_cache.load(disk_key('A', 'b')) is None
+
+def test_disk_version_mismatch(target_cache, disk_cache, monkeypatch) :
+	disk_cache.save(disk_key('A'), target_data(target_cache))
+	monkeypatch.setattr(target_cache.DiskCache, 'version', target_cache.DiskCache.version + 1)
+	assert disk_cache.load(disk_key('A')) is None
+
+def test_disk_evict(target_cache, disk_cache) :
+	data = target_data(target_cache)
+	disk_cache.save(disk_key('A', 'a'), data)
+	#Make the first entry the least recently used
+	os.utime(disk_cache.path(disk_key('A', 'a')), (0, 0))
+	disk_cache.budget = 1
+	disk_cache.save(disk_key('A', 'b'), data)
+	assert not os.path.isdir(disk_cache.path(disk_key('A', 'a')))
+	assert disk_cache.load(disk_key('A', 'b')) is not None
@@ -0,0 +1,159 @@
+#  test_uv_grid.py (c) 2016 Mattias Fredriksson
+#
+# ##### BEGIN GPL LICENSE BLOCK #####
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+# ##### END GPL LICENSE BLOCK #####
+
+import numpy as np
+import pytest
+
+from math import sqrt
+from mesh_data import plane_grid, random_triangles
+from projection_ops.core.uv_grid import UVGrid, TiledUVGrid, calc_partition_size
+from projection_ops.partition_grid import uv_index_from_tri_uv
+
+def test_unit_square_is_one_tile() :
+	#Faces ending on the u = 1 and v = 1 borders do not overlap the next tiles
+	tri_uv = plane_grid(8)[3]
+	tiles = TiledUVGrid.tile_faces(tri_uv)
+	assert list(tiles.keys()) == [(0, 0)]
+	assert np.array_equal(tiles[(0, 0)], np.arange(len(tri_uv)))
+	assert isinstance(uv_index_from_tri_uv(tri_uv), UVGrid)
+
+def test_udim_tiles() :
+	tri_uv = plane_grid(4)[3]
+	#Second copy moved into tile 1002, one face crossing the border between the tiles
+	cross = np.array([[[0.9, 0.5], [1.1, 0.5], [1.0, 0.6]]])
+	tri_uv = np.concatenate((tri_uv, tri_uv + (1, 0), cross))
+	tiles = TiledUVGrid.tile_faces(tri_uv)
+	assert sorted(tiles.keys()) == [(0, 0), (1, 0)]
+	face_count = len(tri_uv) // 2
+	assert np.array_equal(tiles[(0, 0)], np.append(np.arange(face_count), len(tri_uv) - 1))
+	assert np.array_equal(tiles[(1, 0)], np.arange(face_count, len(tri_uv)))
+
+def test_degenerate_face_on_border() :
+	#Faces without extent on a tile border belong to the tile of their low corner
+	tri_uv = np.array([[[1.0, 0.2], [1.0, 0.4], [1.0, 0.3]]])
+	assert list(TiledUVGrid.tile_faces(tri_uv).keys()) == [(1, 0)]
+
+def test_close_points_in_empty_tile() :
+	#Islands in tile 1001 and 1003, points in the empty tile 1002 trace the closest occupied tile
+	tri_uv = plane_grid(4)[3]
+	tri_uv = np.concatenate((tri_uv, tri_uv + (2, 0)))
+	grid = uv_index_from_tri_uv(tri_uv)
+	assert isinstance(grid, TiledUVGrid)
+	points = np.array([[1.2, 0.5], [1.8, 0.5], [-3.0, 0.5]])
+	(tri, uvw, dist, edge) = grid.trace_close_points_uv(points)
+	assert list(tri >= len(tri_uv) // 2) == [False, True, False]
+	assert np.allclose(dist, [0.2, 0.2, 3.0])
+
+def calc_partition_size_scalar(tri_uv, occupancy) :
+	#Per face loop of the PartitionGrid2D.calc_partition_size the array version replaced
+	area = 0
+	extent = 0
+	for (p0, p1, p2) in tri_uv :
+		e0 = p1 - p0
+		e1 = p2 - p0
+		area += abs(e0[0] * e1[1] - e1[0] * e0[1]) * 0.5
+		extent += max(p0[0], p1[0], p2[0]) - min(p0[0], p1[0], p2[0]) + max(p0[1], p1[1], p2[1]) - min(p0[1], p1[1], p2[1])
+	num_face = len(tri_uv)
+	if area <= 0 or num_face == 0 :
+		return None
+	occupancy = max(occupancy, 1)
+	return (sqrt(extent * extent + 4 * num_face * (occupancy - 1) * area) - extent) / (2 * num_face)
+
+@pytest.mark.parametrize('occupancy', [0.5, 2, 4, 16])
+def test_partition_size_matches_scalar(occupancy) :
+	for tri_uv in [plane_grid(16)[3], random_triangles(500)[:,:,:2], plane_grid(4)[3] * (3, 0.5)] :
+		assert np.isclose(calc_partition_size(tri_uv, occupancy), calc_partition_size_scalar(tri_uv, occupancy))
+	#No uv area:
+	assert calc_partition_size(np.zeros((4, 3, 2)), occupancy) is None
+	assert calc_partition_size(np.zeros((0, 3, 2)), occupancy) is None
+
+@pytest.mark.parametrize('occupancy', [2, 4, 8, 16])
+def test_fitted_grid_occupancy(occupancy) :
+	#The estimate assumes non-overlapping islands, on a regular uv map the achieved mean is close to the target
+	for n in [16, 64] :
+		grid = UVGrid.from_tri_uv(plane_grid(n)[3], 2, 0.00001, occupancy)
+		assert abs(grid.mean_occupancy() - occupancy) < occupancy * 0.2
+
+def test_manual_partitions_without_occupancy() :
+	#Zero area uv maps and disabled auto partitions use the manual faces per partition
+	tri_uv = plane_grid(8)[3]
+	grid = UVGrid.from_tri_uv(tri_uv, 2, 0.00001, None)
+	partitions = int(np.ceil(sqrt(len(tri_uv) / 2 * 4) / 2))
+	assert grid.partitions == (partitions, partitions)
+	assert UVGrid.from_tri_uv(tri_uv * (1, 0), 2, 0.00001, 4).partitions[0] == UVGrid.from_tri_uv(tri_uv * (1, 0), 2, 0.00001, None).partitions[0]
+
+@pytest.fixture
+def old_numpy(monkeypatch) :
+	"""
+	Numpy without np.isin and the axis argument of np.unique (added in numpy 1.13).
+	"""
+	unique = np.unique
+	def unique_no_axis(array, *args, **kwargs) :
+		if 'axis' in kwargs :
+			raise TypeError("unique() got an unexpected keyword argument 'axis'")
+		return unique(array, *args, **kwargs)
+	def isin(*args, **kwargs) :
+		raise AttributeError("module 'numpy' has no attribute 'isin'")
+	monkeypatch.setattr(np, 'unique', unique_no_axis)
+	monkeypatch.setattr(np, 'isin', isin)
+
+def tiled_uv(seed = 0) :
+	#Islands in tile 1001, 1003 and 1012, in random face order
+	tri_uv = plane_grid(4)[3]
+	tri_uv = np.concatenate((tri_uv, tri_uv + (2, 0), tri_uv * 0.5 + (1, 1), [[[0.9, 0.5], [1.1, 0.5], [1.0, 0.6]]]))
+	return tri_uv[np.random.RandomState(seed).permutation(len(tri_uv))]
+
+def test_tiles_without_unique_axis(old_numpy) :
+	tri_uv = tiled_uv()
+	tiles = TiledUVGrid.tile_faces(tri_uv)
+	assert list(tiles.keys()) == [(0, 0), (1, 0), (1, 1), (2, 0)]
+	#Reference: faces overlapping the unit square of each tile
+	(low, high) = (tri_uv.min(axis = 1), tri_uv.max(axis = 1))
+	for ((u, v), faces) in tiles.items() :
+		overlap = (low[:,0] < u + 1) & (high[:,0] > u) & (low[:,1] < v + 1) & (high[:,1] > v)
+		assert np.array_equal(faces, np.flatnonzero(overlap))
+
+def test_tile_groups_without_isin(old_numpy) :
+	grid = uv_index_from_tri_uv(tiled_uv())
+	points = np.random.RandomState(1).random_sample((300, 2)) * 4 - 0.5
+	groups = grid.tile_groups(points, True)
+	tiles = sorted(grid.tiles.keys())
+	found = np.concatenate([idx for (g, idx) in groups])
+	#Every point is grouped once, points in empty tiles with the closest occupied tile
+	assert np.array_equal(np.sort(found), np.arange(len(points)))
+	for (g, idx) in groups :
+		tile = [key for key in tiles if grid.grids.get(key) is g][0]
+		offset = np.maximum(np.maximum(np.array(tiles)[None] - points[idx,None], points[idx,None] - (np.array(tiles)[None] + 1)), 0)
+		closest = np.einsum('ijk,ijk->ij', offset, offset).min(axis = 1)
+		own = np.maximum(np.maximum(tile - points[idx], points[idx] - (np.array(tile) + 1)), 0)
+		assert np.allclose(np.einsum('ij,ij->i', own, own), closest)
+	assert len(grid.tile_groups(points[:0])) == 0
+
+def test_rebin_without_isin(old_numpy) :
+	tri_uv = plane_grid(8)[3]
+	grid = UVGrid.from_tri_uv(tri_uv, 2)
+	changed = np.array([3, 40, 41])
+	tri_uv = tri_uv.copy()
+	tri_uv[changed] = tri_uv[changed].mean(axis = 1)[:,None] + (tri_uv[changed] - tri_uv[changed].mean(axis = 1)[:,None]) * 0.5
+	rebinned = grid.rebin(tri_uv, changed)
+	rebuilt = UVGrid.from_tri_uv(tri_uv, 2)
+	points = np.random.RandomState(2).random_sample((400, 2))
+	for (a, b) in zip(rebinned.trace_points_uv(points), rebuilt.trace_points_uv(points)) :
+		assert np.allclose(a, b)
+	assert np.array_equal(rebinned.cell_count(), rebuilt.cell_count())
@@ -0,0 +1,140 @@
+#  test_uv_project.py (c) 2016 Mattias Fredriksson
+#
+# ##### BEGIN GPL LICENSE BLOCK #####
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+# ##### END GPL LICENSE BLOCK #####
+
+#Confirm and redo of the interactive uv projection operator on headless projection data.
+
+import types
+import numpy as np
+import pytest
+
+from headless_projection import projection_data, source_data
+
+class Area :
+	"""
+	Stand-in of the 3D view area the modal operator draws the header in.
+	"""
+	type = 'VIEW_3D'
+	def __init__(self) :
+		self.header = None
+	def header_text_set(self, text = None) :
+		self.header = text
+	def tag_redraw(self) :
+		pass
+
+def property_defaults(op_type) :
+	"""
+	Default values of the properties declared on the operator and the property mixin (annotations in 2.8).
+	"""
+	values = {}
+	for cls in reversed(op_type.__mro__) :
+		for (name, prop) in cls.__dict__.get('__annotations__', {}).items() :
+			(function, keywords) = prop
+			values[name] = keywords['default'] if 'default' in keywords else keywords['items'][0][0]
+	return values
+
+@pytest.fixture
+def modal(blender, monkeypatch) :
+	"""
+	Modal operator running on projection data of a single source, meshes written by the projection are recorded.
+	"""
+	lazy_ops = blender.module('lazy_ops')
+	proj_data = blender.module('proj_data')
+	op_type = lazy_ops.MESH_OT_UVProjectMeshModal
+	lazy_ops.load_implementation(op_type)
+	op = op_type()
+	for (name, value) in property_defaults(op_type).items() :
+		setattr(op, name, value)
+	op.printExecTime = False
+	written = {}
+	def set_coords(co, select, object_name, matrix = None) :
+		written[object_name] = co.copy()
+		return types.SimpleNamespace(name = object_name)
+	monkeypatch.setattr(proj_data, 'setNamedMeshCoords', set_coords)
+	#State set up by invoke() from the 3D view:
+	op.projData = projection_data(proj_data, 1, 500, warning = op)
+	op.update_setting()
+	op.restore = []
+	op.mode = 'MOVE'
+	op.preview = []
+	op.batch = None
+	op.pending = False
+	op.timer = None
+	op.draw_handle = blender.bpy().types.SpaceView3D.draw_handler_add(None, (op,), 'WINDOW', 'POST_VIEW')
+	context = types.SimpleNamespace(area = Area(), window_manager = types.SimpleNamespace(event_timer_remove = lambda timer : None),
+		scene = None, selected_objects = [])
+	return (op, context, written, proj_data)
+
+def event(type, value = 'PRESS') :
+	return types.SimpleNamespace(type = type, value = value)
+
+def test_confirm_then_redo(blender, modal) :
+	(op, context, written, proj_data) = modal
+	assert op.modal(context, event('RET')) == {'FINISHED'}
+	assert blender.bpy().types.SpaceView3D.handlers == []
+	confirmed = written['Source0']
+	#The redo panel executes the operator again with the changed properties:
+	op.moveXY = (0.1, -0.05)
+	op.rotation = 10
+	assert op.execute(context) == {'FINISHED'}
+	redone = written['Source0']
+	data = projection_data(proj_data, 1, 500)
+	expected = data.projectSources(op.setting)[0][0]
+	assert not np.allclose(redone, confirmed)
+	assert np.allclose(redone, expected)
+	#Redo again, back to the confirmed placement:
+	op.moveXY = (0.0, 0.0)
+	op.rotation = 0
+	assert op.execute(context) == {'FINISHED'}
+	assert np.allclose(written['Source0'], confirmed)
+
+def test_redo_alignment_uses_target(modal, monkeypatch) :
+	#Changing the alignment regenerates the source data, the target data must still be available
+	(op, context, written, proj_data) = modal
+	op.modal(context, event('LEFTMOUSE'))
+	calls = []
+	def generate_source(ob_list, scene, setting) :
+		calls.append(op.projData.bvh)
+		op.projData.meshList = [source_data(proj_data, 'Source0', 500, 0)]
+	monkeypatch.setattr(op.projData, 'generateSourceData', generate_source)
+	op.proj_type = 'CAMERA'
+	assert op.execute(context) == {'FINISHED'}
+	assert len(calls) == 1 and calls[0] is not None
+
+def test_cancel_releases_data(blender, modal) :
+	(op, context, written, proj_data) = modal
+	assert op.modal(context, event('ESC')) == {'CANCELLED'}
+	assert op.projData.meshList == [] and op.projData.target is None
+	assert blender.bpy().types.SpaceView3D.handlers == []
+
+def test_execute_released_data_cancels(blender, modal) :
+	#The non modal implementation can't gather the data again, executing on released data is reported and cancelled
+	(op, context, written, proj_data) = modal
+	op.projData.free()
+	op.reports = []
+	assert blender.module('uv_project').MESH_OT_UVProjectMesh.execute(op, context) == {'CANCELLED'}
+	assert [type for (type, message) in op.reports] == [{'ERROR'}]
+	assert written == {}
+
+def test_redo_released_data_gathers_again(modal, monkeypatch) :
+	#Repeating the modal operator after the data was released gathers the data again instead of projecting nothing
+	(op, context, written, proj_data) = modal
+	assert op.modal(context, event('ESC')) == {'CANCELLED'}
+	monkeypatch.setattr(op, 'gatherData', lambda context : setattr(op, 'projData', projection_data(proj_data, 1, 500, warning = op)) or True, raising = False)
+	assert op.execute(context) == {'FINISHED'}
+	assert 'Source0' in written